@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-record scoring with RecordScorer vs. a one-row DataFrame.
+
+A plan with univariate removal steps on every column and one Mahalanobis
+step is fitted on synthetic data; then one record at a time is scored with
+``RecordScorer.score`` and, for comparison, with ``plan.outlier_mask`` on a
+one-row DataFrame. Reports median and 99th percentile latency per record.
+
+Usage:
+    python benchmarks/bench_scoring.py --cols 10 --records 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from statclean import CleaningPlan  # noqa: E402
+
+
+def latencies(function, records) -> np.ndarray:
+    """Per-call wall times in microseconds."""
+    timings = np.empty(len(records))
+    for position, record in enumerate(records):
+        start = time.perf_counter()
+        function(record)
+        timings[position] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000, help='Reference rows used to fit the plan')
+    parser.add_argument('--cols', type=int, default=10)
+    parser.add_argument('--mahalanobis-cols', type=int, default=3)
+    parser.add_argument('--records', type=int, default=20_000)
+    parser.add_argument('--frame-records', type=int, default=500,
+                        help='Records scored through the (slow) one-row DataFrame path')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    columns = [f'x{i}' for i in range(args.cols)]
+    df = pd.DataFrame(rng.standard_t(5, size=(args.rows, args.cols)), columns=columns)
+    methods = ['remove_outliers_iqr', 'remove_outliers_zscore', 'remove_outliers_modified_zscore']
+    steps = [{'method': methods[i % len(methods)], 'column': column} for i, column in enumerate(columns)]
+    steps.append({'method': 'remove_outliers_mahalanobis', 'columns': columns[:args.mahalanobis_cols]})
+    plan = CleaningPlan.fit(df, steps)
+    scorer = plan.scorer()
+
+    sample = df.sample(args.records, replace=True, random_state=1)
+    dict_records = sample.to_dict('records')
+    array_records = list(sample[scorer.columns].to_numpy())
+    frame_records = [sample.iloc[[i]] for i in range(min(args.frame_records, args.records))]
+
+    results = {
+        'score(dict)': latencies(scorer.score, dict_records),
+        'score(array)': latencies(scorer.score, array_records),
+        'one-row DataFrame': latencies(plan.outlier_mask, frame_records),
+    }
+    print(f"cols={args.cols} mahalanobis_cols={args.mahalanobis_cols} steps={len(steps)}")
+    for name, timings in results.items():
+        print(f"{name:18s}: p50 {np.percentile(timings, 50):9.1f} us   p99 {np.percentile(timings, 99):9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
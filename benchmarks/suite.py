@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every StatClean detector and treatment over synthetic data.
+
+Cases cover the IQR, Z-score, Modified Z-score and Mahalanobis (sample and
+robust MCD covariance) detectors,
+Grubbs' test, Dixon's Q-test (per 20-row group, the test's intended sample
+size), removal, winsorizing, the Box-Cox/log/square-root transforms,
+``clean_columns(method='auto')``, ``compare_methods`` and a removal chain
+(two IQR and Modified Z-score passes over every column, with and without
+``incremental=True``). Each runs on
+normal, skewed (lognormal) and heavy-tailed (Student t, 2 df) data for a
+grid of row and column counts. Single-column methods use the first column;
+multi-column methods use all columns.
+
+For every (case, distribution, rows, cols) the suite records the best wall
+time over ``--repeat`` runs and the peak traced memory of one extra run
+(``tracemalloc``), writes them to JSON, and with ``--baseline`` compares
+against a previous result file, listing regressions and exiting with
+status 1 if there are any.
+
+Usage:
+    python benchmarks/suite.py --preset quick --output results.json
+    python benchmarks/suite.py --preset full --max-cells 1e8 --output full.json
+    python benchmarks/suite.py --rows 1e6 --cols 10 --cases remove_iqr,winsorize_iqr \\
+        --baseline results.json --tolerance 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import statclean  # noqa: E402
+from statclean import StatClean  # noqa: E402
+
+
+PRESETS = {
+    'quick': {'rows': [1_000, 100_000], 'cols': [1, 10]},
+    'full': {'rows': [1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000],
+             'cols': [1, 10, 100, 1000]},
+}
+
+DISTRIBUTIONS = ('normal', 'skewed', 'heavy_tailed')
+
+# Rows per group for the grouped Dixon case
+DIXON_GROUP_SIZE = 20
+
+
+def make_data(distribution: str, rows: int, cols: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic float64 frame with a few injected extreme values per column."""
+    rng = np.random.default_rng(seed)
+    if distribution == 'normal':
+        values = rng.normal(0.0, 1.0, size=(rows, cols))
+    elif distribution == 'skewed':
+        values = rng.lognormal(0.0, 1.0, size=(rows, cols))
+    elif distribution == 'heavy_tailed':
+        values = rng.standard_t(2, size=(rows, cols))
+    else:
+        raise ValueError(f"Unknown distribution '{distribution}'. Available: {', '.join(DISTRIBUTIONS)}")
+    n_extreme = max(1, rows // 1000)
+    values[rng.integers(0, rows, n_extreme), rng.integers(0, cols, n_extreme)] *= 25
+    return pd.DataFrame(values, columns=[f'x{i}' for i in range(cols)])
+
+
+def cleaner_for(df: pd.DataFrame) -> StatClean:
+    return StatClean(df, copy=False)
+
+
+def incremental_cleaner(df: pd.DataFrame) -> StatClean:
+    return StatClean(df, copy=False, incremental=True)
+
+
+def removal_chain(cleaner: StatClean) -> None:
+    for _ in range(2):
+        for column in cleaner._numeric_columns():
+            cleaner.remove_outliers_iqr(column).remove_outliers_modified_zscore(column)
+
+
+def grouped_cleaner(df: pd.DataFrame) -> StatClean:
+    grouped = df[['x0']].assign(group=np.arange(len(df)) // DIXON_GROUP_SIZE)
+    return StatClean(grouped, copy=False)
+
+
+# name -> (setup(df) -> state, run(state), minimum columns)
+CASES: Dict[str, Tuple[Callable[[pd.DataFrame], Any], Callable[[Any], Any], int]] = {
+    'detect_iqr': (cleaner_for, lambda c: c.detect_outliers_iqr('x0'), 1),
+    'detect_zscore': (cleaner_for, lambda c: c.detect_outliers_zscore('x0'), 1),
+    'detect_modified_zscore': (cleaner_for, lambda c: c.detect_outliers_modified_zscore('x0'), 1),
+    'detect_mahalanobis': (cleaner_for, lambda c: c.detect_outliers_mahalanobis(), 2),
+    'detect_mahalanobis_robust': (cleaner_for, lambda c: c.detect_outliers_mahalanobis(robust=True), 2),
+    'grubbs': (cleaner_for, lambda c: c.grubbs_test('x0'), 1),
+    'dixon_grouped': (grouped_cleaner, lambda c: c.grouped_outlier_tests('x0', by='group', tests=['dixon']), 1),
+    'remove_iqr': (cleaner_for, lambda c: c.remove_outliers_iqr('x0'), 1),
+    'remove_zscore': (cleaner_for, lambda c: c.remove_outliers_zscore('x0'), 1),
+    'remove_modified_zscore': (cleaner_for, lambda c: c.remove_outliers_modified_zscore('x0'), 1),
+    'remove_mahalanobis': (cleaner_for, lambda c: c.remove_outliers_mahalanobis(), 2),
+    'winsorize_iqr': (cleaner_for, lambda c: c.winsorize_outliers_iqr('x0'), 1),
+    'winsorize_zscore': (cleaner_for, lambda c: c.winsorize_outliers_zscore('x0'), 1),
+    'winsorize_percentile': (cleaner_for, lambda c: c.winsorize_outliers_percentile('x0'), 1),
+    'transform_boxcox': (cleaner_for, lambda c: c.transform_boxcox('x0'), 1),
+    'transform_log': (cleaner_for, lambda c: c.transform_log('x0'), 1),
+    'transform_sqrt': (cleaner_for, lambda c: c.transform_sqrt('x0'), 1),
+    'clean_columns_auto': (cleaner_for, lambda c: c.clean_columns(method='auto', show_progress=False,
+                                                                   random_state=0), 1),
+    'compare_methods': (cleaner_for, lambda c: c.compare_methods(), 1),
+    'removal_chain': (lambda df: StatClean(df, copy=False, deferred=True), removal_chain, 1),
+    'removal_chain_incremental': (incremental_cleaner, removal_chain, 1),
+}
+
+
+def measure(setup: Callable, run: Callable, df: pd.DataFrame, repeat: int,
+            track_memory: bool) -> Dict[str, Optional[float]]:
+    """Best wall time over ``repeat`` runs and peak traced memory of one run."""
+    timings = []
+    with warnings.catch_warnings(), contextlib.redirect_stdout(io.StringIO()):
+        warnings.simplefilter('ignore')
+        for _ in range(repeat):
+            state = setup(df)
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start)
+
+        peak_mb = None
+        if track_memory:
+            state = setup(df)
+            tracemalloc.start()
+            try:
+                run(state)
+                peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            finally:
+                tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_mb': peak_mb}
+
+
+def run_suite(rows: List[int], cols: List[int], distributions: List[str], cases: List[str],
+              repeat: int = 3, track_memory: bool = True, max_cells: float = 1e8,
+              log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """Run the selected cases over the size grid and return one record per measurement."""
+    results = []
+    for n_rows in rows:
+        for n_cols in cols:
+            if n_rows * n_cols > max_cells:
+                log(f"skip rows={n_rows} cols={n_cols}: more than --max-cells={max_cells:g}")
+                continue
+            for distribution in distributions:
+                df = make_data(distribution, n_rows, n_cols)
+                for name in cases:
+                    setup, run, min_cols = CASES[name]
+                    if n_cols < min_cols:
+                        continue
+                    measured = measure(setup, run, df, repeat, track_memory)
+                    results.append({'case': name, 'distribution': distribution,
+                                    'rows': n_rows, 'cols': n_cols, **measured})
+                    memory = '' if measured['peak_mb'] is None else f"  {measured['peak_mb']:10.1f} MB"
+                    log(f"{name:24s} {distribution:13s} rows={n_rows:<10d} cols={n_cols:<5d}"
+                        f" {measured['seconds'] * 1e3:11.2f} ms{memory}")
+                del df
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'statclean': statclean.__version__,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float,
+            min_seconds: float) -> List[Dict[str, Any]]:
+    """
+    Measurements slower (or using more memory) than the baseline by more than ``tolerance``.
+
+    Timings where both runs take less than ``min_seconds`` are ignored as noise.
+    """
+    def key(record):
+        return record['case'], record['distribution'], record['rows'], record['cols']
+
+    reference = {key(record): record for record in baseline}
+    regressions = []
+    for record in results:
+        previous = reference.get(key(record))
+        if previous is None:
+            continue
+        if max(record['seconds'], previous['seconds']) >= min_seconds and \
+                record['seconds'] > previous['seconds'] * (1 + tolerance):
+            regressions.append({**record, 'metric': 'seconds', 'baseline': previous['seconds'],
+                                'ratio': record['seconds'] / previous['seconds']})
+        if record.get('peak_mb') and previous.get('peak_mb') and \
+                record['peak_mb'] > previous['peak_mb'] * (1 + tolerance) and \
+                record['peak_mb'] - previous['peak_mb'] > 1.0:
+            regressions.append({**record, 'metric': 'peak_mb', 'baseline': previous['peak_mb'],
+                                'ratio': record['peak_mb'] / previous['peak_mb']})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick',
+                        help='Row/column grid; --rows/--cols override it')
+    parser.add_argument('--rows', type=lambda text: [int(float(v)) for v in text.split(',')], default=None,
+                        help='Comma-separated row counts, e.g. 1e3,1e6')
+    parser.add_argument('--cols', type=lambda text: [int(v) for v in text.split(',')], default=None,
+                        help='Comma-separated column counts, e.g. 1,10,100')
+    parser.add_argument('--distributions', default=','.join(DISTRIBUTIONS))
+    parser.add_argument('--cases', default=','.join(CASES), help='Comma-separated case names')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak-memory run')
+    parser.add_argument('--max-cells', type=float, default=1e8,
+                        help='Skip grid points with rows * cols above this (memory guard)')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=None, help='Previous result file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown / memory growth before flagging a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help='Ignore timing changes when both runs are faster than this')
+    args = parser.parse_args()
+
+    cases = args.cases.split(',')
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s) {unknown}; available: {', '.join(CASES)}")
+    distributions = args.distributions.split(',')
+    unknown = [name for name in distributions if name not in DISTRIBUTIONS]
+    if unknown:
+        parser.error(f"unknown distribution(s) {unknown}; available: {', '.join(DISTRIBUTIONS)}")
+
+    rows = args.rows or PRESETS[args.preset]['rows']
+    cols = args.cols or PRESETS[args.preset]['cols']
+    results = run_suite(rows, cols, distributions, cases, repeat=args.repeat,
+                        track_memory=not args.no_memory, max_cells=args.max_cells)
+
+    with open(args.output, 'w') as handle:
+        json.dump({'environment': environment(), 'results': results}, handle, indent=1)
+    print(f"wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline['results'], args.tolerance, args.min_seconds)
+        if baseline['environment'].get('platform') != environment()['platform']:
+            print("note: baseline was recorded on a different platform")
+        for record in regressions:
+            print(f"REGRESSION {record['case']} {record['distribution']} rows={record['rows']} "
+                  f"cols={record['cols']} {record['metric']}: {record['baseline']:.4g} -> "
+                  f"{record[record['metric']]:.4g} ({record['ratio']:.2f}x)")
+        print(f"{len(regressions)} regression(s) against {args.baseline} (tolerance {args.tolerance:.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,17 @@ StatClean - A comprehensive statistical data preprocessing and outlier detection
 This package provides advanced statistical methods for data cleaning including:
 - Formal statistical testing (Grubbs' test, Dixon's Q-test)
 - Multiple outlier detection methods (IQR, Z-score, Modified Z-score, Mahalanobis)
+- Streaming detection with constant memory per column
+- Out-of-core cleaning of CSV/Parquet files larger than memory
+- Columnar NumPy engine for arrays and memory-mapped .npy files
+- Apache Arrow backend built on pyarrow.compute (optional)
+- Polars backend compiling cleaning strategies into lazy queries (optional)
 - Treatment options (removal, winsorizing, transformations)
+- Fitted cleaning plans that apply learned thresholds to new batches
+- Single-record scoring on fitted plans for request-time checks
 - Publication-quality reporting with p-values and effect sizes
 - Method chaining for streamlined workflows
+- Instrumentation events (timing, row counts, memory) from the public methods
 
 Designed for academic research, data science, and statistical analysis.
 """
@@ -15,9 +23,18 @@ __version__ = '0.1.3'
 __author__ = 'Subashanan Nair'
 
 from .cleaner import StatClean
+from .engine import ArrayEngine
+from .arrow import ArrowEngine
+from .polars import PolarsEngine
+from .plan import CleaningPlan
+from .scoring import RecordScorer
+from .instrumentation import EventRecorder
+from .sketches import KLLSketch
+from .streaming import StreamingDetector
+from .outofcore import clean_file
 from .utils import plot_outliers, plot_distribution, plot_boxplot, plot_qq, plot_outlier_analysis
 
 # Backwards compatibility alias (to be removed in future versions)
 OutlierCleaner = StatClean
 
-__all__ = ['StatClean', 'OutlierCleaner', 'plot_outliers', 'plot_distribution', 'plot_boxplot', 'plot_qq', 'plot_outlier_analysis']
\ No newline at end of file
+__all__ = ['StatClean', 'OutlierCleaner', 'StreamingDetector', 'KLLSketch', 'ArrayEngine', 'ArrowEngine', 'PolarsEngine', 'CleaningPlan', 'RecordScorer', 'EventRecorder', 'clean_file', 'plot_outliers', 'plot_distribution', 'plot_boxplot', 'plot_qq', 'plot_outlier_analysis']
\ No newline at end of file
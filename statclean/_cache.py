@@ -0,0 +1,93 @@
+"""
+Versioned per-column statistics cache used by ``StatClean``.
+
+Every state of a column is identified by a version token: StatClean draws a
+new row version whenever rows are removed or the frame is replaced, and a
+new column version whenever a winsorize or transform rewrites the column.
+Cache keys include both tokens, so a statistic computed before a mutation
+can never be returned after it; stale entries are simply never hit again
+and age out of the size-bounded LRU.
+
+Tokens come from one process-wide counter rather than per-instance
+counters, so snapshots made for ``n_jobs`` workers (which share the cache
+with the instance they were copied from) cannot produce the same token for
+different data.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+_tokens = itertools.count(1)
+
+
+def new_version() -> int:
+    """Draw a fresh version token (unique within the process)."""
+    return next(_tokens)
+
+
+class StatisticsCache:
+    """
+    Thread-safe LRU mapping of statistic keys to computed results.
+
+    Parameters:
+    -----------
+    maxsize : int
+        Maximum number of entries kept; 0 disables caching
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size must be a non-negative integer")
+        self.maxsize = int(maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached result for ``key`` (marked as recently used), or ``default``."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used entries beyond ``maxsize``."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Cached result for ``key``, computing and storing it on a miss.
+
+        The computation runs outside the lock; concurrent misses on the same
+        key may both compute, which is harmless since results are equal.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size, like ``functools.lru_cache``'s ``cache_info``."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
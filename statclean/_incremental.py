@@ -0,0 +1,322 @@
+"""
+Per-column sufficient statistics maintained under row removal.
+
+``SortedColumnStatistics`` sorts a column once and then keeps, as rows are
+removed:
+
+- shifted sums and sums of squares of the remaining values (mean and
+  standard deviation in O(1));
+- the sorted order with a Fenwick (binary indexed) tree counting the
+  remaining values, so the r-th smallest remaining value is found in
+  O(log n) steps. Quantiles and the median take O(log n), the MAD
+  O(log^2 n) (k-th element of the two sorted runs of deviations).
+
+Removing k rows updates both in O(k log n), instead of rescanning the n
+remaining values. Removals are queued and applied together when a
+statistic is next read, so a chain of removals driven by other columns
+costs one batched update. Quantiles, medians and MADs are exact and evaluated like
+``_kernels.column_statistics`` (so like pandas/SciPy); means and standard
+deviations agree with a recomputation up to floating-point rounding, and
+the sums are re-based on the remaining values when cancellation could make
+them inaccurate.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._kernels import _lerp
+
+# Re-base the sums when the remaining sum of squares falls below this
+# fraction of the one they were accumulated from
+_REBASE_RATIO = 1e-6
+
+# Rebuild the Fenwick tree in O(n) instead of k point updates when
+# k * log2(n) * _REBUILD_FACTOR > n (point updates are scattered writes)
+_REBUILD_FACTOR = 8
+
+
+def _lowbit(i: np.ndarray) -> np.ndarray:
+    return i & -i
+
+
+def _build_tree(counts: np.ndarray, dtype: type) -> np.ndarray:
+    """
+    Fenwick tree (1-based, ``tree[0]`` unused) over ``counts`` in O(n).
+
+    Level by level: every node whose lowest set bit is ``step`` is complete
+    once the smaller levels are done, and is added to its parent
+    ``i + step``. Both are strided slices, so each level is one vector add.
+    """
+    n = len(counts)
+    tree = np.zeros(n + 1, dtype=dtype)
+    tree[1:] = counts
+    step = 1
+    while 2 * step <= n:
+        parents = tree[2 * step::2 * step]
+        parents += tree[step::2 * step][:len(parents)]
+        step *= 2
+    return tree
+
+
+class SortedColumnStatistics:
+    """
+    Sorted order and running moments of one column under row removal.
+
+    Rows are identified by their physical position in the column the
+    instance was built from.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        1D float column (NaN for missing values)
+    alive : numpy.ndarray, optional
+        Boolean mask of the rows still present; others start removed
+    """
+
+    def __init__(self, values: np.ndarray, alive: Optional[np.ndarray] = None) -> None:
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        index_dtype = np.int32 if n < 2 ** 31 - 1 else np.int64
+        # NaN sorts last, so the first n_valid sorted positions hold the values
+        order = np.argsort(values).astype(index_dtype, copy=False)
+        rank = np.empty(n, dtype=index_dtype)
+        rank[order] = np.arange(n, dtype=index_dtype)
+        self.sorted_values = values[order]
+        self.order = order
+        self.rank = rank
+        self.n_valid = n - int(np.isnan(values).sum())
+        self.alive = np.ones(n, dtype=bool) if alive is None else np.asarray(alive, dtype=bool)[order]
+        self._tree = _build_tree(self.alive[:self.n_valid], index_dtype)
+        self._pending: List[np.ndarray] = []
+        self._rebase()
+
+    # Moments
+    def _rebase(self) -> None:
+        """Recompute the shifted sums from the remaining values."""
+        remaining = self.sorted_values[:self.n_valid][self.alive[:self.n_valid]]
+        self.count = len(remaining)
+        self.nan_count = int(self.alive[self.n_valid:].sum())
+        self._shift = float(remaining.mean()) if self.count else 0.0
+        centered = remaining - self._shift
+        self._sum = float(centered.sum())
+        self._sum_squares = float(np.dot(centered, centered))
+        self._base_squares = self._sum_squares
+
+    def mean_std(self) -> Tuple[float, float]:
+        """Mean and standard deviation (ddof=1) of the remaining non-missing values."""
+        self.flush()
+        if self.count == 0:
+            return np.nan, np.nan
+        mean = self._shift + self._sum / self.count
+        if self.count == 1:
+            return mean, np.nan
+        variance = (self._sum_squares - self._sum * self._sum / self.count) / (self.count - 1)
+        return mean, float(np.sqrt(max(variance, 0.0)))
+
+    # Order statistics
+    def _select(self, r: int) -> int:
+        """Sorted position of the r-th (0-based) remaining non-missing value."""
+        tree = self._tree
+        position, remaining = 0, r + 1
+        step = 1 << (self.n_valid.bit_length() - 1) if self.n_valid else 0
+        while step:
+            following = position + step
+            if following <= self.n_valid and tree[following] < remaining:
+                position = following
+                remaining -= int(tree[following])
+            step >>= 1
+        return position
+
+    def _value(self, r: int) -> float:
+        return float(self.sorted_values[self._select(r)])
+
+    def _count_below(self, position: int) -> int:
+        """Remaining non-missing values at sorted positions before ``position``."""
+        tree = self._tree
+        total = 0
+        while position > 0:
+            total += int(tree[position])
+            position -= position & -position
+        return total
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Linear-interpolation quantiles of the remaining values (like ``Series.quantile``)."""
+        self.flush()
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        last = self.count - 1
+        results = []
+        for q in qs:
+            virtual = last * q
+            previous = int(np.floor(virtual))
+            gamma = virtual - previous
+            previous = min(max(previous, 0), last)
+            following = min(previous + 1, last)
+            results.append(_lerp(np.float64(self._value(previous)),
+                                 np.float64(self._value(following)), gamma))
+        return np.array(results, dtype=float)
+
+    def median(self) -> float:
+        self.flush()
+        if self.count == 0:
+            return np.nan
+        upper = self._value(self.count // 2)
+        if self.count % 2 == 1:
+            return upper
+        return (self._value((self.count - 1) // 2) + upper) / 2
+
+    def _kth_deviation(self, center: float, split: int, k: int) -> float:
+        """k-th smallest |x - center|; ``split`` values lie below the center."""
+        below, above = split, self.count - split
+
+        def lower_run(i):
+            return center - self._value(split - 1 - i)
+
+        def upper_run(j):
+            return self._value(split + j) - center
+
+        lo, hi = max(0, k + 1 - above), min(below, k + 1)
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if upper_run(k - middle) > lower_run(middle):
+                lo = middle + 1
+            else:
+                hi = middle
+        from_lower = lower_run(lo - 1) if lo > 0 else -np.inf
+        from_upper = upper_run(k - lo) if k + 1 - lo > 0 else -np.inf
+        return max(from_lower, from_upper)
+
+    def median_mad(self) -> Tuple[float, float]:
+        """
+        Median and MAD of the remaining values.
+
+        Like ``scipy.stats.median_abs_deviation``, the MAD is NaN when any
+        remaining value is missing.
+        """
+        median = self.median()
+        if self.count == 0 or self.nan_count:
+            return median, np.nan
+        split = self._count_below(int(np.searchsorted(self.sorted_values[:self.n_valid], median, 'left')))
+        upper = self._kth_deviation(median, split, self.count // 2)
+        if self.count % 2 == 1:
+            return median, upper
+        return median, (self._kth_deviation(median, split, (self.count - 1) // 2) + upper) / 2
+
+    def tail_positions(self, lower: float, upper: float) -> np.ndarray:
+        """
+        Physical positions of remaining values below ``lower`` or above ``upper``.
+
+        Only the sorted tails outside the interval are read. A NaN bound
+        flags nothing on its side, as a comparison with NaN would.
+        """
+        self.flush()
+        lower = -np.inf if np.isnan(lower) else lower
+        upper = np.inf if np.isnan(upper) else upper
+        valid = self.sorted_values[:self.n_valid]
+        start = int(np.searchsorted(valid, lower, 'left'))
+        stop = int(np.searchsorted(valid, upper, 'right'))
+        tails = np.r_[np.arange(start), np.arange(stop, self.n_valid)]
+        return self.order[tails[self.alive[tails]]]
+
+    def score_positions(self, center: float, scale: float, threshold: float,
+                        factor: Optional[float] = None) -> np.ndarray:
+        """
+        Physical positions of remaining values with ``|factor * (x - center) / scale| > threshold``.
+
+        Candidates are read from the sorted tails outside slightly narrowed
+        bounds and confirmed with the score comparison itself, so results
+        equal a comparison over the whole column. Nothing is flagged when
+        ``scale`` is zero or NaN.
+        """
+        if not scale > 0:
+            return np.empty(0, dtype=self.order.dtype)
+        half_width = threshold * scale / (factor or 1.0)
+        margin = 1e-9 * (abs(center) + half_width)
+        positions = self.tail_positions(min(center - half_width + margin, center),
+                                        max(center + half_width - margin, center))
+        values = self.values_at(positions)
+        scores = (values - center) / scale if factor is None else factor * (values - center) / scale
+        return positions[np.abs(scores) > threshold]
+
+    def values_at(self, positions: np.ndarray) -> np.ndarray:
+        """Values of rows by physical position."""
+        return self.sorted_values[self.rank[positions]]
+
+    # Updates
+    def remove(self, positions: np.ndarray) -> None:
+        """Remove rows by physical position (rows already removed are ignored)."""
+        self._pending.append(np.asarray(positions, dtype=np.intp))
+
+    def flush(self) -> None:
+        """Apply the queued removals."""
+        if not self._pending:
+            return
+        positions = self._pending[0] if len(self._pending) == 1 else np.concatenate(self._pending)
+        self._pending = []
+        ranks = np.unique(self.rank[positions])
+        ranks = ranks[self.alive[ranks]]
+        if len(ranks) == 0:
+            return
+        self.alive[ranks] = False
+        valid = ranks[ranks < self.n_valid]
+        self.nan_count -= len(ranks) - len(valid)
+        if len(valid) == 0:
+            return
+
+        self.count -= len(valid)
+        centered = self.sorted_values[valid] - self._shift
+        self._sum -= float(centered.sum())
+        self._sum_squares -= float(np.dot(centered, centered))
+        if self._sum_squares < self._base_squares * _REBASE_RATIO:
+            self._rebase()
+
+        n = self.n_valid
+        if len(valid) * max(n.bit_length(), 1) * _REBUILD_FACTOR > n:
+            self._tree = _build_tree(self.alive[:n], self._tree.dtype)
+            return
+        index = valid.astype(np.int64) + 1
+        while len(index):
+            np.subtract.at(self._tree, index, 1)
+            index = index + _lowbit(index)
+            index = index[index <= n]
+
+    def compact(self, alive: np.ndarray) -> 'SortedColumnStatistics':
+        """
+        Statistics over the remaining rows only, renumbered 0..m-1 in physical order.
+
+        ``alive`` is the mask of remaining rows (consistent with the removals
+        applied so far). Runs in O(n) without sorting again.
+        """
+        self.flush()
+        alive = np.asarray(alive, dtype=bool)
+        compacted = object.__new__(SortedColumnStatistics)
+        keep = self.alive
+        new_positions = np.cumsum(alive) - 1
+        order = new_positions[self.order[keep]].astype(self.order.dtype, copy=False)
+        rank = np.empty(len(order), dtype=order.dtype)
+        rank[order] = np.arange(len(order), dtype=order.dtype)
+        compacted.sorted_values = self.sorted_values[keep]
+        compacted.order = order
+        compacted.rank = rank
+        compacted.n_valid = self.count
+        compacted.alive = np.ones(len(order), dtype=bool)
+        compacted._tree = _build_tree(compacted.alive[:self.count], self._tree.dtype)
+        compacted.count = self.count
+        compacted.nan_count = self.nan_count
+        compacted._shift = self._shift
+        compacted._sum = self._sum
+        compacted._sum_squares = self._sum_squares
+        compacted._base_squares = self._base_squares
+        compacted._pending = []
+        return compacted
+
+    def copy(self) -> 'SortedColumnStatistics':
+        """Copy whose removals do not affect this instance."""
+        self.flush()
+        duplicate = object.__new__(SortedColumnStatistics)
+        duplicate.__dict__.update(self.__dict__)
+        duplicate._pending = []
+        duplicate.alive = self.alive.copy()
+        duplicate._tree = self._tree.copy()
+        return duplicate
@@ -0,0 +1,605 @@
+"""
+Vectorized numerical kernels shared by the StatClean detectors.
+
+These helpers operate on plain NumPy arrays so that the pandas-facing code in
+``cleaner.py`` only has to extract column buffers once and can then run a
+handful of array kernels instead of per-row Python callbacks.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import warnings
+import numpy as np
+from scipy.linalg import cholesky, solve_triangular
+from scipy.stats import t
+
+
+# Rows per block for the Mahalanobis kernel. Temporaries are bounded by
+# chunk_size * n_features floats rather than n_samples * n_features.
+DEFAULT_CHUNK_SIZE = 65536
+
+# Dixon's Q-test critical values at the 5% significance level, keyed by n.
+DIXON_CRITICAL_VALUES = {
+    3: 0.970, 4: 0.829, 5: 0.710, 6: 0.625, 7: 0.568, 8: 0.526,
+    9: 0.493, 10: 0.466, 11: 0.444, 12: 0.426, 13: 0.410, 14: 0.396,
+    15: 0.384, 16: 0.374, 17: 0.365, 18: 0.356, 19: 0.349, 20: 0.342,
+    21: 0.337, 22: 0.331, 23: 0.326, 24: 0.321, 25: 0.317, 26: 0.312,
+    27: 0.308, 28: 0.305, 29: 0.301, 30: 0.290
+}
+
+
+def covariance_factor(cov: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Return the lower Cholesky factor of a covariance matrix.
+
+    Returns:
+    --------
+    numpy.ndarray or None
+        Lower-triangular factor ``L`` with ``cov = L @ L.T``, or None when
+        the matrix is not positive definite.
+    """
+    try:
+        return cholesky(np.asarray(cov, dtype=float), lower=True, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None
+
+
+def mahalanobis_squared(values: np.ndarray, mean: np.ndarray,
+                        factor: Optional[np.ndarray] = None,
+                        precision: Optional[np.ndarray] = None,
+                        chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Compute squared Mahalanobis distances for every row of ``values``.
+
+    Rows are processed in blocks of ``chunk_size``. When a Cholesky factor is
+    given, each block is centered and solved against it with one triangular
+    solve, so ``d^2 = ||L^{-1} (x - mean)||^2``. Otherwise ``precision`` (for
+    example a pseudoinverse) is applied with a row-wise quadratic form.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        2D array of shape (n_samples, n_features) without missing values
+    mean : numpy.ndarray
+        Location vector of length n_features
+    factor : numpy.ndarray, optional
+        Lower Cholesky factor of the covariance matrix
+    precision : numpy.ndarray, optional
+        Inverse (or pseudoinverse) covariance matrix, used when ``factor`` is None
+    chunk_size : int, optional
+        Number of rows per block. Defaults to ``DEFAULT_CHUNK_SIZE``.
+
+    Returns:
+    --------
+    numpy.ndarray
+        1D array of squared distances of length n_samples
+    """
+    if factor is None and precision is None:
+        raise ValueError("Either a Cholesky factor or a precision matrix is required")
+
+    values = np.asarray(values, dtype=float)
+    mean = np.asarray(mean, dtype=float)
+    n_samples = values.shape[0]
+    chunk_size = int(chunk_size or DEFAULT_CHUNK_SIZE)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+
+    out = np.empty(n_samples, dtype=float)
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        diff = values[start:stop] - mean
+        if factor is not None:
+            z = solve_triangular(factor, diff.T, lower=True, check_finite=False)
+            out[start:stop] = np.einsum('ij,ij->j', z, z)
+        else:
+            out[start:stop] = np.einsum('ij,ij->i', diff @ precision, diff)
+    return out
+
+
+def location_and_scatter(values: np.ndarray,
+                         chunk_size: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample mean vector and covariance matrix (ddof=1) of a complete-case 2D array.
+
+    The cross-products of the centered rows are accumulated over blocks of
+    ``chunk_size`` rows (default ``DEFAULT_CHUNK_SIZE``), so no centered copy
+    of the whole array is made.
+    """
+    values = np.asarray(values, dtype=float)
+    chunk_size = int(chunk_size or DEFAULT_CHUNK_SIZE)
+    n_samples, n_features = values.shape
+    mean = values.mean(axis=0)
+    cross = np.zeros((n_features, n_features))
+    for start in range(0, n_samples, chunk_size):
+        block = values[start:start + chunk_size] - mean
+        cross += block.T @ block
+    return mean, cross / (n_samples - 1)
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation evaluated the same way as ``numpy.quantile``."""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def sorted_quantile(ordered: np.ndarray, count: np.ndarray, q: float) -> np.ndarray:
+    """
+    Quantile of each column of a column-wise sorted block (linear interpolation).
+
+    ``ordered`` holds each column sorted ascending with missing values last, and
+    ``count`` the number of non-missing values per column. The result matches
+    ``numpy.quantile``/``Series.quantile`` on the non-missing values.
+    """
+    cols = np.arange(ordered.shape[1])
+    n = np.maximum(count, 1)
+    virtual = (n - 1) * q
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+    previous = np.clip(previous.astype(np.intp), 0, n - 1)
+    following = np.minimum(previous + 1, n - 1)
+    result = _lerp(ordered[previous, cols], ordered[following, cols], gamma)
+    return np.where(count > 0, result, np.nan)
+
+
+def sorted_median(ordered: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """Median of each column of a column-wise sorted block (see ``sorted_quantile``)."""
+    cols = np.arange(ordered.shape[1])
+    n = np.maximum(count, 1)
+    upper = ordered[n // 2, cols]
+    lower = ordered[(n - 1) // 2, cols]
+    result = np.where(n % 2 == 1, upper, (lower + upper) / 2)
+    return np.where(count > 0, result, np.nan)
+
+
+def _kth_abs_deviation(ordered: np.ndarray, count: np.ndarray, center: np.ndarray,
+                       split: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    k-th smallest (0-based) absolute deviation from ``center`` per sorted column.
+
+    The deviations of a sorted column form two sorted runs: ``center - x`` for
+    the values below the center (read right to left) and ``x - center`` for the
+    rest. The k-th element of their merge is found by a vectorized binary
+    search over how many elements come from the lower run, in O(log n) steps.
+    """
+    cols = np.arange(ordered.shape[1])
+    na = split
+    nb = count - split
+    last = np.maximum(count - 1, 0)
+
+    def lower_run(i):
+        return center - ordered[np.clip(split - 1 - i, 0, last), cols]
+
+    def upper_run(j):
+        return ordered[np.clip(split + j, 0, last), cols] - center
+
+    lo = np.maximum(0, k + 1 - nb)
+    hi = np.minimum(na, k + 1)
+    while True:
+        active = lo < hi
+        if not active.any():
+            break
+        mid = (lo + hi) // 2
+        # Take more from the lower run while its next element is still smaller
+        # than the upper-run element it would displace
+        more = active & (upper_run(k - mid) > lower_run(mid))
+        lo = np.where(more, mid + 1, lo)
+        hi = np.where(active & ~more, mid, hi)
+
+    i = lo
+    from_lower = np.where(i > 0, lower_run(i - 1), -np.inf)
+    from_upper = np.where(k + 1 - i > 0, upper_run(k - i), -np.inf)
+    return np.maximum(from_lower, from_upper)
+
+
+def column_statistics(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute the univariate detector statistics for every column of a 2D block.
+
+    The block is sorted once along axis 0; quartiles and medians are then read
+    off by index and MADs come from a binary search over the sorted deviations,
+    so every column is handled by the same few vectorized kernels. Results
+    follow the single-column conventions used by StatClean: quantiles and the
+    median skip NaN (like ``Series.quantile``/``Series.median``), the standard
+    deviation uses ``ddof=1`` and the MAD propagates NaN (like
+    ``scipy.stats.median_abs_deviation`` with its default ``nan_policy``).
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        2D float array of shape (n_samples, n_columns)
+
+    Returns:
+    --------
+    dict
+        Arrays of length n_columns keyed by 'count', 'mean', 'std', 'Q1',
+        'median', 'Q3', 'IQR' and 'mad'
+    """
+    values = np.asarray(values, dtype=float)
+    n_rows, n_columns = values.shape
+    if n_rows == 0:
+        empty = np.full(n_columns, np.nan)
+        return {'count': np.zeros(n_columns, dtype=np.intp), 'mean': empty, 'std': empty.copy(),
+                'Q1': empty.copy(), 'median': empty.copy(), 'Q3': empty.copy(),
+                'IQR': empty.copy(), 'mad': empty.copy()}
+
+    # Sorting along axis 0 is fastest on a column-major buffer; NaN sorts last
+    ordered = np.sort(np.asfortranarray(values), axis=0)
+    count = n_rows - np.isnan(ordered).sum(axis=0)
+
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+
+        q1 = sorted_quantile(ordered, count, 0.25)
+        q3 = sorted_quantile(ordered, count, 0.75)
+        median = sorted_median(ordered, count)
+
+        center = np.where(count > 0, median, 0.0)
+        split = (ordered < center).sum(axis=0)
+        n = np.maximum(count, 1)
+        upper = _kth_abs_deviation(ordered, count, center, split, n // 2)
+        lower = _kth_abs_deviation(ordered, count, center, split, (n - 1) // 2)
+        mad = np.where(n % 2 == 1, upper, (lower + upper) / 2)
+        mad = np.where(count == n_rows, mad, np.nan)
+
+    return {
+        'count': count,
+        'mean': mean,
+        'std': std,
+        'Q1': q1,
+        'median': median,
+        'Q3': q3,
+        'IQR': q3 - q1,
+        'mad': mad,
+    }
+
+
+def outlier_mask_block(values: np.ndarray, column_stats: Dict[str, np.ndarray], method: str,
+                       lower_factor: float = 1.5, upper_factor: float = 1.5,
+                       threshold: float = 3.0) -> np.ndarray:
+    """
+    Build the boolean outlier masks of one univariate method for every column of a block.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        2D float array of shape (n_samples, n_columns)
+    column_stats : dict
+        Output of ``column_statistics`` for ``values`` (the 'mean'/'std' entries
+        may be overridden by cached statistics)
+    method : str
+        One of 'iqr', 'zscore' or 'modified_zscore'
+    lower_factor, upper_factor : float
+        IQR multipliers (IQR method)
+    threshold : float
+        Score threshold (Z-score and Modified Z-score methods)
+
+    Returns:
+    --------
+    numpy.ndarray
+        2D boolean array, True where a value is an outlier. Columns with a zero
+        or undefined scale never flag outliers.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'iqr':
+            lower = column_stats['Q1'] - (lower_factor * column_stats['IQR'])
+            upper = column_stats['Q3'] + (upper_factor * column_stats['IQR'])
+            return (values < lower) | (values > upper)
+        if method == 'zscore':
+            std = column_stats['std']
+            mask = np.abs((values - column_stats['mean']) / std) > threshold
+            mask[:, (std == 0) | np.isnan(std)] = False
+            return mask
+        if method == 'modified_zscore':
+            mad = column_stats['mad']
+            mask = np.abs(0.6745 * (values - column_stats['median']) / mad) > threshold
+            mask[:, mad == 0] = False
+            return mask
+    raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+
+
+def compact_index_array(labels) -> np.ndarray:
+    """
+    Store index labels as a NumPy array, using the narrowest integer dtype that fits.
+
+    Integer labels (the common RangeIndex case) take 1-8 bytes each instead of
+    a boxed Python int per element; other labels are kept as a NumPy array of
+    their own dtype.
+    """
+    array = np.asarray(labels)
+    if array.dtype.kind not in 'iu' or array.size == 0:
+        return array
+    lo, hi = array.min(), array.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return array.astype(dtype)
+    return array
+
+
+def grubbs_critical_values(n, alpha: float, two_sided: bool = True) -> np.ndarray:
+    """
+    Grubbs critical values for one or more sample sizes, from one vectorized ``t.ppf`` call.
+    """
+    n = np.asarray(n, dtype=float)
+    t_val = t.ppf(1 - alpha / (2 * n if two_sided else n), n - 2)
+    return ((n - 1) / np.sqrt(n)) * np.sqrt(t_val ** 2 / (n - 2 + t_val ** 2))
+
+
+def grubbs_p_values(statistic, n, two_sided: bool = True) -> np.ndarray:
+    """
+    Approximate Grubbs p-values (Bonferroni bound), vectorized over statistics and sample sizes.
+    """
+    G = np.asarray(statistic, dtype=float)
+    n = np.asarray(n, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tail = 1 - t.cdf(G * np.sqrt((n - 2) / (n - 1 - G ** 2)), n - 2)
+    p_value = n * tail if two_sided else (n / 2) * tail
+    return np.minimum(p_value, 1.0)
+
+
+def generalized_esd(ordered: np.ndarray, max_outliers: int, alpha: float = 0.05,
+                    two_sided: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Generalized ESD (Rosner) test on sorted data, peeling one extreme per step.
+
+    The remaining sample after each step is a contiguous slice of ``ordered``,
+    so its mean and variance come from cumulative sums in O(1) per step. The
+    sums are accumulated outward from the median, so dropping a large outlier
+    never subtracts it back out of a running total (no cancellation error).
+    Critical values for all steps come from one vectorized ``t.ppf`` call.
+
+    Parameters:
+    -----------
+    ordered : numpy.ndarray
+        1D array sorted ascending, without missing values
+    max_outliers : int
+        Upper bound on the number of outliers (steps)
+    alpha : float, default=0.05
+        Significance level
+    two_sided : bool, default=True
+        Whether critical values are two-sided
+
+    Returns:
+    --------
+    dict
+        Per-step arrays 'position' (into ``ordered``), 'statistic',
+        'critical_value', 'mean', 'std', 'n' and the scalar 'num_outliers'
+    """
+    ordered = np.asarray(ordered, dtype=float)
+    n = len(ordered)
+    k = int(max_outliers)
+
+    # Outward cumulative sums of deviations from the median
+    mid = n // 2
+    center = ordered[mid]
+    dev = ordered - center
+    right = np.concatenate(([0.0], np.cumsum(dev[mid:])))
+    right_sq = np.concatenate(([0.0], np.cumsum(dev[mid:] ** 2)))
+    left = np.concatenate(([0.0], np.cumsum(dev[:mid][::-1])))
+    left_sq = np.concatenate(([0.0], np.cumsum(dev[:mid][::-1] ** 2)))
+
+    position = np.empty(k, dtype=np.intp)
+    statistic = np.empty(k)
+    means = np.empty(k)
+    stds = np.empty(k)
+    lo, hi = 0, n - 1
+    for step in range(k):
+        m = hi - lo + 1
+        s1 = left[mid - lo] + right[hi - mid + 1]
+        s2 = left_sq[mid - lo] + right_sq[hi - mid + 1]
+        mean_dev = s1 / m
+        var = max(s2 - s1 * mean_dev, 0.0) / (m - 1)
+        std = np.sqrt(var)
+        mean = center + mean_dev
+        low_gap = mean - ordered[lo]
+        high_gap = ordered[hi] - mean
+        if high_gap >= low_gap:
+            position[step], gap = hi, high_gap
+            hi -= 1
+        else:
+            position[step], gap = lo, low_gap
+            lo += 1
+        statistic[step] = gap / std if std > 0 else 0.0
+        means[step] = mean
+        stds[step] = std
+
+    sizes = n - np.arange(k)
+    critical = grubbs_critical_values(sizes, alpha, two_sided)
+    significant = np.flatnonzero(statistic > critical)
+    num_outliers = int(significant[-1] + 1) if len(significant) else 0
+
+    return {
+        'position': position,
+        'statistic': statistic,
+        'critical_value': critical,
+        'mean': means,
+        'std': stds,
+        'n': sizes,
+        'num_outliers': num_outliers,
+    }
+
+
+@lru_cache(maxsize=64)
+def grubbs_critical_table(alpha: float, two_sided: bool, size: int) -> np.ndarray:
+    """
+    Lookup table of Grubbs critical values indexed by sample size.
+
+    Entry ``n`` holds the critical value for n observations (NaN for n < 3).
+    Tables are cached per (alpha, two_sided, size); callers should round
+    ``size`` up (see ``_table_size``) so that nearby requests share a table.
+    """
+    table = np.full(size, np.nan)
+    if size > 3:
+        table[3:] = grubbs_critical_values(np.arange(3, size), alpha, two_sided)
+    table.setflags(write=False)
+    return table
+
+
+def _dixon_critical_table() -> np.ndarray:
+    table = np.full(max(DIXON_CRITICAL_VALUES) + 1, np.nan)
+    for n, value in DIXON_CRITICAL_VALUES.items():
+        table[n] = value
+    table.setflags(write=False)
+    return table
+
+
+DIXON_CRITICAL_TABLE = _dixon_critical_table()
+
+
+def _table_size(max_n: int) -> int:
+    return 1 << max(int(max_n), 7).bit_length()
+
+
+def grouped_extreme_tests(values: np.ndarray, codes: np.ndarray, n_groups: int,
+                          alpha: float = 0.05, two_sided: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Grubbs' and Dixon's Q-test for every group at once.
+
+    Values are sorted within groups with one ``lexsort``; group moments come
+    from ``reduceat`` and the order statistics needed by both tests are read
+    at the group boundaries. Critical values come from cached lookup tables.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        1D array of observations without missing values
+    codes : numpy.ndarray
+        Group code in ``[0, n_groups)`` for each observation
+    n_groups : int
+        Number of groups
+    alpha : float, default=0.05
+        Significance level for Grubbs' test
+    two_sided : bool, default=True
+        Whether Grubbs' critical values are two-sided
+
+    Returns:
+    --------
+    dict
+        Per-group arrays: 'n', Grubbs 'grubbs_statistic', 'grubbs_critical',
+        'grubbs_p_value', 'grubbs_position', Dixon 'dixon_statistic',
+        'dixon_critical', 'dixon_position', 'Q_low', 'Q_high'. Positions
+        index into ``values`` and are -1 where a test is undefined.
+    """
+    values = np.asarray(values, dtype=float)
+    codes = np.asarray(codes, dtype=np.intp)
+    counts = np.bincount(codes, minlength=n_groups)
+    result = {
+        'n': counts,
+        'grubbs_statistic': np.full(n_groups, np.nan),
+        'grubbs_critical': np.full(n_groups, np.nan),
+        'grubbs_p_value': np.full(n_groups, np.nan),
+        'grubbs_position': np.full(n_groups, -1, dtype=np.intp),
+        'dixon_statistic': np.full(n_groups, np.nan),
+        'dixon_critical': np.full(n_groups, np.nan),
+        'dixon_position': np.full(n_groups, -1, dtype=np.intp),
+        'Q_low': np.full(n_groups, np.nan),
+        'Q_high': np.full(n_groups, np.nan),
+    }
+    if len(values) == 0:
+        return result
+
+    # Sort by group, then value, then original position
+    order = np.lexsort((np.arange(len(values)), values, codes))
+    ordered = values[order]
+    ordered_codes = codes[order]
+
+    present = np.flatnonzero(counts)
+    n = counts[present]
+    starts = np.concatenate(([0], np.cumsum(n)[:-1]))
+    ends = starts + n - 1
+
+    # First element of each run of equal values, so that ties at the maximum
+    # resolve to the earliest row like ``idxmax`` does
+    position = np.arange(len(ordered))
+    change = np.ones(len(ordered), dtype=bool)
+    change[1:] = (ordered[1:] != ordered[:-1]) | (ordered_codes[1:] != ordered_codes[:-1])
+    run_start = np.maximum.accumulate(np.where(change, position, 0))
+    low_pos = order[starts]
+    high_pos = order[run_start[ends]]
+
+    low = ordered[starts]
+    high = ordered[ends]
+    testable = n >= 3
+
+    # Grubbs: moments per group, extreme is either the group minimum or maximum
+    mean = np.add.reduceat(ordered, starts) / n
+    centered = ordered - np.repeat(mean, n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(np.add.reduceat(centered ** 2, starts) / (n - 1))
+        low_gap = mean - low
+        high_gap = high - mean
+        use_high = (high_gap > low_gap) | ((high_gap == low_gap) & (high_pos < low_pos))
+        G = np.where(use_high, high_gap, low_gap) / std
+    zero_spread = testable & ~(std > 0)
+    G[zero_spread] = 0.0
+    G[~testable] = np.nan
+
+    table = grubbs_critical_table(float(alpha), bool(two_sided), _table_size(n.max() + 1))
+    critical = table[n]
+    critical[zero_spread] = np.nan
+    p_value = grubbs_p_values(G, n, two_sided)
+    p_value[zero_spread] = 1.0
+    p_value[~testable] = np.nan
+    grubbs_position = np.where(use_high, high_pos, low_pos)
+    grubbs_position[~testable | zero_spread] = -1
+
+    # Dixon: gaps between the two smallest/largest values over the range
+    second = ordered[np.minimum(starts + 1, ends)]
+    penultimate = ordered[np.maximum(ends - 1, starts)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        value_range = high - low
+        Q_low = (second - low) / value_range
+        Q_high = (high - penultimate) / value_range
+    Q_low[~testable] = np.nan
+    Q_high[~testable] = np.nan
+    # NaN comparisons select the high end, matching the scalar test
+    use_low = Q_low > Q_high
+    dixon_stat = np.where(use_low, Q_low, Q_high)
+    dixon_critical = np.full(len(n), np.nan)
+    in_table = n < len(DIXON_CRITICAL_TABLE)
+    dixon_critical[in_table] = DIXON_CRITICAL_TABLE[n[in_table]]
+    dixon_position = np.where(use_low, low_pos, high_pos)
+    dixon_position[~testable] = -1
+
+    for key, data in (('grubbs_statistic', G), ('grubbs_critical', critical),
+                      ('grubbs_p_value', p_value), ('grubbs_position', grubbs_position),
+                      ('dixon_statistic', dixon_stat), ('dixon_critical', dixon_critical),
+                      ('dixon_position', dixon_position), ('Q_low', Q_low), ('Q_high', Q_high)):
+        result[key][present] = data
+    return result
+
+
+_SIGN_BIT = np.uint64(1 << 63)
+
+
+def sortable_keys(values: np.ndarray) -> np.ndarray:
+    """
+    Map float64 values to uint64 keys with the same ordering (NaN excluded).
+    """
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.uint64)
+    return np.where(bits & _SIGN_BIT, ~bits, bits | _SIGN_BIT)
+
+
+def keys_to_values(keys: np.ndarray) -> np.ndarray:
+    """Inverse of ``sortable_keys``."""
+    keys = np.asarray(keys, dtype=np.uint64)
+    bits = np.where(keys & _SIGN_BIT, keys & ~_SIGN_BIT, ~keys)
+    return bits.view(np.float64)
+
+
+def quantile_ranks(count: int, q: float) -> Tuple[int, int, float]:
+    """
+    Order statistics (0-based ranks) and weight behind a linear-interpolation quantile.
+    """
+    virtual = (count - 1) * q
+    previous = int(np.floor(virtual))
+    gamma = virtual - previous
+    previous = min(max(previous, 0), count - 1)
+    return previous, min(previous + 1, count - 1), gamma
+
+
+def quantile_from_ranks(lower: float, upper: float, gamma: float) -> float:
+    """Combine two order statistics exactly as ``numpy.quantile`` does."""
+    return float(_lerp(np.float64(lower), np.float64(upper), np.float64(gamma)))
@@ -0,0 +1,258 @@
+"""
+Minimum Covariance Determinant (MCD) location and scatter, FastMCD algorithm.
+
+The MCD estimate is the mean and covariance of the h observations (about
+half of the data by default) whose covariance matrix has the smallest
+determinant, so up to n - h contaminated rows cannot pull it. It is found
+with FastMCD (Rousseeuw & Van Driessen, 1999):
+
+- start from many random (p + 1)-subsets and improve each with
+  concentration steps (C-steps): take the mean and covariance of the
+  current subset and keep the h rows closest to it in Mahalanobis
+  distance. Every C-step lowers (or keeps) the determinant;
+- for large n, run the trials on a random sample of at most
+  ``_MERGED_SIZE`` rows split into ``_MAX_SUBSETS`` subsets, pool the best
+  solutions of each subset on the merged sample, and only take the best
+  few to the full data, where the best of them after one C-step is
+  iterated until the log-determinant decreases by less than ``_TOLERANCE``.
+
+The full data is therefore only read by the last C-steps and the final
+reweighting, each one chunked Mahalanobis pass plus a selection, which
+keeps tens of millions of rows within seconds. As in the usual
+reweighted MCD, the raw covariance is rescaled to be consistent at the
+normal distribution and the estimate is then recomputed (and rescaled) on
+the rows within the 97.5% chi-square quantile.
+
+Only NumPy and SciPy are used.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy.linalg import cholesky, solve_triangular
+from scipy.stats import chi2
+
+from ._kernels import DEFAULT_CHUNK_SIZE
+
+# Rows per subset and number of subsets of the nested sampling
+_SUBSET_SIZE = 300
+_MAX_SUBSETS = 5
+_MERGED_SIZE = _SUBSET_SIZE * _MAX_SUBSETS
+
+# Random starting subsets (spread over the subsets for large n), C-steps
+# applied to each of them, and solutions kept from each stage
+_TRIALS = 500
+_TRIAL_STEPS = 2
+_KEEP = 10
+
+# Solutions carried from the merged sample to the full data
+_FULL_CANDIDATES = 2
+
+# Upper bound on C-steps when iterating to convergence, and the decrease
+# of the log-determinant below which the iteration has converged (the
+# decrease shrinks geometrically near the optimum)
+_MAX_STEPS = 100
+_TOLERANCE = 1e-4
+
+# Quantile of the chi-square distribution used to select reweighting rows
+_REWEIGHT_QUANTILE = 0.975
+
+_Estimate = Tuple[float, np.ndarray, np.ndarray]
+
+
+def _moments(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean vector and covariance matrix (ddof=1) of the rows of ``values``."""
+    location = values.mean(axis=0)
+    centered = values - location
+    return location, centered.T @ centered / (len(values) - 1)
+
+
+def _factor(covariance: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
+    """Lower Cholesky factor and log-determinant, or (None, -inf) when singular."""
+    try:
+        factor = cholesky(covariance, lower=True, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None, -np.inf
+    diagonal = np.diag(factor)
+    if not np.all(diagonal > 0):
+        return None, -np.inf
+    return factor, 2.0 * float(np.log(diagonal).sum())
+
+
+def _distances(values: np.ndarray, location: np.ndarray, factor: np.ndarray) -> np.ndarray:
+    """
+    Squared Mahalanobis distances, whitening chunks with one matrix product.
+
+    Faster than the triangular solves of ``mahalanobis_squared`` for the
+    repeated full-data passes of the C-steps; ``factor`` is well conditioned
+    there since singular estimates end the iteration.
+    """
+    whitening = solve_triangular(factor, np.eye(len(factor)), lower=True, check_finite=False).T
+    offset = location @ whitening
+    out = np.empty(len(values))
+    for start in range(0, len(values), DEFAULT_CHUNK_SIZE):
+        block = values[start:start + DEFAULT_CHUNK_SIZE] @ whitening
+        block -= offset
+        np.einsum('ij,ij->i', block, block, out=out[start:start + DEFAULT_CHUNK_SIZE])
+    return out
+
+
+def _closest(values: np.ndarray, location: np.ndarray, factor: np.ndarray, h: int) -> np.ndarray:
+    """Mask of the h rows with the smallest Mahalanobis distances."""
+    if h == len(values):
+        return np.ones(len(values), dtype=bool)
+    distances = _distances(values, location, factor)
+    mask = distances <= np.partition(distances, h - 1)[h - 1]
+    if mask.sum() != h:
+        # Ties at the h-th distance: select exactly h rows
+        mask = np.zeros(len(values), dtype=bool)
+        mask[np.argpartition(distances, h - 1)[:h]] = True
+    return mask
+
+
+def _masked_moments(values: np.ndarray, mask: np.ndarray, shift: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and covariance (ddof=1) of the masked rows, accumulated in chunks.
+
+    Sums are taken around ``shift`` (the previous location) so the
+    covariance does not suffer from cancellation.
+    """
+    p = values.shape[1]
+    total, cross = np.zeros(p), np.zeros((p, p))
+    for start in range(0, len(values), DEFAULT_CHUNK_SIZE):
+        block = np.compress(mask[start:start + DEFAULT_CHUNK_SIZE], values[start:start + DEFAULT_CHUNK_SIZE], axis=0)
+        block -= shift
+        total += np.ones(len(block)) @ block
+        cross += block.T @ block
+    count = int(mask.sum())
+    mean = total / count
+    covariance = (cross - count * np.outer(mean, mean)) / (count - 1)
+    return shift + mean, covariance
+
+
+def _c_steps(values: np.ndarray, h: int, location: np.ndarray, covariance: np.ndarray,
+             max_steps: int) -> _Estimate:
+    """
+    Apply up to ``max_steps`` C-steps and return (log-determinant, location, covariance).
+
+    The first step is always taken (the starting estimate need not come
+    from h rows); later ones stop once the log-determinant decreases by
+    less than ``_TOLERANCE`` or the covariance becomes singular (h rows on
+    a hyperplane, an exact fit).
+    """
+    factor, log_det = _factor(covariance)
+    for step in range(max_steps):
+        if factor is None:
+            break
+        new_location, new_covariance = _masked_moments(values, _closest(values, location, factor, h), location)
+        new_factor, new_log_det = _factor(new_covariance)
+        if step and new_log_det > log_det - _TOLERANCE:
+            break
+        location, covariance, factor, log_det = new_location, new_covariance, new_factor, new_log_det
+    return log_det, location, covariance
+
+
+def _initial_estimate(values: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and covariance of a random (p + 1)-subset, enlarged until nonsingular."""
+    n, p = values.shape
+    order = rng.permutation(n)
+    size = p + 1
+    location, covariance = _moments(values[order[:size]])
+    while _factor(covariance)[0] is None and size < n:
+        size += 1
+        location, covariance = _moments(values[order[:size]])
+    return location, covariance
+
+
+def _best(estimates: List[_Estimate], keep: int) -> List[_Estimate]:
+    return sorted(estimates, key=lambda estimate: estimate[0])[:keep]
+
+
+def _trials(values: np.ndarray, h: int, n_trials: int, rng: np.random.Generator) -> List[_Estimate]:
+    """Best ``_KEEP`` estimates from ``n_trials`` random starts with ``_TRIAL_STEPS`` C-steps each."""
+    estimates = []
+    for _ in range(n_trials):
+        location, covariance = _initial_estimate(values, rng)
+        estimates.append(_c_steps(values, h, location, covariance, _TRIAL_STEPS))
+    return _best(estimates, _KEEP)
+
+
+def _refine(values: np.ndarray, h: int, candidates: List[_Estimate], max_steps: int) -> List[_Estimate]:
+    return [_c_steps(values, h, location, covariance, max_steps) for _, location, covariance in candidates]
+
+
+def fast_mcd(values: np.ndarray, support_fraction: Optional[float] = None,
+             random_state: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reweighted Minimum Covariance Determinant estimate of location and scatter.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        2D array of shape (n_samples, n_features) without missing values
+    support_fraction : float, optional
+        Fraction of rows h / n the raw estimate is computed from, in
+        (0, 1]. Defaults to (n + p + 1) / 2 rows, the highest breakdown point.
+    random_state : int, optional
+        Seed of the random starting subsets and subsamples
+
+    Returns:
+    --------
+    tuple
+        (location, covariance, support) where ``support`` is the boolean
+        mask of the rows the reweighted estimate was computed from
+    """
+    values = np.asarray(values, dtype=float)
+    n, p = values.shape
+    if n <= p:
+        raise ValueError(f"Need more observations ({n}) than features ({p}) for the MCD estimate")
+    if support_fraction is None:
+        h = (n + p + 1) // 2
+    else:
+        if not 0 < support_fraction <= 1:
+            raise ValueError("support_fraction must be in (0, 1]")
+        h = int(np.ceil(support_fraction * n))
+    h = min(max(h, p + 1), n)
+
+    if h == n:
+        location, covariance = _moments(values)
+        return location, covariance, np.ones(n, dtype=bool)
+
+    rng = np.random.default_rng(random_state)
+    if n <= 2 * _SUBSET_SIZE:
+        candidates = _trials(values, h, _TRIALS, rng)
+    else:
+        merged = values[rng.choice(n, size=min(n, _MERGED_SIZE), replace=False)]
+        n_subsets = min(_MAX_SUBSETS, len(merged) // _SUBSET_SIZE)
+        subset_h = int(np.ceil(h / n * (len(merged) // n_subsets)))
+        candidates = []
+        for subset in np.array_split(merged, n_subsets):
+            candidates.extend(_trials(subset, min(subset_h, len(subset)), _TRIALS // n_subsets, rng))
+        merged_h = int(np.ceil(h / n * len(merged)))
+        candidates = _best(_refine(merged, merged_h, candidates, _TRIAL_STEPS), _KEEP)
+        if len(merged) < n:
+            # One full-data C-step ranks the best merged solutions
+            candidates = _best(_refine(values, h, candidates[:_FULL_CANDIDATES], 1), 1)
+    _, location, covariance = _best(_refine(values, h, candidates, _MAX_STEPS), 1)[0]
+
+    factor = _factor(covariance)[0]
+    if factor is None:
+        # Exact fit: at least h rows lie on a hyperplane, the raw estimate is final
+        normal = np.linalg.eigh(covariance)[1][:, 0]
+        tolerance = 1e-9 * max(float(np.abs(values).max()), 1.0)
+        support = np.abs((values - location) @ normal) <= tolerance
+        return location, covariance, support
+
+    # Consistency at the normal distribution, then reweighting. The rows of a
+    # normal sample within its ``fraction`` quantile have a covariance shrunk
+    # by P(chi2_{p+2} <= q) / P(chi2_p <= q), which both estimates undo
+    def consistency(fraction: float) -> float:
+        return fraction / chi2.cdf(chi2.ppf(fraction, df=p), df=p + 2)
+
+    covariance = covariance * consistency(h / n)
+    support = _distances(values, location, _factor(covariance)[0]) <= chi2.ppf(_REWEIGHT_QUANTILE, df=p)
+    if support.sum() <= p:
+        return location, covariance, support
+    location, covariance = _masked_moments(values, support, location)
+    return location, covariance * consistency(_REWEIGHT_QUANTILE), support
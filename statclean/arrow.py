@@ -0,0 +1,324 @@
+"""
+Apache Arrow backend: outlier detection and treatment with ``pyarrow.compute``.
+
+``ArrowEngine`` cleans a ``pyarrow.Table`` in place of a DataFrame. Quantiles,
+means and standard deviations come from Arrow aggregation kernels, masks from
+element-wise kernels, removal from ``Table.filter`` and winsorizing from
+conditional selection, so the data never goes through pandas. Kernels run
+over the table's chunks and ``filter`` keeps its chunk layout, so multi-chunk
+tables are processed chunk by chunk.
+
+NaN and null both count as missing, as in pandas: statistics skip them and
+they are never flagged. pyarrow is an optional dependency, imported when an
+engine is created.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from . import _kernels
+from .outofcore import SUPPORTED_METHODS, _DEFAULTS
+
+
+_METHOD_LABELS = {
+    'iqr': 'IQR',
+    'zscore': 'Z-score',
+    'modified_zscore': 'Modified Z-score',
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError as exc:
+        raise ImportError("The Arrow backend requires pyarrow. Install it with: pip install pyarrow") from exc
+    return pyarrow, pyarrow.compute
+
+
+def _scalar(value: Any) -> float:
+    """Python float from an Arrow scalar, NaN for null."""
+    value = value.as_py()
+    return np.nan if value is None else float(value)
+
+
+class ArrowEngine:
+    """
+    Outlier detection and treatment on a ``pyarrow.Table``.
+
+    Mirrors ``ArrayEngine``: ``detect``, ``remove``, ``winsorize``,
+    ``statistics`` and ``apply_cleaning_strategy``, with the same defaults
+    and threshold rules as the corresponding ``StatClean`` methods. The
+    cleaned data is available as ``table``.
+
+    Parameters:
+    -----------
+    table : pyarrow.Table or pyarrow.RecordBatch
+        Data to clean
+    columns : list of str, optional
+        Columns that may be cleaned. Defaults to the integer and floating
+        point columns.
+
+    Example:
+    --------
+        engine = ArrowEngine(pyarrow.parquet.read_table('events.parquet'))
+        engine.remove('latency', 'iqr').winsorize('amount', 'percentile')
+        pyarrow.parquet.write_table(engine.table, 'events_clean.parquet')
+    """
+
+    def __init__(self, table: Any, columns: Optional[List[str]] = None) -> None:
+        pa, pc = _require_pyarrow()
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        if not isinstance(table, pa.Table):
+            raise ValueError("ArrowEngine requires a pyarrow.Table or RecordBatch")
+        if columns is None:
+            columns = [field.name for field in table.schema
+                       if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)]
+        for column in columns:
+            if column not in table.column_names:
+                raise ValueError(f"Column '{column}' not found in table. "
+                                 f"Available columns: {', '.join(table.column_names)}")
+
+        self._pa = pa
+        self._pc = pc
+        self.columns = list(columns)
+        self.n_total = table.num_rows
+        self.table = table
+        # Input row number of every current row, filtered along with the table
+        self._row_ids = pa.chunked_array([pa.array(np.arange(self.n_total, dtype=np.int64))])
+        self.outlier_info: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows not removed so far."""
+        return self.table.num_rows
+
+    def _column(self, column: str) -> Any:
+        """Column as a float ChunkedArray with NaN turned into null."""
+        if column not in self.columns:
+            raise ValueError(f"Column '{column}' not found. Available columns: {', '.join(self.columns)}")
+        pc = self._pc
+        values = self.table.column(column).cast(self._pa.float64())
+        return pc.if_else(pc.is_nan(values), self._pa.scalar(None, self._pa.float64()), values)
+
+    def _quantiles(self, values: Any, qs: List[float]) -> List[float]:
+        if values.null_count == len(values):
+            return [np.nan] * len(qs)
+        result = self._pc.quantile(values, q=qs, interpolation='linear')
+        return [float(value) for value in result.to_pylist()]
+
+    def statistics(self, column: str, method: str = 'iqr', **params: Any) -> Dict[str, float]:
+        """
+        Statistics and bounds of one method over the current rows.
+
+        Parameters:
+        -----------
+        column : str
+            Column name
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold),
+            'modified_zscore' (threshold) or 'percentile' (lower_percentile,
+            upper_percentile)
+
+        Returns:
+        --------
+        dict
+            Statistics, bounds and the parameters used
+        """
+        pc = self._pc
+        values = self._column(column)
+        if method == 'iqr':
+            lower_factor = params.get('lower_factor') or _DEFAULTS['lower_factor']
+            upper_factor = params.get('upper_factor') or _DEFAULTS['upper_factor']
+            if lower_factor < 0 or upper_factor < 0:
+                raise ValueError("Factors must be non-negative values")
+            Q1, Q3 = self._quantiles(values, [0.25, 0.75])
+            IQR = Q3 - Q1
+            return {'lower_factor': lower_factor, 'upper_factor': upper_factor,
+                    'Q1': Q1, 'Q3': Q3, 'IQR': IQR,
+                    'lower_bound': Q1 - lower_factor * IQR, 'upper_bound': Q3 + upper_factor * IQR}
+        if method in ('zscore', 'modified_zscore'):
+            threshold = params.get('threshold') or _DEFAULTS[f'{method}_threshold']
+            if threshold <= 0:
+                raise ValueError("Threshold must be a positive value")
+            if method == 'zscore':
+                return {'threshold': threshold, 'mean': _scalar(pc.mean(values)),
+                        'std': _scalar(pc.stddev(values, ddof=1))}
+            median = self._quantiles(values, [0.5])[0]
+            if values.null_count > 0 or len(values) == 0:
+                # Matches scipy's median_abs_deviation, which propagates NaN
+                mad = np.nan
+            else:
+                mad = self._quantiles(pc.abs(pc.subtract(values, median)), [0.5])[0]
+            return {'threshold': threshold, 'median': median, 'mad': mad}
+        if method == 'percentile':
+            lower_percentile = params.get('lower_percentile', _DEFAULTS['lower_percentile'])
+            upper_percentile = params.get('upper_percentile', _DEFAULTS['upper_percentile'])
+            if not (0 <= lower_percentile < upper_percentile <= 100):
+                raise ValueError("Percentiles must be between 0-100 and lower < upper")
+            lower, upper = self._quantiles(values, [lower_percentile / 100.0, upper_percentile / 100.0])
+            return {'lower_percentile': lower_percentile, 'upper_percentile': upper_percentile,
+                    'lower_bound': lower, 'upper_bound': upper}
+        raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore, percentile")
+
+    def _no_outliers(self) -> Any:
+        return self._pa.chunked_array([self._pa.array(np.zeros(self.n_rows, dtype=bool))])
+
+    def _outlier_mask(self, column: str, method: str, stats: Dict[str, float]) -> Any:
+        """Boolean ChunkedArray over the current rows; missing values are never flagged."""
+        pc = self._pc
+        values = self._column(column)
+        if method == 'iqr':
+            mask = pc.or_(pc.less(values, stats['lower_bound']), pc.greater(values, stats['upper_bound']))
+        elif method == 'zscore':
+            if stats['std'] == 0 or np.isnan(stats['std']):
+                return self._no_outliers()
+            mask = pc.greater(pc.abs(pc.divide(pc.subtract(values, stats['mean']), stats['std'])),
+                              stats['threshold'])
+        else:
+            if stats['mad'] == 0 or np.isnan(stats['mad']):
+                return self._no_outliers()
+            scores = pc.divide(pc.multiply(pc.subtract(values, stats['median']), 0.6745), stats['mad'])
+            mask = pc.greater(pc.abs(scores), stats['threshold'])
+        return mask.fill_null(False)
+
+    def detect(self, column: str, method: str = 'iqr', **params: Any) -> Any:
+        """
+        Flag outliers without removing them.
+
+        Returns:
+        --------
+        pyarrow.ChunkedArray
+            Boolean mask over the current rows
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        return self._outlier_mask(column, method, self.statistics(column, method, **params))
+
+    def remove(self, column: str, method: str = 'iqr', **params: Any) -> 'ArrowEngine':
+        """
+        Remove outlier rows with ``Table.filter``.
+
+        Parameters:
+        -----------
+        column : str
+            Column to check
+        method : str, default='iqr'
+            'iqr', 'zscore' or 'modified_zscore'
+        **params
+            lower_factor/upper_factor or threshold
+
+        Returns:
+        --------
+        ArrowEngine
+            Self for method chaining
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        pc = self._pc
+        stats = self.statistics(column, method, **params)
+        mask = self._outlier_mask(column, method, stats)
+        removed = self._row_ids.filter(mask).to_numpy()
+        if len(removed):
+            keep = pc.invert(mask)
+            self.table = self.table.filter(keep)
+            self._row_ids = self._row_ids.filter(keep)
+
+        self.outlier_info[column] = {
+            'method': _METHOD_LABELS[method],
+            'column': column,
+            **stats,
+            'num_outliers': len(removed),
+            'percent_removed': len(removed) / self.n_total * 100 if self.n_total else 0.0,
+            'outlier_indices': _kernels.compact_index_array(removed),
+        }
+        return self
+
+    def winsorize(self, column: str, method: str = 'iqr', **params: Any) -> 'ArrowEngine':
+        """
+        Cap values outside the bounds of a method instead of removing rows.
+
+        Parameters:
+        -----------
+        column : str
+            Column to winsorize
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold) or
+            'percentile' (lower_percentile, upper_percentile)
+
+        Returns:
+        --------
+        ArrowEngine
+            Self for method chaining
+        """
+        if method not in ('iqr', 'zscore', 'percentile'):
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, percentile")
+        pa, pc = self._pa, self._pc
+        stats = self.statistics(column, method, **params)
+        if method == 'zscore':
+            if stats['std'] == 0 or np.isnan(stats['std']):
+                print(f"Warning: Column '{column}' has zero or NaN standard deviation. No winsorization applied.")
+                return self
+            stats['lower_bound'] = stats['mean'] - stats['threshold'] * stats['std']
+            stats['upper_bound'] = stats['mean'] + stats['threshold'] * stats['std']
+        lower, upper = stats['lower_bound'], stats['upper_bound']
+
+        original = self.table.column(column)
+        values = original.cast(pa.float64())
+        # NaN compares false and null stays null, so missing values are kept
+        below = pc.less(values, lower).fill_null(False)
+        above = pc.greater(values, upper).fill_null(False)
+        capped = pc.if_else(below, lower, pc.if_else(above, upper, values))
+        if not pa.types.is_floating(original.type):
+            # Integer columns become float, as with Series.clip and float bounds
+            capped = capped.cast(pa.float64())
+        position = self.table.schema.get_field_index(column)
+        self.table = self.table.set_column(position, pa.field(column, capped.type), capped)
+
+        num_lower = pc.sum(below).as_py() or 0
+        num_upper = pc.sum(above).as_py() or 0
+        winsorized = self._row_ids.filter(pc.or_(below, above)).to_numpy()
+        label = {'iqr': 'IQR Winsorizing', 'zscore': 'Z-score Winsorizing',
+                 'percentile': 'Percentile Winsorizing'}[method]
+        self.outlier_info[column] = {
+            'method': label,
+            'column': column,
+            **stats,
+            'num_winsorized': num_lower + num_upper,
+            'num_winsorized_lower': num_lower,
+            'num_winsorized_upper': num_upper,
+            'percent_winsorized': (num_lower + num_upper) / self.n_rows * 100 if self.n_rows else 0.0,
+            'winsorized_indices': _kernels.compact_index_array(winsorized),
+        }
+        return self
+
+    def apply_cleaning_strategy(self, strategy: Dict[str, Dict[str, Any]]) -> 'ArrowEngine':
+        """
+        Apply a cleaning strategy in order, each step on the rows left by the previous ones.
+
+        Takes the same format as ``StatClean.apply_cleaning_strategy``; methods
+        'iqr', 'zscore' and 'modified_zscore' remove rows and
+        'winsorize_percentile' caps values.
+
+        Returns:
+        --------
+        ArrowEngine
+            Self for method chaining
+        """
+        for column, config in strategy.items():
+            params = {key: value for key, value in config.items() if key != 'method'}
+            method = config.get('method')
+            if method == 'winsorize_percentile':
+                self.winsorize(column, 'percentile', **params)
+            elif method in _METHOD_LABELS:
+                self.remove(column, method, **params)
+            else:
+                raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                                 f"ArrowEngine supports: {', '.join(SUPPORTED_METHODS)}")
+        return self
+
+    def row_positions(self) -> np.ndarray:
+        """Positions (in the input table) of the rows not removed so far."""
+        return self._row_ids.to_numpy()
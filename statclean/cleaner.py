@@ -13,17 +13,30 @@ Statistical Methods Available:
 - Testing: P-values, confidence intervals, effect sizes
 """
 
-from typing import Optional, List, Dict, Tuple, Union, Any
+from typing import Optional, List, Dict, Tuple, Union, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import copy as copy_module
+import os
+import weakref
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
-from scipy.stats import chi2, t, boxcox
+from scipy.stats import chi2, boxcox
 # from scipy.special import ndtri  # Currently unused
-from tqdm import tqdm
 import warnings
 import math
+from functools import reduce
+
+from . import _kernels, instrumentation
+from ._cache import StatisticsCache, new_version
+from ._incremental import SortedColumnStatistics
+from ._robust import fast_mcd
+from .engine import ArrayEngine
+from .instrumentation import instrumented
+from .plan import CleaningPlan
+from .sketches import KLLSketch
+from .utils import _plotting_modules
 
 
 class StatClean:
@@ -41,7 +54,9 @@ class StatClean:
     where rigorous statistical methods and reproducible results are essential.
     """
     
-    def __init__(self, df: Optional[pd.DataFrame] = None, preserve_index: bool = True) -> None:
+    def __init__(self, df: Optional[pd.DataFrame] = None, preserve_index: bool = True,
+                 deferred: bool = False, copy: bool = True, engine: str = 'pandas',
+                 stats_cache_size: int = 256, incremental: bool = False) -> None:
         """
         Initialize StatClean with an optional DataFrame.
         
@@ -51,29 +66,82 @@ class StatClean:
             The DataFrame to clean
         preserve_index : bool, default=True
             Whether to preserve the original index after cleaning
+        deferred : bool, default=False
+            If True, row removals only update a boolean "alive rows" mask and the
+            cleaned frame is materialized once, when ``clean_df`` is next read.
+            Long removal chains then avoid copying the whole frame per step.
+        copy : bool, default=True
+            If False, ``original_df`` is a reference to the caller's frame and
+            ``clean_df`` a shallow projection of it; a column's data is only
+            copied when a winsorize or transform replaces it, and ``reset()``
+            is free. The caller's frame must not be modified while in use.
+        engine : str, default='pandas'
+            'numpy' computes the IQR, Z-score and Modified Z-score statistics
+            and masks on NumPy arrays through ``ArrayEngine`` (same results,
+            less pandas overhead on tall frames); pandas is then only used to
+            hold the data and return masks and frames.
+        stats_cache_size : int, default=256
+            Maximum number of per-column statistics (quartiles, mean/std,
+            median/MAD, percentiles, distribution analyses) kept in an LRU
+            cache. Entries are keyed by column versions that removals,
+            winsorizing and transforms bump, and that replacing a column or
+            the frame through ``clean_df`` bumps too. After writing into an
+            existing column in place (``clean_df.loc[...] = ...``) call
+            ``invalidate``. 0 disables the cache.
+        incremental : bool, default=False
+            Keep the sorted order, sums and sums of squares of each column
+            whose statistics were requested, and update them as rows are
+            removed (O(k log n) for k rows) instead of rescanning the
+            remaining rows. Quantiles, medians and MADs are unchanged; means
+            and standard deviations agree up to floating-point rounding.
+            Each tracked column is sorted once and costs about 21 bytes per
+            row. IQR, Z-score and Modified Z-score removals then read the rows
+            to remove from the sorted tails, in time proportional to the
+            number of outliers rather than the rows. Pays off when statistics are needed again after removals
+            (repeated passes over the columns, iterative cleaning). Implies
+            ``deferred=True``.
         
         Raises:
         -------
         ValueError
-            If the provided DataFrame is empty
+            If the provided DataFrame is empty or the engine is unknown
         """
         if df is not None and df.empty:
             raise ValueError("Cannot initialize with an empty DataFrame")
-        
-        self.original_df: Optional[pd.DataFrame] = df.copy() if df is not None else None
-        self.clean_df: Optional[pd.DataFrame] = df.copy() if df is not None else None
+        if engine not in ('pandas', 'numpy'):
+            raise ValueError(f"Unknown engine '{engine}'. Available engines: pandas, numpy")
+        
+        self.original_df: Optional[pd.DataFrame] = None
+        self._clean_df: Optional[pd.DataFrame] = None
+        self._alive: Optional[np.ndarray] = None
+        self._shares_original: bool = False
+        self._copy: bool = copy
         self.outlier_info: Dict[str, Dict[str, Any]] = {}
         self.preserve_index: bool = preserve_index
+        self.deferred: bool = deferred or incremental
+        self.incremental: bool = incremental
+        self.engine: str = engine
+        self._summaries: Dict[str, SortedColumnStatistics] = {}
+        self._stats_cache = StatisticsCache(stats_cache_size)
+        self._row_version: int = new_version()
+        self._column_versions: Dict[str, int] = {}
+        self._buffers: Dict[str, Callable[[], Any]] = {}
+        self._engine_columns: Dict[str, Tuple[Tuple[int, int], Callable[[], Any], np.ndarray]] = {}
+        if df is not None:
+            self.original_df = df.copy() if copy else df
+            self._attach_clean_df()
         
         # Default thresholds configuration
         self._default_thresholds = {
             'iqr_lower_factor': 1.5,
             'iqr_upper_factor': 1.5,
             'zscore_threshold': 3.0,
-            'modified_zscore_threshold': 3.5
+            'modified_zscore_threshold': 3.5,
+            'sketch_epsilon': 0.01
         }
         
-    def set_data(self, df: pd.DataFrame, preserve_index: Optional[bool] = None) -> None:
+    def set_data(self, df: pd.DataFrame, preserve_index: Optional[bool] = None,
+                 copy: Optional[bool] = None) -> None:
         """
         Set or update the DataFrame to be cleaned.
         
@@ -84,6 +152,9 @@ class StatClean:
         preserve_index : bool, optional
             Whether to preserve the original index after cleaning.
             If None, uses the value set in __init__
+        copy : bool, optional
+            Whether to copy the input (see ``__init__``).
+            If None, uses the value set in __init__
         
         Raises:
         -------
@@ -95,31 +166,626 @@ class StatClean:
         if df.empty:
             raise ValueError("Cannot set an empty DataFrame")
         
-        self.original_df = df.copy()
-        self.clean_df = df.copy()
+        if copy is not None:
+            self._copy = copy
+        self.original_df = df.copy() if self._copy else df
+        self._attach_clean_df()
         self.outlier_info = {}
         if preserve_index is not None:
             self.preserve_index = preserve_index
     
+    def _attach_clean_df(self) -> None:
+        """
+        Derive ``clean_df`` from ``original_df``.
+        
+        In copy-free mode this is a shallow projection sharing the column
+        buffers; otherwise a deep copy.
+        """
+        if self._copy:
+            self.clean_df = self.original_df.copy()
+        else:
+            self.clean_df = self.original_df.copy(deep=False)
+            self._shares_original = True
+    
+    def _set_column(self, column: str, values: Any) -> None:
+        """
+        Replace a column of the cleaned data with new values.
+        
+        While ``clean_df`` still shares buffers with the caller's frame, the
+        column is swapped for a new array rather than written in place, so
+        the caller's data is never modified.
+        """
+        frame = self.clean_df
+        if self._shares_original and column in frame.columns:
+            loc = frame.columns.get_loc(column)
+            if isinstance(loc, int) and hasattr(frame, 'isetitem'):
+                frame.isetitem(loc, values)
+                self._column_versions[column] = new_version()
+                self._buffers.pop(column, None)
+                self._engine_columns.pop(column, None)
+                self._summaries.pop(column, None)
+                return
+            # Older pandas may write into the shared block; detach with a deep copy first
+            frame = frame.copy()
+            self.clean_df = frame
+        frame[column] = values
+        self._column_versions[column] = new_version()
+        self._buffers.pop(column, None)
+        self._engine_columns.pop(column, None)
+        self._summaries.pop(column, None)
+    
+    @property
+    def clean_df(self) -> Optional[pd.DataFrame]:
+        """
+        The cleaned DataFrame.
+        
+        In deferred mode, pending row removals are applied here, so the frame
+        is copied once no matter how many removal steps preceded the read.
+        
+        Replacing the frame or a column (``clean_df['x'] = values``) is
+        detected by later calls; after writing into a column in place
+        (``clean_df.loc[rows, 'x'] = value``) call ``invalidate``.
+        """
+        if self._alive is not None:
+            self._check_buffers()
+            frame = self._clean_df[self._alive]
+            if not self.preserve_index:
+                frame = frame.reset_index(drop=True)
+            # Renumber tracked statistics to the compacted rows (no re-sorting)
+            summaries = {column: summary.compact(self._alive)
+                         for column, summary in self._summaries.items()}
+            self._clean_df = frame
+            self._alive = None
+            self._shares_original = False
+            self._track_buffers(list(self._buffers))
+            self._summaries = summaries
+        return self._clean_df
+    
+    @clean_df.setter
+    def clean_df(self, df: Optional[pd.DataFrame]) -> None:
+        self._clean_df = df
+        self._alive = None
+        self._shares_original = False
+        # New frame: no cached statistic applies to it
+        self._row_version = new_version()
+        self._column_versions = {}
+        self._buffers = {}
+        self._engine_columns = {}
+        self._summaries = {}
+    
+    # Row-state accessors (do not materialize pending removals)
+    def _row_index(self) -> pd.Index:
+        """
+        Index of the rows currently in the cleaned data, as ``clean_df.index`` would report it.
+        """
+        if self._alive is None:
+            return self._clean_df.index
+        if not self.preserve_index:
+            return pd.RangeIndex(int(self._alive.sum()))
+        return self._clean_df.index[self._alive]
+    
+    def _n_rows(self) -> int:
+        """
+        Number of rows currently in the cleaned data.
+        """
+        if self._alive is None:
+            return len(self._clean_df)
+        return int(self._alive.sum())
+    
+    def _column_data(self, column: str) -> pd.Series:
+        """
+        Values of one column over the rows currently in the cleaned data.
+        
+        Only this column is gathered when removals are pending, instead of
+        materializing the whole frame.
+        """
+        series = self._clean_df[column]
+        if self._alive is None:
+            return series
+        series = series[self._alive]
+        if not self.preserve_index:
+            series.index = pd.RangeIndex(len(series))
+        return series
+    
+    def _columns_data(self, columns: List[str]) -> pd.DataFrame:
+        """
+        Sub-frame of several columns over the rows currently in the cleaned data.
+        """
+        frame = self._clean_df[columns]
+        if self._alive is None:
+            return frame
+        frame = frame[self._alive]
+        if not self.preserve_index:
+            frame.index = pd.RangeIndex(len(frame))
+        return frame
+    
+    def _numeric_columns(self) -> List[str]:
+        """
+        Names of the numeric columns of the cleaned data.
+        """
+        return self._clean_df.head(0).select_dtypes(include=np.number).columns.tolist()
+    
+    def _group_codes(self, by: Union[str, List[str]]) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Integer group codes for the rows currently in the cleaned data.
+        
+        Returns:
+        --------
+        tuple
+            (codes, keys) where ``codes[i]`` is the position of row i's group
+            in ``keys`` (sorted group labels), or -1 when a key is missing
+        """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        by_columns = [by] if isinstance(by, str) else list(by)
+        missing = [col for col in by_columns if col not in self._clean_df.columns]
+        if missing:
+            available_cols = ", ".join(self._clean_df.columns.tolist())
+            raise ValueError(f"Group column(s) {missing} not found in DataFrame. Available columns: {available_cols}")
+        
+        grouper = self._columns_data(by_columns).groupby(by if isinstance(by, str) else by_columns,
+                                                         sort=True, dropna=True)
+        codes = grouper.ngroup().to_numpy(dtype=float, na_value=np.nan)
+        codes = np.where(np.isnan(codes), -1, codes).astype(np.intp)
+        return codes, grouper.size().index
+    
+    def _drop_rows(self, outlier_mask: pd.Series) -> pd.Index:
+        """
+        Remove the rows flagged in ``outlier_mask`` from the cleaned data.
+        
+        The mask must be aligned with the current rows (``_row_index()``). In
+        deferred mode only the alive-rows mask is updated; otherwise the frame
+        is filtered immediately.
+        
+        Returns:
+        --------
+        pandas.Index
+            Index labels of the removed rows
+        """
+        flags = np.asarray(outlier_mask, dtype=bool)
+        removed = self._row_index()[flags]
+        self._check_buffers()
+        versions = self._row_version, self._column_versions
+        tracked = list(self._buffers)
+        
+        if self.deferred:
+            if self._alive is None:
+                self._alive = ~flags
+                removed_positions = np.flatnonzero(flags)
+            else:
+                removed_positions = np.flatnonzero(self._alive)[flags]
+                self._alive[removed_positions] = False
+            if self._summaries and len(removed_positions):
+                self._update_summaries(removed_positions)
+        else:
+            self.clean_df = self.clean_df[~flags].copy()
+            
+            # Reset index if not preserving
+            if not self.preserve_index:
+                self.clean_df.reset_index(drop=True, inplace=True)
+        
+        if flags.any():
+            self._row_version = new_version()
+        else:
+            # Same rows and values: cached statistics remain valid
+            self._row_version, self._column_versions = versions
+            self._track_buffers(tracked)
+        
+        return removed
+    
+    def _drop_positions(self, positions: np.ndarray) -> pd.Index:
+        """
+        Remove rows by physical position in ``_clean_df`` (deferred mode).
+        
+        Unlike ``_drop_rows`` no mask over the current rows is built, so the
+        cost grows with the number of removed rows (plus one pass over the
+        alive-rows mask to renumber the labels when the index is not
+        preserved).
+        
+        Returns:
+        --------
+        pandas.Index
+            Index labels of the removed rows, in row order
+        """
+        positions = np.sort(np.asarray(positions, dtype=np.intp))
+        if self._alive is None:
+            self._alive = np.ones(len(self._clean_df), dtype=bool)
+            removed = self._clean_df.index[positions]
+        elif self.preserve_index:
+            removed = self._clean_df.index[positions]
+        else:
+            labels = positions - np.searchsorted(np.flatnonzero(~self._alive), positions)
+            removed = pd.RangeIndex(len(self._clean_df))[labels]
+        if len(positions):
+            self._alive[positions] = False
+            if self._summaries:
+                self._update_summaries(positions)
+            self._row_version = new_version()
+        return removed
+    
+    def _column_summary(self, column: str) -> SortedColumnStatistics:
+        """
+        Incrementally maintained statistics of one column (incremental mode).
+        
+        Built on first use by sorting the column once; removals then update it.
+        Rebuilt when the column was replaced since.
+        """
+        self._column_version(column)
+        summary = self._summaries.get(column)
+        if summary is None:
+            values = self._clean_df[column].to_numpy(dtype=float, na_value=np.nan)
+            summary = SortedColumnStatistics(values, self._alive)
+            self._summaries[column] = summary
+        return summary
+    
+    def _update_summaries(self, positions: np.ndarray) -> None:
+        """
+        Remove rows (physical positions in ``_clean_df``) from every tracked column.
+        """
+        for summary in self._summaries.values():
+            summary.remove(positions)
+    
+    def _column_engine(self, column: str) -> ArrayEngine:
+        """
+        ``ArrayEngine`` over one column of the current rows (engine='numpy').
+        
+        The alive-rows mask is shared, and so is the column buffer of float64
+        columns. Other dtypes are converted to a float copy once per column
+        version; the copy is reused until the column or its rows change.
+        """
+        key = (self._row_version, self._column_version(column))
+        buffer = self._buffers[column]
+        cached = self._engine_columns.get(column)
+        if cached is not None and cached[0] == key and cached[1]() is buffer():
+            return ArrayEngine({column: cached[2]}, alive=self._alive)
+        data = self._clean_df[column]
+        values = data.to_numpy(dtype=float, na_value=np.nan)
+        if data.dtype != np.float64:
+            self._engine_columns[column] = (key, buffer, values)
+        return ArrayEngine({column: values}, alive=self._alive)
+    
+    def _bounds_mask(self, column: str, lower_bound: float, upper_bound: float) -> pd.Series:
+        """
+        Rows of the current data with values outside [lower_bound, upper_bound].
+        """
+        if self.engine == 'numpy':
+            values = self._column_engine(column).values(column)
+            return pd.Series((values < lower_bound) | (values > upper_bound),
+                             index=self._row_index(), name=column)
+        data = self._column_data(column)
+        return (data < lower_bound) | (data > upper_bound)
+    
+    def _score_mask(self, column: str, center: float, scale: float, threshold: float,
+                    factor: Optional[float] = None) -> pd.Series:
+        """
+        Rows of the current data with ``|factor * (x - center) / scale| > threshold``.
+        """
+        if self.engine == 'numpy':
+            values = self._column_engine(column).values(column)
+        else:
+            values = self._column_data(column)
+        scores = (values - center) / scale if factor is None else factor * (values - center) / scale
+        mask = np.abs(scores) > threshold
+        if self.engine == 'numpy':
+            return pd.Series(mask, index=self._row_index(), name=column)
+        return mask
+    
+    @staticmethod
+    def _resolve_n_jobs(n_jobs: Optional[int]) -> int:
+        """
+        Number of worker threads for ``n_jobs`` (None means 1, -1 means all CPUs).
+        """
+        if n_jobs is None:
+            return 1
+        if n_jobs == -1:
+            return os.cpu_count() or 1
+        if n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer, -1 or None")
+        return int(n_jobs)
+    
+    def _snapshot(self) -> 'StatClean':
+        """
+        Copy of the current rows for worker threads.
+        
+        The frame is a shallow copy (its own pandas container over the same
+        column buffers), so that columns rewritten by either side are
+        swapped in that side's frame only; the alive-rows mask and the
+        outlier info are private. The statistics cache is shared, so
+        statistics a worker computes are hits for this instance as long as
+        its rows and columns keep the same versions and contents. Tracked
+        incremental statistics are not shared (the calling thread updates
+        them); the snapshot builds its own.
+        """
+        clone = copy_module.copy(self)
+        clone._clean_df = self._clean_df.copy(deep=False)
+        clone.outlier_info = {}
+        clone._column_versions = dict(self._column_versions)
+        clone._buffers = dict(self._buffers)
+        clone._engine_columns = dict(self._engine_columns)
+        clone._summaries = {}
+        if self._alive is not None:
+            clone._alive = self._alive.copy()
+        return clone
+    
+    def _adopt_summary(self, column: str, summary: SortedColumnStatistics, snapshot: 'StatClean',
+                       frame: pd.DataFrame) -> None:
+        """
+        Track a summary built by a worker on a snapshot of the rows.
+        
+        ``frame`` is the physical frame the snapshot was taken from. Rows
+        removed here but not in the snapshot are queued for removal, so the
+        summary equals one built now; it is dropped if the frame was
+        replaced or the column changed since.
+        """
+        if (column in self._summaries or self._clean_df is not frame
+                or self._column_version(column) != snapshot._column_versions.get(column, 0)):
+            return
+        if self._alive is not None:
+            alive = snapshot._alive
+            removed = ~self._alive if alive is None else alive & ~self._alive
+            summary.remove(np.flatnonzero(removed))
+        self._summaries[column] = summary
+    
+    def _run_columns(self, columns: List[str], step: Callable[['StatClean', str], Any],
+                     n_jobs: Optional[int] = None, progress: Optional[Any] = None,
+                     sequential: bool = True, tracked: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Apply ``step(cleaner, column)`` to each column in order.
+        
+        With ``sequential=False`` the columns are cleaned against the same
+        rows (see ``_run_columns_on_snapshot``). Otherwise steps run in the
+        calling thread, in order, so results, printed messages, warnings and
+        instrumentation events are those of the serial loop. The only work
+        that stays valid across the removals of earlier steps is building
+        the sorted statistics of ``incremental=True`` (rows removed later are
+        applied to them incrementally), so with several workers and
+        ``incremental=True`` a thread pool sorts the upcoming ``tracked``
+        columns (those whose steps read these statistics) on a snapshot of
+        the rows. In every other case no pool is started.
+        
+        Returns:
+        --------
+        list of dict
+            ``outlier_info`` of each column right after its step
+        """
+        if not sequential:
+            return self._run_columns_on_snapshot(columns, step, n_jobs, progress)
+        workers = self._resolve_n_jobs(n_jobs)
+        ahead = []
+        if workers > 1 and self.incremental and tracked:
+            ahead = [column for column in dict.fromkeys(columns[1:])
+                     if column in tracked and column not in self._summaries]
+        
+        def build(snapshot, column):
+            with np.errstate(all='ignore'):
+                try:
+                    return snapshot._column_summary(column)
+                except Exception:
+                    # The step reports the error in order
+                    return None
+        
+        infos = []
+        futures = {}
+        with contextlib.ExitStack() as stack:
+            if ahead:
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=min(workers, len(ahead))))
+                snapshot, frame = self._snapshot(), self._clean_df
+                futures = {column: pool.submit(build, snapshot, column) for column in ahead}
+            try:
+                for column in columns:
+                    future = futures.pop(column, None)
+                    if future is not None:
+                        summary = future.result()
+                        if summary is not None:
+                            self._adopt_summary(column, summary, snapshot, frame)
+                    step(self, column)
+                    infos.append(self.outlier_info[column])
+                    if progress is not None:
+                        progress.update(1)
+            finally:
+                # Do not wait for work that will not be used (on errors)
+                for pending in futures.values():
+                    pending.cancel()
+        return infos
+    
+    def _run_columns_on_snapshot(self, columns: List[str], step: Callable[['StatClean', str], Any],
+                                 n_jobs: Optional[int] = None,
+                                 progress: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        Clean every column against the current rows, then combine the results (``sequential=False``).
+        
+        Each step runs on its own deferred snapshot of the current rows, in a
+        thread pool when ``n_jobs`` allows, so analyses and masks of all
+        columns are computed independently. Then, in column order, each
+        column's instrumentation events are dispatched, its ``outlier_info``
+        recorded and its capped values written, and the rows it flagged are
+        OR-ed into one mask, removed once at the end. A row flagged by
+        several columns therefore counts in each of their ``outlier_info``.
+        Messages and warnings of the steps are emitted by the worker threads
+        as they occur.
+        
+        Returns:
+        --------
+        list of dict
+            ``outlier_info`` of each column
+        """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        # Apply pending removals so every snapshot shares one physical frame
+        frame = self.clean_df
+        depth = instrumentation.current_depth()
+        
+        def run(column):
+            clone = self._snapshot()
+            clone.deferred = True
+            events = []
+            with instrumentation.redirect(events, depth):
+                step(clone, column)
+            return clone, events
+        
+        workers = min(self._resolve_n_jobs(n_jobs), len(columns))
+        with contextlib.ExitStack() as stack:
+            if workers > 1:
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                results = list(pool.map(run, columns))
+            else:
+                results = [run(column) for column in columns]
+        
+        removed = np.zeros(len(frame), dtype=bool)
+        infos = []
+        for column, (clone, events) in zip(columns, results):
+            for _, event in events:
+                instrumentation.dispatch(event)
+            if clone._alive is not None:
+                removed |= ~clone._alive
+            if clone._column_versions.get(column) != self._column_versions.get(column):
+                # Winsorized: the clone's frame holds the capped column
+                self._set_column(column, clone._clean_df[column])
+            elif column in clone._summaries:
+                self._adopt_summary(column, clone._summaries[column], clone, frame)
+            self.outlier_info[column] = clone.outlier_info[column]
+            infos.append(self.outlier_info[column])
+            if progress is not None:
+                progress.update(1)
+        if removed.any():
+            self._drop_rows(removed)
+        return infos
+    
     # Statistical utility methods
+    def _buffer_ref(self, column: str) -> Callable[[], Any]:
+        """
+        Weak reference to the array holding a column of ``_clean_df``.
+        
+        For NumPy-backed columns this is the base array of the pandas block
+        (several columns may share it), for extension types the extension
+        array. It stays the same object until the column or frame is replaced.
+        """
+        buffer = self._clean_df[column].values
+        while isinstance(buffer, np.ndarray) and isinstance(buffer.base, np.ndarray):
+            buffer = buffer.base
+        try:
+            return weakref.ref(buffer)
+        except TypeError:
+            return lambda: buffer
+    
+    def _column_version(self, column: str) -> int:
+        """
+        Version of a column, bumped here when its buffer was replaced outside StatClean.
+        
+        An O(1) identity check: assigning a new column or frame through
+        ``clean_df`` is caught, writes into the existing buffer are not (see
+        ``invalidate``).
+        """
+        seen = self._buffers.get(column)
+        current = self._buffer_ref(column)
+        if seen is None or seen() is None or seen() is not current():
+            if seen is not None:
+                self._column_versions[column] = new_version()
+                self._summaries.pop(column, None)
+            self._buffers[column] = current
+        return self._column_versions.get(column, 0)
+    
+    def _check_buffers(self) -> None:
+        """
+        Bump the versions of tracked columns replaced since they were last seen.
+        
+        Called before StatClean itself swaps the frame for one holding the
+        same data, which then only needs ``_track_buffers``.
+        """
+        for column in list(self._buffers):
+            if column in self._clean_df.columns:
+                self._column_version(column)
+    
+    def _track_buffers(self, columns: List[str]) -> None:
+        """
+        Record the current buffers of ``columns`` without bumping their versions.
+        """
+        self._buffers = {column: self._buffer_ref(column) for column in columns
+                         if column in self._clean_df.columns}
+    
+    def _stats_key(self, column: str, kind: Any) -> Tuple[Any, ...]:
+        """
+        Cache key of a statistic of the current version of a column.
+        """
+        return (column, self._row_version, self._column_version(column), self.engine, kind)
+    
+    def _cached_statistic(self, column: str, kind: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Statistic ``kind`` of the current column data, computed by ``compute`` on a cache miss.
+        """
+        return self._stats_cache.get_or_compute(self._stats_key(column, kind), compute)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Statistics cache counters.
+        
+        Returns:
+        --------
+        dict
+            'hits', 'misses', 'size' (entries held) and 'maxsize'
+        """
+        return self._stats_cache.info()
+    
+    def invalidate(self, column: Optional[str] = None) -> 'StatClean':
+        """
+        Discard cached and tracked statistics after writing into ``clean_df`` in place.
+        
+        StatClean's own methods, and replacing the frame or a column through
+        ``clean_df``, are tracked automatically. Writes into an existing
+        column (``clean_df.loc[rows, 'x'] = value``, ``.iloc``, NumPy views)
+        are not and must be followed by this call.
+        
+        Parameters:
+        -----------
+        column : str, optional
+            The column that was modified. If None, all columns.
+            
+        Returns:
+        --------
+        StatClean
+            Self for method chaining
+        """
+        if column is None:
+            self._row_version = new_version()
+            self._summaries = {}
+        else:
+            self._column_versions[column] = new_version()
+            self._summaries.pop(column, None)
+        return self
+    
     def _calculate_iqr_bounds(self, column: str, lower_factor: Optional[float] = None, 
-                             upper_factor: Optional[float] = None) -> Tuple[float, float, Dict[str, float]]:
+                             upper_factor: Optional[float] = None,
+                             approximate: bool = False) -> Tuple[float, float, Dict[str, float]]:
         """
         Calculate IQR bounds for outlier detection.
         
+        With ``approximate=True`` the quartiles come from a KLL sketch instead
+        of an exact quantile over the full column.
+        
         Returns:
         --------
         tuple
             (lower_bound, upper_bound, stats_dict)
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
         lower_factor = lower_factor or self._default_thresholds['iqr_lower_factor']
         upper_factor = upper_factor or self._default_thresholds['iqr_upper_factor']
         
-        Q1 = self.clean_df[column].quantile(0.25)
-        Q3 = self.clean_df[column].quantile(0.75)
+        def quartiles():
+            if self.incremental:
+                return tuple(self._column_summary(column).quantiles([0.25, 0.75]))
+            if self.engine == 'numpy':
+                column_stats = self._column_engine(column).statistics(column, 'iqr')
+                return column_stats['Q1'], column_stats['Q3']
+            data = self._column_data(column)
+            return data.quantile(0.25), data.quantile(0.75)
+        
+        if approximate:
+            Q1, Q3 = self.build_sketch(column).quantiles([0.25, 0.75])
+        else:
+            Q1, Q3 = self._cached_statistic(column, 'quartiles', quartiles)
         IQR = Q3 - Q1
         
         lower_bound = Q1 - (lower_factor * IQR)
@@ -146,19 +812,21 @@ class StatClean:
         tuple
             (mean, std, threshold)
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
         threshold = threshold or self._default_thresholds['zscore_threshold']
         
-        # Use cached stats if available
-        if hasattr(self, '_stats_cache') and column in self._stats_cache:
-            mean = self._stats_cache[column]['mean']
-            std = self._stats_cache[column]['std']
-        else:
-            mean = self.clean_df[column].mean()
-            std = self.clean_df[column].std()
+        def moments():
+            if self.incremental:
+                return self._column_summary(column).mean_std()
+            if self.engine == 'numpy':
+                column_stats = self._column_engine(column).statistics(column, 'zscore')
+                return column_stats['mean'], column_stats['std']
+            data = self._column_data(column)
+            return data.mean(), data.std()
         
+        mean, std = self._cached_statistic(column, 'mean_std', moments)
         return mean, std, threshold
     
     def _calculate_modified_zscore_stats(self, column: str, threshold: Optional[float] = None) -> Tuple[float, float, float]:
@@ -170,16 +838,248 @@ class StatClean:
         tuple
             (median, mad, threshold)
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
         threshold = threshold or self._default_thresholds['modified_zscore_threshold']
         
-        median = self.clean_df[column].median()
-        mad = stats.median_abs_deviation(self.clean_df[column])
+        def robust_scale():
+            if self.incremental:
+                return self._column_summary(column).median_mad()
+            if self.engine == 'numpy':
+                column_stats = self._column_engine(column).statistics(column, 'modified_zscore')
+                return column_stats['median'], column_stats['mad']
+            data = self._column_data(column)
+            return data.median(), stats.median_abs_deviation(data)
         
+        median, mad = self._cached_statistic(column, 'median_mad', robust_scale)
         return median, mad, threshold
     
+    def build_sketch(self, column: str, epsilon: Optional[float] = None) -> KLLSketch:
+        """
+        Build a mergeable KLL quantile sketch of a column.
+        
+        Sketches of the same column built on different partitions (or in
+        different processes) can be combined with ``KLLSketch.merge`` to get
+        global quantile bounds without holding or sorting all the data.
+        
+        Parameters:
+        -----------
+        column : str
+            The name of the column to summarize
+        epsilon : float, optional
+            Rank error bound. Uses the ``sketch_epsilon`` default if None.
+            
+        Returns:
+        --------
+        KLLSketch
+            Sketch of the column's non-missing values
+        """
+        self._validate_column(column)
+        epsilon = epsilon or self._default_thresholds['sketch_epsilon']
+        values = self._column_data(column).to_numpy(dtype=float, na_value=np.nan)
+        # Fixed seed so that repeated calls give the same bounds
+        return KLLSketch.from_values(values, epsilon, random_state=0,
+                                     chunk_size=_kernels.DEFAULT_CHUNK_SIZE)
+    
+    def _block_statistics(self, columns: List[str], approximate: bool = False
+                          ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Compute quartiles, means, stds, medians and MADs for several columns at once.
+        
+        With ``approximate=True`` the block is not sorted: quartiles and medians
+        come from per-column KLL sketches and the MAD is not computed (NaN).
+        Exact statistics are cached per column, and only the columns without
+        a cache entry for their current version are sorted.
+        
+        Returns:
+        --------
+        tuple
+            (values, stats) where ``values`` is the 2D float block of the columns
+            and ``stats`` maps statistic names to arrays aligned with ``columns``
+        """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        
+        values = self._columns_data(columns).to_numpy(dtype=float, na_value=np.nan)
+        if not approximate:
+            if not columns:
+                return values, _kernels.column_statistics(values)
+            keys = [self._stats_key(column, 'block') for column in columns]
+            entries = [self._stats_cache.get(key) for key in keys]
+            missing = [j for j, entry in enumerate(entries) if entry is None]
+            if missing:
+                block = values if len(missing) == len(columns) else values[:, missing]
+                computed = _kernels.column_statistics(block)
+                for i, j in enumerate(missing):
+                    entries[j] = {name: column_values[i] for name, column_values in computed.items()}
+                    self._stats_cache.put(keys[j], entries[j])
+            return values, {name: np.array([entry[name] for entry in entries]) for name in entries[0]}
+        
+        epsilon = self._default_thresholds['sketch_epsilon']
+        quartiles = np.array([
+            KLLSketch.from_values(values[:, j], epsilon, random_state=0,
+                                  chunk_size=_kernels.DEFAULT_CHUNK_SIZE).quantiles([0.25, 0.5, 0.75])
+            for j in range(values.shape[1])
+        ]).reshape(values.shape[1], 3)
+        count = np.sum(~np.isnan(values), axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+        return values, {
+            'count': count, 'mean': mean, 'std': std,
+            'Q1': quartiles[:, 0], 'median': quartiles[:, 1], 'Q3': quartiles[:, 2],
+            'IQR': quartiles[:, 2] - quartiles[:, 0], 'mad': np.full(values.shape[1], np.nan)
+        }
+    
+    @staticmethod
+    def _check_not_approximate(approximate: bool) -> None:
+        if approximate:
+            raise ValueError("approximate=True is not supported together with by=")
+    
+    def _group_statistics(self, column: str, by: Union[str, List[str]], method: str,
+                          lower_factor: Optional[float] = None, upper_factor: Optional[float] = None,
+                          threshold: Optional[float] = None,
+                          lower_percentile: Optional[float] = None,
+                          upper_percentile: Optional[float] = None
+                          ) -> Tuple[pd.Series, np.ndarray, np.ndarray, pd.DataFrame]:
+        """
+        Per-group outlier statistics for one column, broadcast back to rows.
+        
+        Each statistic comes from a single grouped aggregation over integer
+        group codes (two for the MAD), rather than one StatClean per group.
+        Groups are treated like the global methods treat a whole column: a
+        zero or NaN scale flags nothing, and the MAD is NaN for groups with
+        missing values. Rows with a missing group key are never flagged.
+        
+        Returns:
+        --------
+        tuple
+            (outlier_mask, lower_bounds, upper_bounds, group_stats) where the
+            bounds are per-row arrays (NaN where no bound applies) and
+            ``group_stats`` has one row per group, indexed by the group keys
+        """
+        codes, keys = self._group_codes(by)
+        data = self._column_data(column)
+        values = data.to_numpy(dtype=float, na_value=np.nan)
+        valid = codes >= 0
+        valid_codes = codes[valid]
+        grouped = pd.Series(values[valid]).groupby(valid_codes)
+        group_range = pd.RangeIndex(len(keys))
+        
+        def per_group(result: pd.Series) -> np.ndarray:
+            return result.reindex(group_range).to_numpy(dtype=float, na_value=np.nan)
+        
+        def per_row(stat: np.ndarray) -> np.ndarray:
+            out = np.full(len(values), np.nan)
+            out[valid] = stat[valid_codes]
+            return out
+        
+        def quantiles(qs: List[float]) -> pd.DataFrame:
+            return grouped.quantile(qs).unstack().reindex(index=group_range, columns=qs)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if method == 'iqr':
+                lower_factor = lower_factor or self._default_thresholds['iqr_lower_factor']
+                upper_factor = upper_factor or self._default_thresholds['iqr_upper_factor']
+                quartiles = quantiles([0.25, 0.75])
+                Q1 = quartiles[0.25].to_numpy(dtype=float)
+                Q3 = quartiles[0.75].to_numpy(dtype=float)
+                IQR = Q3 - Q1
+                group_stats = {'Q1': Q1, 'Q3': Q3, 'IQR': IQR,
+                               'lower_bound': Q1 - lower_factor * IQR,
+                               'upper_bound': Q3 + upper_factor * IQR}
+            elif method == 'percentile':
+                bounds = quantiles([lower_percentile / 100.0, upper_percentile / 100.0])
+                group_stats = {'lower_bound': bounds.iloc[:, 0].to_numpy(dtype=float),
+                               'upper_bound': bounds.iloc[:, 1].to_numpy(dtype=float)}
+            elif method == 'zscore':
+                threshold = threshold or self._default_thresholds['zscore_threshold']
+                mean = per_group(grouped.mean())
+                std = per_group(grouped.std())
+                scale = np.where(std > 0, std, np.nan)
+                group_stats = {'mean': mean, 'std': std,
+                               'lower_bound': mean - threshold * scale,
+                               'upper_bound': mean + threshold * scale}
+            elif method == 'modified_zscore':
+                threshold = threshold or self._default_thresholds['modified_zscore_threshold']
+                median = per_group(grouped.median())
+                deviations = pd.Series(np.abs(values[valid] - median[valid_codes])).groupby(valid_codes)
+                has_missing = per_group(grouped.count()) < per_group(grouped.size())
+                mad = np.where(has_missing, np.nan, per_group(deviations.median()))
+                scale = np.where(mad > 0, mad, np.nan)
+                group_stats = {'median': median, 'mad': mad,
+                               'lower_bound': median - threshold * scale / 0.6745,
+                               'upper_bound': median + threshold * scale / 0.6745}
+            else:
+                raise ValueError(f"Unknown method '{method}'")
+            
+            lower = per_row(group_stats['lower_bound'])
+            upper = per_row(group_stats['upper_bound'])
+            if method == 'zscore':
+                mask = np.abs((values - per_row(mean)) / per_row(scale)) > threshold
+            elif method == 'modified_zscore':
+                mask = np.abs(0.6745 * (values - per_row(median)) / per_row(scale)) > threshold
+            else:
+                mask = (values < lower) | (values > upper)
+        
+        group_stats = pd.DataFrame(group_stats, index=keys)
+        group_stats.insert(0, 'count', per_group(grouped.count()).astype(np.int64))
+        group_stats['num_outliers'] = np.bincount(codes[mask], minlength=len(keys))
+        return pd.Series(mask, index=data.index), lower, upper, group_stats
+    
+    def _remove_grouped(self, column: str, by: Union[str, List[str]], method: str,
+                        outlier_mask: pd.Series, group_stats: pd.DataFrame, **details: Any) -> 'StatClean':
+        """
+        Drop rows flagged by per-group thresholds and record the removal.
+        """
+        outlier_index = self._drop_rows(outlier_mask)
+        num_outliers = len(outlier_index)
+        
+        self.outlier_info[column] = {
+            'method': method,
+            'column': column,
+            'by': by,
+            **details,
+            'group_stats': group_stats,
+            'num_outliers': num_outliers,
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index)
+        }
+        return self
+    
+    def _winsorize_grouped(self, column: str, by: Union[str, List[str]], method: str, label: str,
+                           **params: Any) -> 'StatClean':
+        """
+        Cap values at per-group bounds and record the winsorization.
+        """
+        frame = self.clean_df
+        outlier_mask, lower, upper, group_stats = self._group_statistics(column, by, method, **params)
+        values = frame[column].to_numpy(dtype=float, na_value=np.nan)
+        
+        with np.errstate(invalid='ignore'):
+            lower_mask = values < lower
+            upper_mask = values > upper
+        # NaN bounds (missing keys, degenerate groups) leave values untouched
+        self._set_column(column, frame[column].clip(lower, upper))
+        
+        num_winsorized = int(outlier_mask.sum())
+        
+        self.outlier_info[column] = {
+            'method': label,
+            'column': column,
+            'by': by,
+            **params,
+            'group_stats': group_stats,
+            'num_winsorized': num_winsorized,
+            'num_winsorized_lower': int(lower_mask.sum()),
+            'num_winsorized_upper': int(upper_mask.sum()),
+            'percent_winsorized': (num_winsorized / len(frame)) * 100,
+            'winsorized_indices': _kernels.compact_index_array(frame.index[outlier_mask.to_numpy()])
+        }
+        return self
+    
     # Formal statistical testing methods
     def grubbs_test(self, column: str, alpha: float = 0.05, two_sided: bool = True) -> Dict[str, Any]:
         """
@@ -207,7 +1107,7 @@ class StatClean:
             - 'method': 'Grubbs test'
         """
         self._validate_column(column)
-        data = self.clean_df[column].dropna()
+        data = self._column_data(column).dropna()
         n = len(data)
         
         if n < 3:
@@ -239,16 +1139,10 @@ class StatClean:
         G = max_z
         
         # Critical value calculation
-        t_val = t.ppf(1 - alpha/(2*n if two_sided else n), n-2)
-        critical_value = ((n-1) / np.sqrt(n)) * np.sqrt(t_val**2 / (n-2 + t_val**2))
+        critical_value = float(_kernels.grubbs_critical_values(n, alpha, two_sided))
         
         # P-value calculation (approximate)
-        if two_sided:
-            p_value = n * (1 - t.cdf(G * np.sqrt((n-2)/(n-1-G**2)), n-2))
-        else:
-            p_value = (n/2) * (1 - t.cdf(G * np.sqrt((n-2)/(n-1-G**2)), n-2))
-        
-        p_value = min(p_value, 1.0)  # Ensure p-value doesn't exceed 1
+        p_value = float(_kernels.grubbs_p_values(G, n, two_sided))
         
         is_outlier = G > critical_value
         
@@ -264,6 +1158,80 @@ class StatClean:
             'n_observations': n
         }
     
+    def generalized_esd_test(self, column: str, max_outliers: int = 10, alpha: float = 0.05,
+                             two_sided: bool = True) -> Dict[str, Any]:
+        """
+        Perform the generalized ESD test (iterative Grubbs) for up to ``max_outliers`` outliers.
+
+        The column is sorted once and the most extreme remaining value is peeled
+        off at each step while the mean and variance of the remaining sample are
+        updated incrementally, so the whole test runs in O(n log n + k) instead
+        of calling ``grubbs_test`` k times.
+
+        Parameters:
+        -----------
+        column : str
+            The name of the column to test
+        max_outliers : int, default=10
+            Upper bound on the number of outliers to test for
+        alpha : float, default=0.05
+            Significance level for the test
+        two_sided : bool, default=True
+            Whether to use two-sided (True) or one-sided (False) critical values
+
+        Returns:
+        --------
+        dict
+            Dictionary containing test results:
+            - 'num_outliers': Number of outliers found
+            - 'outlier_indices': Index labels of the outliers, in removal order
+            - 'outlier_values': Values of the outliers, in removal order
+            - 'is_outlier': Boolean indicating if any outlier was found
+            - 'steps': DataFrame of per-step statistic, critical value, p-value,
+              tested value and index, and the mean/std of the sample tested
+            - 'method': 'Generalized ESD test'
+        """
+        self._validate_column(column)
+        data = self._column_data(column).dropna()
+        n = len(data)
+
+        if n < 3:
+            raise ValueError("Generalized ESD test requires at least 3 observations")
+        if not 1 <= max_outliers <= n - 2:
+            raise ValueError(f"max_outliers must be between 1 and {n - 2} for {n} observations")
+
+        values = data.to_numpy(dtype=float)
+        order = np.argsort(values, kind='mergesort')
+        result = _kernels.generalized_esd(values[order], max_outliers, alpha, two_sided)
+
+        rows = order[result['position']]
+        labels = data.index[rows]
+        num_outliers = result['num_outliers']
+        steps = pd.DataFrame({
+            'step': np.arange(1, max_outliers + 1),
+            'n': result['n'],
+            'statistic': result['statistic'],
+            'critical_value': result['critical_value'],
+            'p_value': _kernels.grubbs_p_values(result['statistic'], result['n'], two_sided),
+            'value': values[rows],
+            'index': labels,
+            'mean': result['mean'],
+            'std': result['std'],
+        })
+        steps['is_significant'] = steps['statistic'] > steps['critical_value']
+
+        return {
+            'num_outliers': num_outliers,
+            'outlier_indices': _kernels.compact_index_array(labels[:num_outliers]),
+            'outlier_values': values[rows[:num_outliers]],
+            'is_outlier': num_outliers > 0,
+            'steps': steps,
+            'method': 'Generalized ESD test',
+            'alpha': alpha,
+            'max_outliers': max_outliers,
+            'n_observations': n
+        }
+
     def dixon_q_test(self, column: str, alpha: float = 0.05) -> Dict[str, Any]:
         """
         Perform Dixon's Q-test for outliers (suitable for small samples, n < 30).
@@ -281,7 +1249,7 @@ class StatClean:
             Dictionary containing test results similar to Grubbs' test
         """
         self._validate_column(column)
-        data = self.clean_df[column].dropna().sort_values()
+        data = self._column_data(column).dropna().sort_values()
         n = len(data)
         
         if n < 3:
@@ -290,13 +1258,7 @@ class StatClean:
             warnings.warn("Dixon's Q-test is designed for small samples (n < 30). Consider using Grubbs' test.")
         
         # Critical values table for Dixon's Q-test (5% significance level)
-        critical_values = {
-            3: 0.970, 4: 0.829, 5: 0.710, 6: 0.625, 7: 0.568, 8: 0.526,
-            9: 0.493, 10: 0.466, 11: 0.444, 12: 0.426, 13: 0.410, 14: 0.396,
-            15: 0.384, 16: 0.374, 17: 0.365, 18: 0.356, 19: 0.349, 20: 0.342,
-            21: 0.337, 22: 0.331, 23: 0.326, 24: 0.321, 25: 0.317, 26: 0.312,
-            27: 0.308, 28: 0.305, 29: 0.301, 30: 0.290
-        }
+        critical_values = _kernels.DIXON_CRITICAL_VALUES
         
         if n not in critical_values:
             raise ValueError(f"Critical values not available for n={n}")
@@ -338,11 +1300,98 @@ class StatClean:
             'Q_high': Q_high
         }
     
+    def grouped_outlier_tests(self, column: str, by: Union[str, List[str]],
+                              tests: Optional[List[str]] = None, alpha: float = 0.05,
+                              two_sided: bool = True) -> pd.DataFrame:
+        """
+        Run Grubbs' test and Dixon's Q-test for every group of ``by`` at once.
+        
+        Equivalent to calling ``grubbs_test`` / ``dixon_q_test`` on each group,
+        but all groups are sorted in one pass and the statistics are computed
+        with vectorized group-wise reductions. Critical values are looked up in
+        tables cached by (n, alpha, sidedness).
+        
+        Parameters:
+        -----------
+        column : str
+            The name of the column to test
+        by : str or list of str
+            Column(s) defining the groups; rows with a missing key are ignored
+        tests : list of str, optional
+            Tests to run, any of 'grubbs' and 'dixon'. Defaults to both.
+        alpha : float, default=0.05
+            Significance level for Grubbs' test (Dixon uses the 5% table)
+        two_sided : bool, default=True
+            Whether Grubbs' test is two-sided
+            
+        Returns:
+        --------
+        pandas.DataFrame
+            Tidy frame with one row per group and test: the group key
+            column(s), 'test', 'n', 'statistic', 'critical_value', 'p_value',
+            'is_outlier', 'outlier_value' and 'outlier_index'. Groups with fewer
+            than 3 observations have NaN statistics and ``is_outlier=False``;
+            Dixon results are NaN for groups outside its table (n > 30).
+        """
+        self._validate_column(column)
+        tests = ['grubbs', 'dixon'] if tests is None else list(tests)
+        invalid = [name for name in tests if name not in ('grubbs', 'dixon')]
+        if invalid:
+            raise ValueError(f"Unknown test(s) {invalid}. Choose from 'grubbs', 'dixon'")
+        
+        codes, keys = self._group_codes(by)
+        data = self._column_data(column)
+        values = data.to_numpy(dtype=float, na_value=np.nan)
+        valid = (codes >= 0) & ~np.isnan(values)
+        rows = np.flatnonzero(valid)
+        result = _kernels.grouped_extreme_tests(values[rows], codes[rows], len(keys), alpha, two_sided)
+        
+        def outlier_columns(position: np.ndarray) -> Dict[str, Any]:
+            found = position >= 0
+            source = rows[np.where(found, position, 0)]
+            return {
+                'outlier_value': np.where(found, values[source], np.nan),
+                'outlier_index': pd.Series(data.index[source], dtype=object).where(found, None).to_numpy()
+            }
+        
+        frames = []
+        for name in tests:
+            if name == 'grubbs':
+                statistic = result['grubbs_statistic']
+                critical = result['grubbs_critical']
+                p_value = result['grubbs_p_value']
+                position = result['grubbs_position']
+            else:
+                statistic = result['dixon_statistic']
+                critical = result['dixon_critical']
+                # Simplified p-value, as in dixon_q_test
+                p_value = np.where(statistic > critical, alpha, 1 - alpha)
+                p_value[np.isnan(critical) | np.isnan(statistic)] = np.nan
+                position = result['dixon_position']
+            with np.errstate(invalid='ignore'):
+                is_outlier = statistic > critical
+            frame = keys.to_frame(index=False)
+            frame['test'] = name
+            frame['n'] = result['n']
+            frame['statistic'] = statistic
+            frame['critical_value'] = critical
+            frame['p_value'] = p_value
+            frame['is_outlier'] = is_outlier
+            for key, values_out in outlier_columns(position).items():
+                frame[key] = values_out
+            frame['_group'] = np.arange(len(keys))
+            frames.append(frame)
+        
+        results = pd.concat(frames, ignore_index=True)
+        results = results.sort_values('_group', kind='stable').drop(columns='_group')
+        return results.reset_index(drop=True)
+    
     # Configuration methods
     def set_thresholds(self, iqr_lower_factor: Optional[float] = None, 
                       iqr_upper_factor: Optional[float] = None,
                       zscore_threshold: Optional[float] = None,
-                      modified_zscore_threshold: Optional[float] = None) -> 'StatClean':
+                      modified_zscore_threshold: Optional[float] = None,
+                      sketch_epsilon: Optional[float] = None) -> 'StatClean':
         """
         Set default thresholds for outlier detection methods.
         
@@ -356,6 +1405,8 @@ class StatClean:
             Threshold for Z-score method
         modified_zscore_threshold : float, optional
             Threshold for Modified Z-score method
+        sketch_epsilon : float, optional
+            Rank error bound of the quantile sketches used with approximate=True
             
         Returns:
         --------
@@ -370,6 +1421,10 @@ class StatClean:
             self._default_thresholds['zscore_threshold'] = zscore_threshold
         if modified_zscore_threshold is not None:
             self._default_thresholds['modified_zscore_threshold'] = modified_zscore_threshold
+        if sketch_epsilon is not None:
+            if not 0 < sketch_epsilon < 1:
+                raise ValueError("sketch_epsilon must be between 0 and 1")
+            self._default_thresholds['sketch_epsilon'] = sketch_epsilon
         
         return self
     
@@ -385,55 +1440,200 @@ class StatClean:
         return self._default_thresholds.copy()
     
     # Outlier detection methods (non-destructive)
+    @instrumented
     def detect_outliers_iqr(self, column: str, lower_factor: Optional[float] = None, 
-                           upper_factor: Optional[float] = None) -> pd.Series:
+                           upper_factor: Optional[float] = None, by: Optional[Union[str, List[str]]] = None,
+                           approximate: bool = False) -> pd.Series:
         """
         Detect outliers using IQR method without removing them.
         
+        Pass ``by`` to compute the quartiles per segment (e.g. per store), or
+        ``approximate=True`` to estimate them with a quantile sketch.
+        
         Returns:
         --------
         pandas.Series
             Boolean mask where True indicates outliers
         """
         self._validate_column(column)
-        lower_bound, upper_bound, _ = self._calculate_iqr_bounds(column, lower_factor, upper_factor)
-        return (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
+        if by is not None:
+            self._check_not_approximate(approximate)
+            return self._group_statistics(column, by, 'iqr', lower_factor, upper_factor)[0]
+        lower_bound, upper_bound, _ = self._calculate_iqr_bounds(column, lower_factor, upper_factor, approximate)
+        return self._bounds_mask(column, lower_bound, upper_bound)
     
-    def detect_outliers_zscore(self, column: str, threshold: Optional[float] = None) -> pd.Series:
+    @instrumented
+    def detect_outliers_zscore(self, column: str, threshold: Optional[float] = None,
+                               by: Optional[Union[str, List[str]]] = None) -> pd.Series:
         """
         Detect outliers using Z-score method without removing them.
         
+        Pass ``by`` to compute the mean and std per segment.
+        
         Returns:
         --------
         pandas.Series
             Boolean mask where True indicates outliers
         """
         self._validate_column(column)
+        if by is not None:
+            return self._group_statistics(column, by, 'zscore', threshold=threshold)[0]
         mean, std, threshold = self._calculate_zscore_stats(column, threshold)
         
         if std == 0 or pd.isna(std):
-            return pd.Series(False, index=self.clean_df.index)
+            return pd.Series(False, index=self._row_index())
         
-        z_scores = np.abs((self.clean_df[column] - mean) / std)
-        return z_scores > threshold
+        return self._score_mask(column, mean, std, threshold)
     
-    def detect_outliers_modified_zscore(self, column: str, threshold: Optional[float] = None) -> pd.Series:
+    @instrumented
+    def detect_outliers_modified_zscore(self, column: str, threshold: Optional[float] = None,
+                                        by: Optional[Union[str, List[str]]] = None) -> pd.Series:
         """
         Detect outliers using Modified Z-score method without removing them.
         
+        Pass ``by`` to compute the median and MAD per segment.
+        
         Returns:
         --------
         pandas.Series
             Boolean mask where True indicates outliers
         """
         self._validate_column(column)
+        if by is not None:
+            return self._group_statistics(column, by, 'modified_zscore', threshold=threshold)[0]
         median, mad, threshold = self._calculate_modified_zscore_stats(column, threshold)
         
         if mad == 0:
-            return pd.Series(False, index=self.clean_df.index)
+            return pd.Series(False, index=self._row_index())
+        
+        return self._score_mask(column, median, mad, threshold, factor=0.6745)
+    
+    @staticmethod
+    def _check_not_iterative(iterate: bool, by: Optional[Union[str, List[str]]], approximate: bool = False) -> None:
+        if iterate and by is not None:
+            raise ValueError("iterate=True is not supported together with by=")
+        if iterate and approximate:
+            raise ValueError("iterate=True is not supported together with approximate=True")
+    
+    def _remove_iteratively(self, column: str, method: str, max_iterations: int,
+                            lower_factor: Optional[float] = None, upper_factor: Optional[float] = None,
+                            threshold: Optional[float] = None) -> 'StatClean':
+        """
+        Remove outliers of one column until the re-estimated bounds flag nothing.
+        
+        The column is sorted once (or its incremental statistics are reused),
+        so each iteration re-estimates the statistics in O(log n) steps, reads
+        only the sorted tails outside the new bounds and removes the flagged
+        rows from the statistics in O(k log n). Rows are dropped from the
+        cleaned data once, after the last iteration. Z-score outliers are
+        confirmed with the same score comparison as
+        ``detect_outliers_zscore``/``detect_outliers_modified_zscore``.
+        
+        Parameters:
+        -----------
+        column : str
+            The name of the column to clean
+        method : str
+            'iqr', 'zscore' or 'modified_zscore'
+        max_iterations : int
+            Maximum number of estimate-and-remove passes
+        lower_factor, upper_factor, threshold : float
+            Parameters of the method (already resolved)
+            
+        Returns:
+        --------
+        StatClean
+            Self for method chaining
+        """
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be a positive integer")
         
-        modified_zscores = 0.6745 * (self.clean_df[column] - median) / mad
-        return np.abs(modified_zscores) > threshold
+        if self.incremental:
+            # Physical positions in _clean_df
+            summary = self._column_summary(column)
+        else:
+            # Positions among the current rows
+            summary = SortedColumnStatistics(self._column_data(column).to_numpy(dtype=float, na_value=np.nan))
+        
+        removed = []
+        trace = []
+        converged = False
+        for iteration in range(1, max_iterations + 1):
+            summary.flush()
+            step: Dict[str, Any] = {'iteration': iteration, 'rows': summary.count + summary.nan_count}
+            if method == 'iqr':
+                Q1, Q3 = summary.quantiles([0.25, 0.75])
+                IQR = Q3 - Q1
+                lower_bound, upper_bound = Q1 - (lower_factor * IQR), Q3 + (upper_factor * IQR)
+                step.update({'Q1': Q1, 'Q3': Q3, 'lower_bound': lower_bound, 'upper_bound': upper_bound})
+                positions = summary.tail_positions(lower_bound, upper_bound)
+            else:
+                if method == 'zscore':
+                    center, scale = summary.mean_std()
+                    factor = None
+                    step.update({'mean': center, 'std': scale})
+                else:
+                    center, scale = summary.median_mad()
+                    factor = 0.6745
+                    step.update({'median': center, 'mad': scale})
+                if not scale > 0:
+                    step.update({'lower_bound': np.nan, 'upper_bound': np.nan, 'num_outliers': 0})
+                    trace.append(step)
+                    converged = True
+                    break
+                half_width = threshold * scale / (factor or 1.0)
+                step.update({'lower_bound': center - half_width, 'upper_bound': center + half_width})
+                positions = summary.score_positions(center, scale, threshold, factor)
+            
+            step['num_outliers'] = len(positions)
+            trace.append(step)
+            if len(positions) == 0:
+                converged = True
+                break
+            summary.remove(positions)
+            removed.append(positions)
+        
+        n_positions = len(self._clean_df) if self.incremental else self._n_rows()
+        flags = np.zeros(n_positions, dtype=bool)
+        for positions in removed:
+            flags[positions] = True
+        if self.incremental and self._alive is not None:
+            flags = flags[self._alive]
+        outlier_index = self._drop_rows(flags)
+        num_outliers = len(outlier_index)
+        
+        last = trace[-1]
+        outlier_info = {'column': column}
+        if method == 'iqr':
+            outlier_info.update({
+                'method': 'IQR',
+                'Q1': last['Q1'],
+                'Q3': last['Q3'],
+                'IQR': last['Q3'] - last['Q1'],
+                'lower_bound': last['lower_bound'],
+                'upper_bound': last['upper_bound'],
+                'num_outliers': num_outliers,
+                'num_outliers_below': int((self.original_df[column] < last['lower_bound']).sum()),
+                'num_outliers_above': int((self.original_df[column] > last['upper_bound']).sum()),
+            })
+        else:
+            if num_outliers == 0 and method == 'zscore' and not last['std'] > 0:
+                warnings.warn(f"Column '{column}' has zero or NaN standard deviation. No outliers detected.")
+            elif num_outliers == 0 and method == 'modified_zscore' and not last['mad'] > 0:
+                warnings.warn(f"Column '{column}' has zero or NaN MAD. No outliers detected.")
+            if method == 'zscore':
+                outlier_info.update({'method': 'Z-score', 'mean': last['mean'], 'std': last['std']})
+            else:
+                outlier_info.update({'method': 'Modified Z-score', 'median': last['median'], 'mad': last['mad']})
+            outlier_info.update({'threshold': threshold, 'num_outliers': num_outliers})
+        outlier_info.update({
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index),
+            'iterations': trace,
+            'converged': converged
+        })
+        self.outlier_info[column] = outlier_info
+        return self
     
     def _validate_column(self, column: str) -> None:
         """
@@ -444,14 +1644,14 @@ class StatClean:
         ValueError
             If column doesn't exist or isn't numeric
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
-        if column not in self.clean_df.columns:
-            available_cols = ", ".join(self.clean_df.columns.tolist())
+        if column not in self._clean_df.columns:
+            available_cols = ", ".join(self._clean_df.columns.tolist())
             raise ValueError(f"Column '{column}' not found in DataFrame. Available columns: {available_cols}")
         
-        if not pd.api.types.is_numeric_dtype(self.clean_df[column]):
+        if not pd.api.types.is_numeric_dtype(self._clean_df[column].dtype):
             raise ValueError(f"Column '{column}' must be numeric for outlier detection")
         
     def add_zscore_columns(self, columns: Optional[List[str]] = None, cache_stats: bool = True) -> 'StatClean':
@@ -464,24 +1664,22 @@ class StatClean:
         columns : list or None, default=None
             List of columns to calculate Z-scores for. If None, all numeric columns will be used.
         cache_stats : bool, default=True
-            Whether to cache mean and std for later use in outlier detection
+            Whether to take the mean and std from the statistics cache (and
+            store them there), so that Z-score detection on the unchanged
+            column reuses them
             
         Returns:
         --------
         StatClean
             Self for method chaining
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
             
         # If no columns specified, use all numeric columns
         if columns is None:
             columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
         
-        # Initialize stats cache if requested
-        if cache_stats and not hasattr(self, '_stats_cache'):
-            self._stats_cache: Dict[str, Dict[str, float]] = {}
-        
         # Process each column
         for col in columns:
             if col not in self.clean_df.columns:
@@ -494,19 +1692,18 @@ class StatClean:
             
             # Calculate Z-scores
             zscore_col = f"{col}_zscore"
-            col_mean = self.clean_df[col].mean()
-            col_std = self.clean_df[col].std()
-            
-            # Cache stats if requested
             if cache_stats:
-                self._stats_cache[col] = {'mean': col_mean, 'std': col_std}
+                col_mean, col_std, _ = self._calculate_zscore_stats(col)
+            else:
+                col_mean = self.clean_df[col].mean()
+                col_std = self.clean_df[col].std()
             
             # Handle zero standard deviation
             if col_std == 0 or pd.isna(col_std):
                 warnings.warn(f"Column '{col}' has zero or NaN standard deviation. Setting Z-scores to 0.")
-                self.clean_df[zscore_col] = 0.0
+                self._set_column(zscore_col, 0.0)
             else:
-                self.clean_df[zscore_col] = (self.clean_df[col] - col_mean) / col_std
+                self._set_column(zscore_col, (self.clean_df[col] - col_mean) / col_std)
         
         return self
         
@@ -527,7 +1724,7 @@ class StatClean:
         dict
             Information about outliers removed from each column
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
         # Find all columns with Z-scores
@@ -544,7 +1741,10 @@ class StatClean:
         
         return self.clean_df, self.outlier_info
         
-    def remove_outliers_iqr(self, column: str, lower_factor: Optional[float] = None, upper_factor: Optional[float] = None) -> 'StatClean':
+    @instrumented
+    def remove_outliers_iqr(self, column: str, lower_factor: Optional[float] = None, upper_factor: Optional[float] = None,
+                            by: Optional[Union[str, List[str]]] = None, approximate: bool = False,
+                            iterate: bool = False, max_iterations: int = 20) -> 'StatClean':
         """
         Remove outliers from a DataFrame column using the IQR method.
         
@@ -556,6 +1756,22 @@ class StatClean:
             The factor to multiply the IQR by for the lower bound. Uses default if None.
         upper_factor : float, optional
             The factor to multiply the IQR by for the upper bound. Uses default if None.
+        by : str or list of str, optional
+            Column(s) defining segments; when given, quartiles and bounds are computed per
+            segment from grouped aggregations and applied to that segment's rows
+        approximate : bool, default=False
+            Estimate the quartiles with a mergeable quantile sketch (rank error
+            ``sketch_epsilon``, see ``set_thresholds``) instead of exact quantiles
+        iterate : bool, default=False
+            Re-estimate the quartiles on the remaining rows and remove again until
+            no more outliers are found (a fixed point) or ``max_iterations`` is
+            reached; this counters masking by extreme values. The column is
+            sorted once and each iteration only reads the shrinking tails. The
+            per-iteration trace is stored in ``outlier_info[column]['iterations']``
+            and ``outlier_info[column]['converged']``; the other statistics are
+            those of the last iteration
+        max_iterations : int, default=20
+            Maximum number of passes with ``iterate=True``
             
         Returns:
         --------
@@ -567,11 +1783,11 @@ class StatClean:
         ValueError
             If no DataFrame is set, column doesn't exist, or factors are negative
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
-        if column not in self.clean_df.columns:
-            available_cols = ", ".join(self.clean_df.columns.tolist())
+        if column not in self._clean_df.columns:
+            available_cols = ", ".join(self._clean_df.columns.tolist())
             raise ValueError(f"Column '{column}' not found in DataFrame. Available columns: {available_cols}")
         
         lower_factor = lower_factor or self._default_thresholds['iqr_lower_factor']
@@ -580,22 +1796,37 @@ class StatClean:
         if lower_factor < 0 or upper_factor < 0:
             raise ValueError("Factors must be non-negative values")
         
-        if not pd.api.types.is_numeric_dtype(self.clean_df[column]):
+        if not pd.api.types.is_numeric_dtype(self._clean_df[column].dtype):
             raise ValueError(f"Column '{column}' must be numeric for outlier detection")
-            
-        # Use utility method to calculate bounds
-        lower_bound, upper_bound, stats = self._calculate_iqr_bounds(column, lower_factor, upper_factor)
         
-        # Identify outliers
-        outlier_mask = (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
-        outliers = self.clean_df[outlier_mask]
+        self._check_not_iterative(iterate, by, approximate)
+        if iterate:
+            return self._remove_iteratively(column, 'iqr', max_iterations,
+                                            lower_factor=lower_factor, upper_factor=upper_factor)
+            
+        if by is not None:
+            self._check_not_approximate(approximate)
+            outlier_mask, lower, upper, group_stats = self._group_statistics(
+                column, by, 'iqr', lower_factor, upper_factor)
+            values = self._column_data(column).to_numpy(dtype=float, na_value=np.nan)
+            with np.errstate(invalid='ignore'):
+                below = int((values < lower).sum())
+                above = int((values > upper).sum())
+            return self._remove_grouped(column, by, 'IQR', outlier_mask, group_stats,
+                                        lower_factor=lower_factor, upper_factor=upper_factor,
+                                        num_outliers_below=below, num_outliers_above=above)
         
-        # Create a clean DataFrame without outliers
-        self.clean_df = self.clean_df[~outlier_mask].copy()
+        # Use utility method to calculate bounds
+        lower_bound, upper_bound, stats = self._calculate_iqr_bounds(column, lower_factor, upper_factor, approximate)
         
-        # Reset index if not preserving
-        if not self.preserve_index:
-            self.clean_df.reset_index(drop=True, inplace=True)
+        # Identify and remove outliers (incremental mode reads only the sorted tails)
+        if self.incremental:
+            positions = self._column_summary(column).tail_positions(lower_bound, upper_bound)
+            outlier_index = self._drop_positions(positions)
+        else:
+            outlier_mask = self._bounds_mask(column, lower_bound, upper_bound)
+            outlier_index = self._drop_rows(outlier_mask)
+        num_outliers = len(outlier_index)
         
         # Prepare outlier information
         if self.original_df is None:
@@ -609,11 +1840,11 @@ class StatClean:
             'IQR': stats['IQR'],
             'lower_bound': lower_bound,
             'upper_bound': upper_bound,
-            'num_outliers': len(outliers),
-            'num_outliers_below': len(self.original_df[self.original_df[column] < lower_bound]),
-            'num_outliers_above': len(self.original_df[self.original_df[column] > upper_bound]),
-            'percent_removed': (len(outliers) / len(self.original_df)) * 100,
-            'outlier_indices': outliers.index.tolist()
+            'num_outliers': num_outliers,
+            'num_outliers_below': int((self.original_df[column] < lower_bound).sum()),
+            'num_outliers_above': int((self.original_df[column] > upper_bound).sum()),
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index)
         }
         
         # Store outlier information
@@ -621,7 +1852,10 @@ class StatClean:
         
         return self
     
-    def remove_outliers_zscore(self, column: str, threshold: Optional[float] = None) -> 'StatClean':
+    @instrumented
+    def remove_outliers_zscore(self, column: str, threshold: Optional[float] = None,
+                               by: Optional[Union[str, List[str]]] = None,
+                               iterate: bool = False, max_iterations: int = 20) -> 'StatClean':
         """
         Remove outliers from a DataFrame column using the Z-score method.
         If a Z-score column exists (column_zscore), it will use that instead of recalculating.
@@ -632,6 +1866,19 @@ class StatClean:
             The name of the column to clean
         threshold : float, optional
             The Z-score threshold above which to consider a point an outlier. Uses default if None.
+        by : str or list of str, optional
+            Column(s) defining segments; when given, the mean and std are computed per
+            segment from grouped aggregations and applied to that segment's rows
+        iterate : bool, default=False
+            Re-estimate the mean and std on the remaining rows and remove again until
+            no more outliers are found (a fixed point) or ``max_iterations`` is
+            reached; this counters masking by extreme values. The column is
+            sorted once and each iteration only reads the shrinking tails. The
+            per-iteration trace is stored in ``outlier_info[column]['iterations']``
+            and ``outlier_info[column]['converged']``; the other statistics are
+            those of the last iteration
+        max_iterations : int, default=20
+            Maximum number of passes with ``iterate=True``
             
         Returns:
         --------
@@ -643,11 +1890,11 @@ class StatClean:
         ValueError
             If no DataFrame is set, column doesn't exist, or threshold is negative
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
-        if column not in self.clean_df.columns:
-            available_cols = ", ".join(self.clean_df.columns.tolist())
+        if column not in self._clean_df.columns:
+            available_cols = ", ".join(self._clean_df.columns.tolist())
             raise ValueError(f"Column '{column}' not found in DataFrame. Available columns: {available_cols}")
         
         threshold = threshold or self._default_thresholds['zscore_threshold']
@@ -655,14 +1902,27 @@ class StatClean:
         if threshold <= 0:
             raise ValueError("Threshold must be a positive value")
         
-        if not pd.api.types.is_numeric_dtype(self.clean_df[column]):
+        if not pd.api.types.is_numeric_dtype(self._clean_df[column].dtype):
             raise ValueError(f"Column '{column}' must be numeric for outlier detection")
         
-        # Use detection method
-        outlier_mask = self.detect_outliers_zscore(column, threshold)
+        self._check_not_iterative(iterate, by)
+        if iterate:
+            return self._remove_iteratively(column, 'zscore', max_iterations, threshold=threshold)
+        
+        if by is not None:
+            outlier_mask, _, _, group_stats = self._group_statistics(column, by, 'zscore', threshold=threshold)
+            return self._remove_grouped(column, by, 'Z-score', outlier_mask, group_stats, threshold=threshold)
+        
+        # Identify and remove outliers (incremental mode reads only the sorted tails)
+        if self.incremental:
+            mean, std, _ = self._calculate_zscore_stats(column, threshold)
+            outlier_index = self._drop_positions(self._column_summary(column).score_positions(mean, std, threshold))
+        else:
+            outlier_mask = self.detect_outliers_zscore(column, threshold)
+            outlier_index = self._drop_rows(outlier_mask) if outlier_mask.any() else self._row_index()[:0]
         
         # If no outliers detected, record info and warn only when std is degenerate
-        if not outlier_mask.any():
+        if len(outlier_index) == 0:
             mean, std, _ = self._calculate_zscore_stats(column, threshold)
             if std == 0 or pd.isna(std):
                 warnings.warn(f"Column '{column}' has zero or NaN standard deviation. No outliers detected.")
@@ -674,19 +1934,11 @@ class StatClean:
                 'threshold': threshold,
                 'num_outliers': 0,
                 'percent_removed': 0.0,
-                'outlier_indices': []
+                'outlier_indices': _kernels.compact_index_array(outlier_index)
             }
             return self
         
-        # Get outliers
-        outliers = self.clean_df[outlier_mask]
-        
-        # Create a clean DataFrame without outliers
-        self.clean_df = self.clean_df[~outlier_mask].copy()
-        
-        # Reset index if not preserving
-        if not self.preserve_index:
-            self.clean_df.reset_index(drop=True, inplace=True)
+        num_outliers = len(outlier_index)
         
         # Prepare outlier information
         if self.original_df is None:
@@ -700,9 +1952,9 @@ class StatClean:
             'mean': mean,
             'std': std,
             'threshold': threshold,
-            'num_outliers': len(outliers),
-            'percent_removed': (len(outliers) / len(self.original_df)) * 100,
-            'outlier_indices': outliers.index.tolist()
+            'num_outliers': num_outliers,
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index)
         }
         
         # Store outlier information
@@ -710,10 +1962,14 @@ class StatClean:
         
         return self
     
-    def get_outlier_stats(self, columns: Optional[List[str]] = None, methods: List[str] = ['iqr', 'zscore'], iqr_factor: float = 1.5, zscore_threshold: float = 3.0, include_indices: bool = False) -> pd.DataFrame:
+    def get_outlier_stats(self, columns: Optional[List[str]] = None, methods: List[str] = ['iqr', 'zscore'], iqr_factor: float = 1.5, zscore_threshold: float = 3.0, include_indices: bool = False,
+                          approximate: bool = False) -> pd.DataFrame:
         """
         Get comprehensive statistics about potential outliers without removing them.
         
+        Quartiles, means and standard deviations are computed once for all
+        requested columns and shared by every method.
+        
         Parameters:
         -----------
         columns : list or None, default=None
@@ -726,13 +1982,16 @@ class StatClean:
             The Z-score threshold for the Z-score method
         include_indices : bool, default=False
             Whether to include outlier indices in the output
+        approximate : bool, default=False
+            Estimate quartiles with mergeable quantile sketches instead of
+            sorting the columns
             
         Returns:
         --------
         pandas.DataFrame
             A DataFrame containing outlier statistics for each column and method
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         if self.clean_df.empty:
             raise ValueError("DataFrame is empty. Cannot analyze outliers.")
@@ -741,60 +2000,67 @@ class StatClean:
         if columns is None:
             columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
             
-        stats_data = []
-        
+        numeric_columns = []
         for column in columns:
             if not np.issubdtype(self.clean_df[column].dtype, np.number):
                 print(f"Warning: Column '{column}' is not numeric. Skipping.")
                 continue
-                
+            numeric_columns.append(column)
+        
+        # All statistics come from a few reductions over one 2D block
+        values, block_stats = self._block_statistics(numeric_columns, approximate)
+        masks = {}
+        if 'iqr' in methods:
+            masks['iqr'] = _kernels.outlier_mask_block(values, block_stats, 'iqr',
+                                                       lower_factor=iqr_factor, upper_factor=iqr_factor)
+        if 'zscore' in methods:
+            masks['zscore'] = _kernels.outlier_mask_block(values, block_stats, 'zscore',
+                                                          threshold=zscore_threshold)
+            # Prefer precomputed Z-score columns, as add_zscore_columns() intends
+            for j, column in enumerate(numeric_columns):
+                zscore_col = f"{column}_zscore"
+                if zscore_col in self.clean_df.columns:
+                    masks['zscore'][:, j] = (np.abs(self.clean_df[zscore_col]) > zscore_threshold).to_numpy()
+        
+        n_rows = len(self.clean_df)
+        index = self.clean_df.index
+        stats_data = []
+        
+        for j, column in enumerate(numeric_columns):
             for method in methods:
                 if method == 'iqr':
-                    # Calculate IQR statistics
-                    Q1 = self.clean_df[column].quantile(0.25)
-                    Q3 = self.clean_df[column].quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - (iqr_factor * IQR)
-                    upper_bound = Q3 + (iqr_factor * IQR)
-                    
-                    outlier_mask = (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
-                    outlier_indices = self.clean_df[outlier_mask].index.tolist() if include_indices else None
+                    outlier_mask = masks['iqr'][:, j]
+                    num_outliers = int(outlier_mask.sum())
+                    Q1 = block_stats['Q1'][j]
+                    Q3 = block_stats['Q3'][j]
+                    IQR = block_stats['IQR'][j]
                     
                     stats_data.append({
                         'Column': column,
                         'Method': 'IQR',
-                        'Potential Outliers': outlier_mask.sum(),
-                        'Percent Outliers': (outlier_mask.sum() / len(self.clean_df)) * 100,
-                        'Lower Bound': lower_bound,
-                        'Upper Bound': upper_bound,
+                        'Potential Outliers': num_outliers,
+                        'Percent Outliers': (num_outliers / n_rows) * 100,
+                        'Lower Bound': Q1 - (iqr_factor * IQR),
+                        'Upper Bound': Q3 + (iqr_factor * IQR),
                         'Q1': Q1,
                         'Q3': Q3,
                         'IQR': IQR,
-                        'Outlier Indices': outlier_indices if include_indices else None
+                        'Outlier Indices': _kernels.compact_index_array(index[outlier_mask]) if include_indices else None
                     })
                 
                 elif method == 'zscore':
-                    # Calculate Z-score statistics
-                    zscore_col = f"{column}_zscore"
-                    if zscore_col in self.clean_df.columns:
-                        z_scores = np.abs(self.clean_df[zscore_col])
-                    else:
-                        mean = self.clean_df[column].mean()
-                        std = self.clean_df[column].std()
-                        z_scores = np.abs((self.clean_df[column] - mean) / std)
-                    
-                    outlier_mask = z_scores > zscore_threshold
-                    outlier_indices = self.clean_df[outlier_mask].index.tolist() if include_indices else None
+                    outlier_mask = masks['zscore'][:, j]
+                    num_outliers = int(outlier_mask.sum())
                     
                     stats_data.append({
                         'Column': column,
                         'Method': 'Z-score',
-                        'Potential Outliers': outlier_mask.sum(),
-                        'Percent Outliers': (outlier_mask.sum() / len(self.clean_df)) * 100,
+                        'Potential Outliers': num_outliers,
+                        'Percent Outliers': (num_outliers / n_rows) * 100,
                         'Threshold': zscore_threshold,
-                        'Mean': self.clean_df[column].mean(),
-                        'Std': self.clean_df[column].std(),
-                        'Outlier Indices': outlier_indices if include_indices else None
+                        'Mean': block_stats['mean'][j],
+                        'Std': block_stats['std'][j],
+                        'Outlier Indices': _kernels.compact_index_array(index[outlier_mask]) if include_indices else None
                     })
         
         # Convert to DataFrame
@@ -860,9 +2126,10 @@ class StatClean:
                 f"Available columns are:\n{available_cols}"
             )
 
+        plt, sns = _plotting_modules()
         figures = {}
         for column in resolved_columns:
-            if not pd.api.types.is_numeric_dtype(self.clean_df[column]):
+            if not pd.api.types.is_numeric_dtype(self._clean_df[column].dtype):
                 print(f"Warning: Skipping non-numeric column '{column}'")
                 continue
             
@@ -910,76 +2177,58 @@ class StatClean:
             {
                 'column_name': {
                     'agreement_percentage': float,  # % of points where methods agree
-                    'common_outliers': list,  # indices flagged by all methods
+                    'common_outliers': ndarray,  # indices flagged by all methods
                     'method_specific_outliers': {  # indices unique to each method
-                        'iqr': list,
-                        'zscore': list
+                        'iqr': ndarray,
+                        'zscore': ndarray
                     },
                     'summary': str  # Text summary of the comparison
                 }
             }
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
             
         # Default methods if not provided
         if methods is None:
             methods = ['iqr', 'zscore']
 
-        # Get outlier statistics
-        stats_df = self.get_outlier_stats(columns, methods, iqr_factor, zscore_threshold)
+        # Get outlier statistics together with the flagged indices of every method
+        stats_df = self.get_outlier_stats(columns, methods, iqr_factor, zscore_threshold, include_indices=True)
         comparison = {}
+        method_names = {'iqr': 'IQR', 'zscore': 'Z-score'}
         
         # Get unique columns from the stats DataFrame
-        unique_columns = stats_df['Column'].unique()
+        unique_columns = stats_df['Column'].unique() if 'Column' in stats_df.columns else []
         
         for column in unique_columns:
             comparison[column] = {}
             outliers_by_method = {}
             
             # Get outlier indices for each method
-            if 'iqr' in methods:
-                iqr_row = stats_df[(stats_df['Column'] == column) & (stats_df['Method'] == 'IQR')]
-                if not iqr_row.empty:
-                    Q1 = iqr_row['Q1'].iloc[0]
-                    Q3 = iqr_row['Q3'].iloc[0]
-                    IQR = iqr_row['IQR'].iloc[0]
-                    lower_bound = Q1 - (iqr_factor * IQR)
-                    upper_bound = Q3 + (iqr_factor * IQR)
-                    outlier_mask = (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
-                    outliers_by_method['iqr'] = set(self.clean_df[outlier_mask].index.tolist())
-            
-            if 'zscore' in methods:
-                zscore_row = stats_df[(stats_df['Column'] == column) & (stats_df['Method'] == 'Z-score')]
-                if not zscore_row.empty:
-                    zscore_col = f"{column}_zscore"
-                    if zscore_col in self.clean_df.columns:
-                        z_scores = np.abs(self.clean_df[zscore_col])
-                    else:
-                        mean = zscore_row['Mean'].iloc[0]
-                        std = zscore_row['Std'].iloc[0]
-                        z_scores = np.abs((self.clean_df[column] - mean) / std)
-                    outlier_mask = z_scores > zscore_threshold
-                    outliers_by_method['zscore'] = set(self.clean_df[outlier_mask].index.tolist())
+            for method in methods:
+                row = stats_df[(stats_df['Column'] == column) & (stats_df['Method'] == method_names.get(method))]
+                if not row.empty:
+                    outliers_by_method[method] = row['Outlier Indices'].iloc[0]
             
             # Find common outliers across all methods
             if len(methods) > 1:
-                common_outliers = set.intersection(*outliers_by_method.values())
+                common_outliers = reduce(np.intersect1d, outliers_by_method.values())
                 
                 # Calculate method-specific outliers
                 method_specific = {}
                 for method in methods:
                     if method in outliers_by_method:
-                        method_specific[method] = outliers_by_method[method] - common_outliers
+                        method_specific[method] = np.setdiff1d(outliers_by_method[method], common_outliers)
                 
                 # Calculate agreement percentage
-                all_outliers = set.union(*outliers_by_method.values())
-                agreement_percentage = (len(common_outliers) / len(all_outliers) * 100) if all_outliers else 100.0
+                all_outliers = reduce(np.union1d, outliers_by_method.values())
+                agreement_percentage = (len(common_outliers) / len(all_outliers) * 100) if len(all_outliers) else 100.0
                 
                 comparison[column] = {
                     'agreement_percentage': agreement_percentage,
-                    'common_outliers': sorted(list(common_outliers)),
-                    'method_specific_outliers': {m: sorted(list(s)) for m, s in method_specific.items()},
+                    'common_outliers': _kernels.compact_index_array(common_outliers),
+                    'method_specific_outliers': {m: _kernels.compact_index_array(v) for m, v in method_specific.items()},
                     'summary': f"""
                     Analysis for column '{column}':
                     - Total potential outliers: {len(all_outliers)}
@@ -993,8 +2242,8 @@ class StatClean:
                 method = methods[0]
                 comparison[column] = {
                     'agreement_percentage': 100.0,
-                    'common_outliers': sorted(list(outliers_by_method[method])),
-                    'method_specific_outliers': {method: []},
+                    'common_outliers': np.sort(outliers_by_method[method]),
+                    'method_specific_outliers': {method: outliers_by_method[method][:0]},
                     'summary': f"""
                     Analysis for column '{column}':
                     - Total outliers identified by {method}: {len(outliers_by_method[method])}
@@ -1003,7 +2252,8 @@ class StatClean:
         
         return comparison
         
-    def analyze_distribution(self, column: str) -> Dict[str, Any]:
+    @instrumented
+    def analyze_distribution(self, column: str, random_state: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze the distribution of a column and recommend the best outlier detection method.
         
@@ -1011,6 +2261,9 @@ class StatClean:
         -----------
         column : str
             The name of the column to analyze
+        random_state : int, optional
+            Seed for the 5000-row sample used by the Shapiro-Wilk test on
+            larger columns. Pass a value for reproducible recommendations.
             
         Returns:
         --------
@@ -1022,17 +2275,31 @@ class StatClean:
             - recommended method
             - recommended thresholds
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
-            
-        data = self.clean_df[column].dropna()
+        
+        # The result is random only when the Shapiro-Wilk test samples an unseeded subset
+        if random_state is None and self._n_rows() > 5000:
+            return self._analyze_series(self._column_data(column), random_state)
+        analysis = self._cached_statistic(column, ('distribution', random_state),
+                                          lambda: self._analyze_series(self._column_data(column), random_state))
+        return copy_module.deepcopy(analysis)
+    
+    @staticmethod
+    def _analyze_series(data: pd.Series, random_state: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Distribution analysis behind ``analyze_distribution``, on a column snapshot.
+        
+        Kept free of instance state so that it can run in worker threads.
+        """
+        data = data.dropna()
         
         # Calculate basic statistics
         skewness = data.skew()
         kurtosis = data.kurtosis()
         
         # Perform Shapiro-Wilk test for normality (handle large datasets)
-        sample = data.sample(min(len(data), 5000)) if len(data) > 0 else data
+        sample = data.sample(min(len(data), 5000), random_state=random_state) if len(data) > 0 else data
         _, p_value = stats.shapiro(sample)
         
         # Calculate robust statistics
@@ -1064,7 +2331,10 @@ class StatClean:
             'recommended_threshold': recommended_threshold
         }
         
-    def remove_outliers_modified_zscore(self, column: str, threshold: Optional[float] = None) -> 'StatClean':
+    @instrumented
+    def remove_outliers_modified_zscore(self, column: str, threshold: Optional[float] = None,
+                                        by: Optional[Union[str, List[str]]] = None,
+                                        iterate: bool = False, max_iterations: int = 20) -> 'StatClean':
         """
         Remove outliers using Modified Z-score method, which is more robust for skewed data.
         Uses Median Absolute Deviation (MAD) instead of standard deviation.
@@ -1075,6 +2345,19 @@ class StatClean:
             The name of the column to clean
         threshold : float, optional
             The modified Z-score threshold above which to consider a point an outlier. Uses default if None.
+        by : str or list of str, optional
+            Column(s) defining segments; when given, the median and MAD are computed per
+            segment from grouped aggregations and applied to that segment's rows
+        iterate : bool, default=False
+            Re-estimate the median and MAD on the remaining rows and remove again until
+            no more outliers are found (a fixed point) or ``max_iterations`` is
+            reached; this counters masking by extreme values. The column is
+            sorted once and each iteration only reads the shrinking tails. The
+            per-iteration trace is stored in ``outlier_info[column]['iterations']``
+            and ``outlier_info[column]['converged']``; the other statistics are
+            those of the last iteration
+        max_iterations : int, default=20
+            Maximum number of passes with ``iterate=True``
             
         Returns:
         --------
@@ -1086,11 +2369,11 @@ class StatClean:
         ValueError
             If no DataFrame is set, column doesn't exist, or threshold is negative
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
         
-        if column not in self.clean_df.columns:
-            available_cols = ", ".join(self.clean_df.columns.tolist())
+        if column not in self._clean_df.columns:
+            available_cols = ", ".join(self._clean_df.columns.tolist())
             raise ValueError(f"Column '{column}' not found in DataFrame. Available columns: {available_cols}")
         
         threshold = threshold or self._default_thresholds['modified_zscore_threshold']
@@ -1098,14 +2381,30 @@ class StatClean:
         if threshold <= 0:
             raise ValueError("Threshold must be a positive value")
         
-        if not pd.api.types.is_numeric_dtype(self.clean_df[column]):
+        if not pd.api.types.is_numeric_dtype(self._clean_df[column].dtype):
             raise ValueError(f"Column '{column}' must be numeric for outlier detection")
         
-        # Use detection method
-        outlier_mask = self.detect_outliers_modified_zscore(column, threshold)
+        self._check_not_iterative(iterate, by)
+        if iterate:
+            return self._remove_iteratively(column, 'modified_zscore', max_iterations, threshold=threshold)
+        
+        if by is not None:
+            outlier_mask, _, _, group_stats = self._group_statistics(
+                column, by, 'modified_zscore', threshold=threshold)
+            return self._remove_grouped(column, by, 'Modified Z-score', outlier_mask, group_stats,
+                                        threshold=threshold)
+        
+        # Identify and remove outliers (incremental mode reads only the sorted tails)
+        if self.incremental:
+            median, mad, _ = self._calculate_modified_zscore_stats(column, threshold)
+            positions = self._column_summary(column).score_positions(median, mad, threshold, factor=0.6745)
+            outlier_index = self._drop_positions(positions)
+        else:
+            outlier_mask = self.detect_outliers_modified_zscore(column, threshold)
+            outlier_index = self._drop_rows(outlier_mask) if outlier_mask.any() else self._row_index()[:0]
         
         # If no outliers detected (due to zero MAD), return early
-        if not outlier_mask.any():
+        if len(outlier_index) == 0:
             median, mad, _ = self._calculate_modified_zscore_stats(column, threshold)
             print(f"Warning: MAD is zero for column '{column}'. No outliers detected.")
             self.outlier_info[column] = {
@@ -1116,19 +2415,11 @@ class StatClean:
                 'threshold': threshold,
                 'num_outliers': 0,
                 'percent_removed': 0.0,
-                'outlier_indices': []
+                'outlier_indices': _kernels.compact_index_array(outlier_index)
             }
             return self
         
-        # Get outliers
-        outliers = self.clean_df[outlier_mask]
-        
-        # Create a clean DataFrame without outliers
-        self.clean_df = self.clean_df[~outlier_mask].copy()
-        
-        # Reset index if not preserving
-        if not self.preserve_index:
-            self.clean_df.reset_index(drop=True, inplace=True)
+        num_outliers = len(outlier_index)
         
         # Prepare outlier information
         if self.original_df is None:
@@ -1142,9 +2433,9 @@ class StatClean:
             'median': median,
             'mad': mad,
             'threshold': threshold,
-            'num_outliers': len(outliers),
-            'percent_removed': (len(outliers) / len(self.original_df)) * 100,
-            'outlier_indices': outliers.index.tolist()
+            'num_outliers': num_outliers,
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index)
         }
         
         # Store outlier information
@@ -1153,15 +2444,35 @@ class StatClean:
         return self
     
     # Batch processing methods
-    def apply_cleaning_strategy(self, strategy: Dict[str, Dict[str, Any]]) -> 'StatClean':
+    @instrumented
+    def apply_cleaning_strategy(self, strategy: Dict[str, Dict[str, Any]], n_jobs: Optional[int] = None,
+                                random_state: Optional[int] = None, sequential: bool = True) -> 'StatClean':
         """
         Apply a custom cleaning strategy to multiple columns.
         
+        Columns are cleaned in the order of ``strategy``, each on the rows left
+        by the previous ones, so the result depends on that order (unless
+        ``sequential=False``).
+        
         Parameters:
         -----------
         strategy : dict
             Dictionary mapping column names to cleaning configurations.
             Format: {'column_name': {'method': 'iqr', 'threshold': 2.0, ...}}
+            Methods: 'iqr' (lower_factor, upper_factor), 'zscore' and
+            'modified_zscore' (threshold), 'winsorize_percentile'
+            (lower_percentile, upper_percentile; caps instead of removing)
+            and 'auto'
+        n_jobs : int, optional
+            Number of worker threads; -1 uses all CPUs. See ``clean_columns``.
+        random_state : int, optional
+            Seed passed to ``analyze_distribution`` for 'auto' columns, making
+            the chosen methods reproducible
+        sequential : bool, default=True
+            If False, every column is analyzed and cleaned against the rows
+            present at the call (in parallel with ``n_jobs``), and the rows
+            flagged by any column are removed at once, like
+            ``clean_file(sequential=False)``. See ``clean_columns``.
             
         Returns:
         --------
@@ -1177,38 +2488,79 @@ class StatClean:
         }
         cleaner.apply_cleaning_strategy(strategy)
         """
-        for column, config in strategy.items():
+        def clean_column(cleaner: 'StatClean', column: str) -> None:
+            config = strategy[column]
             method = config.get('method', 'auto')
             
             if method == 'iqr':
-                self.remove_outliers_iqr(column, 
-                                       lower_factor=config.get('lower_factor'),
-                                       upper_factor=config.get('upper_factor'))
+                cleaner.remove_outliers_iqr(column, 
+                                          lower_factor=config.get('lower_factor'),
+                                          upper_factor=config.get('upper_factor'))
             elif method == 'zscore':
-                self.remove_outliers_zscore(column, threshold=config.get('threshold'))
+                cleaner.remove_outliers_zscore(column, threshold=config.get('threshold'))
             elif method == 'modified_zscore':
-                self.remove_outliers_modified_zscore(column, threshold=config.get('threshold'))
+                cleaner.remove_outliers_modified_zscore(column, threshold=config.get('threshold'))
+            elif method == 'winsorize_percentile':
+                percentiles = {key: config[key] for key in ('lower_percentile', 'upper_percentile') if key in config}
+                cleaner.winsorize_outliers_percentile(column, **percentiles)
             elif method == 'auto':
-                analysis = self.analyze_distribution(column)
+                analysis = cleaner.analyze_distribution(column, random_state=random_state)
                 recommended_method = analysis['recommended_method']
                 recommended_threshold = analysis['recommended_threshold']
                 
                 if recommended_method == 'iqr':
-                    self.remove_outliers_iqr(column, 
-                                           lower_factor=recommended_threshold['lower_factor'],
-                                           upper_factor=recommended_threshold['upper_factor'])
+                    cleaner.remove_outliers_iqr(column, 
+                                              lower_factor=recommended_threshold['lower_factor'],
+                                              upper_factor=recommended_threshold['upper_factor'])
                 elif recommended_method == 'modified_zscore':
-                    self.remove_outliers_modified_zscore(column, threshold=recommended_threshold)
+                    cleaner.remove_outliers_modified_zscore(column, threshold=recommended_threshold)
                 else:
-                    self.remove_outliers_zscore(column, threshold=recommended_threshold)
-        
+                    cleaner.remove_outliers_zscore(column, threshold=recommended_threshold)
+        
+        # Columns with an unknown method are skipped
+        columns = [column for column, config in strategy.items()
+                   if config.get('method', 'auto') in ('iqr', 'zscore', 'modified_zscore',
+                                                       'winsorize_percentile', 'auto')]
+        # Percentile winsorizing does not read the incremental statistics
+        tracked = [column for column in columns if strategy[column].get('method', 'auto') != 'winsorize_percentile']
+        self._run_columns(columns, clean_column, n_jobs, sequential=sequential, tracked=tracked)
         return self
-    
+
+    def fit_plan(self, steps: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]) -> CleaningPlan:
+        """
+        Fit a reusable cleaning plan on the current data.
+
+        The steps run on a separate view of ``clean_df`` with this cleaner's
+        default thresholds; the cleaner itself is not modified. Apply the
+        result to new batches with ``plan.transform(df)``.
+
+        Parameters:
+        -----------
+        steps : list of dict or dict
+            Steps such as ``{'method': 'remove_outliers_iqr', 'column': 'a'}``
+            (any ``remove_outliers_*``, ``winsorize_outliers_*`` or
+            ``transform_*`` method with its keyword arguments), or a strategy
+            dict in the format of ``apply_cleaning_strategy``
+
+        Returns:
+        --------
+        CleaningPlan
+            Plan holding the fitted bounds, transform parameters and
+            Mahalanobis mean and precision matrix
+        """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        return CleaningPlan.fit(self.clean_df, steps, thresholds=self.get_thresholds())
+
+    @instrumented
     def detect_all_outliers(self, columns: Optional[List[str]] = None, 
                            methods: Optional[List[str]] = None) -> Dict[str, Dict[str, pd.Series]]:
         """
         Detect outliers in multiple columns using multiple methods without removing them.
         
+        Statistics for all columns are computed together from one 2D block, and
+        every column/method mask is derived from those shared results.
+        
         Parameters:
         -----------
         columns : list, optional
@@ -1221,28 +2573,53 @@ class StatClean:
         dict
             Nested dictionary: {column: {method: boolean_mask}}
         """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        
         if columns is None:
-            columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
+            columns = self._numeric_columns()
         
         if methods is None:
             methods = ['iqr', 'zscore', 'modified_zscore']
         
-        results = {}
         for column in columns:
-            results[column] = {}
-            for method in methods:
-                if method == 'iqr':
-                    results[column][method] = self.detect_outliers_iqr(column)
-                elif method == 'zscore':
-                    results[column][method] = self.detect_outliers_zscore(column)
-                elif method == 'modified_zscore':
-                    results[column][method] = self.detect_outliers_modified_zscore(column)
+            self._validate_column(column)
+        
+        values, block_stats = self._block_statistics(columns)
+        
+        # Use the mean/std detect_outliers_zscore() would (e.g. cached by add_zscore_columns())
+        for j, column in enumerate(columns):
+            moments = self._stats_cache.get(self._stats_key(column, 'mean_std'))
+            if moments is not None:
+                block_stats['mean'][j], block_stats['std'][j] = moments
+        
+        thresholds = self._default_thresholds
+        masks = {}
+        for method in methods:
+            if method == 'iqr':
+                masks[method] = _kernels.outlier_mask_block(values, block_stats, 'iqr',
+                                                            lower_factor=thresholds['iqr_lower_factor'],
+                                                            upper_factor=thresholds['iqr_upper_factor'])
+            elif method == 'zscore':
+                masks[method] = _kernels.outlier_mask_block(values, block_stats, 'zscore',
+                                                            threshold=thresholds['zscore_threshold'])
+            elif method == 'modified_zscore':
+                masks[method] = _kernels.outlier_mask_block(values, block_stats, 'modified_zscore',
+                                                            threshold=thresholds['modified_zscore_threshold'])
+        
+        index = self._row_index()
+        results = {}
+        for j, column in enumerate(columns):
+            results[column] = {method: pd.Series(mask[:, j], index=index, name=column)
+                               for method, mask in masks.items()}
         
         return results
     
     # Winsorizing methods (alternative to removal)
+    @instrumented
     def winsorize_outliers_iqr(self, column: str, lower_factor: Optional[float] = None, 
-                              upper_factor: Optional[float] = None) -> 'StatClean':
+                              upper_factor: Optional[float] = None, by: Optional[Union[str, List[str]]] = None,
+                              approximate: bool = False) -> 'StatClean':
         """
         Winsorize outliers using IQR method (cap values instead of removing).
         
@@ -1254,6 +2631,11 @@ class StatClean:
             The factor to multiply the IQR by for the lower bound
         upper_factor : float, optional  
             The factor to multiply the IQR by for the upper bound
+        by : str or list of str, optional
+            Column(s) defining segments; when given, quartiles and bounds are computed per
+            segment from grouped aggregations and applied to that segment's rows
+        approximate : bool, default=False
+            Estimate the quartiles with a mergeable quantile sketch
             
         Returns:
         --------
@@ -1261,14 +2643,18 @@ class StatClean:
             Self for method chaining
         """
         self._validate_column(column)
-        lower_bound, upper_bound, stats = self._calculate_iqr_bounds(column, lower_factor, upper_factor)
+        if by is not None:
+            self._check_not_approximate(approximate)
+            return self._winsorize_grouped(column, by, 'iqr', 'IQR Winsorizing',
+                                           lower_factor=lower_factor, upper_factor=upper_factor)
+        lower_bound, upper_bound, stats = self._calculate_iqr_bounds(column, lower_factor, upper_factor, approximate)
         
         # Identify outliers
         original_values = self.clean_df[column].copy()
         outlier_mask = (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
         
         # Winsorize (cap) the values
-        self.clean_df[column] = self.clean_df[column].clip(lower_bound, upper_bound)
+        self._set_column(column, self.clean_df[column].clip(lower_bound, upper_bound))
         
         # Track winsorization info
         num_winsorized = outlier_mask.sum()
@@ -1287,13 +2673,15 @@ class StatClean:
             'num_winsorized_lower': num_lower,
             'num_winsorized_upper': num_upper,
             'percent_winsorized': (num_winsorized / len(self.clean_df)) * 100,
-            'winsorized_indices': self.clean_df[outlier_mask].index.tolist()
+            'winsorized_indices': _kernels.compact_index_array(self.clean_df.index[outlier_mask.to_numpy()])
         }
         
         self.outlier_info[column] = winsorize_info
         return self
     
-    def winsorize_outliers_zscore(self, column: str, threshold: Optional[float] = None) -> 'StatClean':
+    @instrumented
+    def winsorize_outliers_zscore(self, column: str, threshold: Optional[float] = None,
+                                  by: Optional[Union[str, List[str]]] = None) -> 'StatClean':
         """
         Winsorize outliers using Z-score method (cap values instead of removing).
         
@@ -1303,6 +2691,9 @@ class StatClean:
             The name of the column to winsorize
         threshold : float, optional
             The Z-score threshold above which to winsorize values
+        by : str or list of str, optional
+            Column(s) defining segments; when given, the mean and std are computed per
+            segment from grouped aggregations and applied to that segment's rows
             
         Returns:
         --------
@@ -1310,6 +2701,8 @@ class StatClean:
             Self for method chaining
         """
         self._validate_column(column)
+        if by is not None:
+            return self._winsorize_grouped(column, by, 'zscore', 'Z-score Winsorizing', threshold=threshold)
         mean, std, threshold = self._calculate_zscore_stats(column, threshold)
         
         if std == 0 or pd.isna(std):
@@ -1324,7 +2717,7 @@ class StatClean:
         original_values = self.clean_df[column].copy()
         outlier_mask = (np.abs((self.clean_df[column] - mean) / std) > threshold)
         
-        self.clean_df[column] = self.clean_df[column].clip(lower_bound, upper_bound)
+        self._set_column(column, self.clean_df[column].clip(lower_bound, upper_bound))
         
         # Track winsorization info
         num_winsorized = outlier_mask.sum()
@@ -1339,14 +2732,16 @@ class StatClean:
             'upper_bound': upper_bound,
             'num_winsorized': num_winsorized,
             'percent_winsorized': (num_winsorized / len(self.clean_df)) * 100,
-            'winsorized_indices': self.clean_df[outlier_mask].index.tolist()
+            'winsorized_indices': _kernels.compact_index_array(self.clean_df.index[outlier_mask.to_numpy()])
         }
         
         self.outlier_info[column] = winsorize_info
         return self
     
+    @instrumented
     def winsorize_outliers_percentile(self, column: str, lower_percentile: float = 5.0, 
-                                    upper_percentile: float = 95.0) -> 'StatClean':
+                                    upper_percentile: float = 95.0, by: Optional[Union[str, List[str]]] = None,
+                                    approximate: bool = False) -> 'StatClean':
         """
         Winsorize outliers using percentile method.
         
@@ -1358,6 +2753,11 @@ class StatClean:
             Lower percentile for winsorization (0-100)
         upper_percentile : float, default=95.0
             Upper percentile for winsorization (0-100)
+        by : str or list of str, optional
+            Column(s) defining segments; when given, the percentiles are computed per
+            segment from grouped aggregations and applied to that segment's rows
+        approximate : bool, default=False
+            Estimate the percentiles with a mergeable quantile sketch
             
         Returns:
         --------
@@ -1369,15 +2769,25 @@ class StatClean:
         if not (0 <= lower_percentile < upper_percentile <= 100):
             raise ValueError("Percentiles must be between 0-100 and lower < upper")
         
+        if by is not None:
+            self._check_not_approximate(approximate)
+            return self._winsorize_grouped(column, by, 'percentile', 'Percentile Winsorizing',
+                                           lower_percentile=lower_percentile,
+                                           upper_percentile=upper_percentile)
+        
         # Calculate percentile bounds
-        lower_bound = self.clean_df[column].quantile(lower_percentile / 100.0)
-        upper_bound = self.clean_df[column].quantile(upper_percentile / 100.0)
+        if approximate:
+            lower_bound, upper_bound = self.build_sketch(column).quantiles(
+                [lower_percentile / 100.0, upper_percentile / 100.0])
+        else:
+            lower_bound = self.clean_df[column].quantile(lower_percentile / 100.0)
+            upper_bound = self.clean_df[column].quantile(upper_percentile / 100.0)
         
         # Identify and winsorize outliers
         original_values = self.clean_df[column].copy()
         outlier_mask = (self.clean_df[column] < lower_bound) | (self.clean_df[column] > upper_bound)
         
-        self.clean_df[column] = self.clean_df[column].clip(lower_bound, upper_bound)
+        self._set_column(column, self.clean_df[column].clip(lower_bound, upper_bound))
         
         # Track winsorization info
         num_winsorized = outlier_mask.sum()
@@ -1395,83 +2805,93 @@ class StatClean:
             'num_winsorized_lower': num_lower,
             'num_winsorized_upper': num_upper,
             'percent_winsorized': (num_winsorized / len(self.clean_df)) * 100,
-            'winsorized_indices': self.clean_df[outlier_mask].index.tolist()
+            'winsorized_indices': _kernels.compact_index_array(self.clean_df.index[outlier_mask.to_numpy()])
         }
         
         self.outlier_info[column] = winsorize_info
         return self
     
     # Multivariate outlier detection
-    def detect_outliers_mahalanobis(self, columns: Optional[List[str]] = None, 
-                                   chi2_threshold: Optional[float] = None,
-                                   use_shrinkage: bool = False) -> pd.Series:
+    def _fit_mahalanobis(self, columns: List[str], use_shrinkage: bool = False, robust: bool = False
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
         """
-        Detect multivariate outliers using Mahalanobis distance.
+        Estimate location and scatter for Mahalanobis distance on complete cases.
+        
+        With ``robust`` the location and scatter are the reweighted Minimum
+        Covariance Determinant estimate (FastMCD, fixed seed so results are
+        reproducible).
         
-        Parameters:
-        -----------
-        columns : list, optional
-            List of columns to include in multivariate analysis. 
-            If None, uses all numeric columns.
-        chi2_threshold : float, optional
-            Chi-square threshold for outlier detection.
-            If None, uses 97.5th percentile of chi-square distribution.
-            
         Returns:
         --------
-        pandas.Series
-            Boolean mask where True indicates outliers
+        tuple
+            (complete, values, mean, covariance, cholesky_factor, precision) where
+            ``complete`` is the boolean row mask of complete cases, ``values`` holds
+            those rows and exactly one of
+            ``cholesky_factor`` (positive definite covariance) or ``precision``
+            (inverse/pseudoinverse fallback) is set.
         """
-        if self.clean_df is None:
-            raise ValueError("No DataFrame has been set. Use set_data() first.")
-        
-        # Select columns
-        if columns is None:
-            columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
-        
         if len(columns) < 2:
             raise ValueError("Mahalanobis distance requires at least 2 numeric columns")
+        if robust and use_shrinkage:
+            raise ValueError("Choose either use_shrinkage or robust, not both")
         
         # Validate all columns exist and are numeric
         for col in columns:
-            if col not in self.clean_df.columns:
-                available_cols = ", ".join(self.clean_df.columns.tolist())
+            if col not in self._clean_df.columns:
+                available_cols = ", ".join(self._clean_df.columns.tolist())
                 raise ValueError(f"Column '{col}' not found in DataFrame. Available columns: {available_cols}")
-            if not pd.api.types.is_numeric_dtype(self.clean_df[col]):
+            if not pd.api.types.is_numeric_dtype(self._clean_df[col].dtype):
                 raise ValueError(f"Column '{col}' must be numeric for Mahalanobis distance")
         
         # Extract data and remove missing values
-        data = self.clean_df[columns].dropna()
-        if len(data) == 0:
+        values = self._columns_data(columns).to_numpy(dtype=float, na_value=np.nan)
+        complete = ~np.isnan(values).any(axis=1)
+        if not complete.all():
+            values = values[complete]
+        if len(values) == 0:
             raise ValueError("No complete cases available after removing missing values")
         
         n_features = len(columns)
-        n_samples = len(data)
+        n_samples = len(values)
         
         if n_samples <= n_features:
             raise ValueError(f"Need more observations ({n_samples}) than features ({n_features}) for Mahalanobis distance")
         
-        # Calculate mean and covariance matrix (optionally using shrinkage estimator)
+        factor = None
+        inv_cov_matrix = None
+        
+        # Calculate mean and covariance matrix (optionally using a shrinkage or robust estimator)
         try:
-            mean = data.mean()
-            if use_shrinkage:
+            if robust:
+                # Reweighted Minimum Covariance Determinant (FastMCD)
+                mean, cov_values, _ = fast_mcd(values, random_state=0)
+            else:
+                mean, cov_values = _kernels.location_and_scatter(values)
+            if robust:
+                factor = _kernels.covariance_factor(cov_values)
+                if factor is None:
+                    warnings.warn("Robust (MCD) covariance matrix is singular; using pseudoinverse (pinv) for Mahalanobis distance.")
+                    inv_cov_matrix = np.linalg.pinv(cov_values)
+            elif use_shrinkage:
                 try:
                     # Lazy import to avoid hard dependency
                     from sklearn.covariance import LedoitWolf  # type: ignore
-                    lw = LedoitWolf().fit(data.values)
-                    inv_cov_matrix = lw.precision_
+                    lw = LedoitWolf().fit(values)
                     cov_values = lw.covariance_
+                    factor = _kernels.covariance_factor(cov_values)
+                    if factor is None:
+                        inv_cov_matrix = lw.precision_
                 except Exception as e:
                     warnings.warn(f"Shrinkage covariance (Ledoit-Wolf) unavailable ({e}); falling back to sample covariance.")
-                    cov_values = data.cov().values
-                    try:
-                        inv_cov_matrix = np.linalg.inv(cov_values)
-                    except np.linalg.LinAlgError:
-                        warnings.warn("Covariance inversion failed; using pseudoinverse (pinv).")
-                        inv_cov_matrix = np.linalg.pinv(cov_values)
+                    factor = _kernels.covariance_factor(cov_values)
+                    if factor is None:
+                        try:
+                            inv_cov_matrix = np.linalg.inv(cov_values)
+                        except np.linalg.LinAlgError:
+                            warnings.warn("Covariance inversion failed; using pseudoinverse (pinv).")
+                            inv_cov_matrix = np.linalg.pinv(cov_values)
             else:
-                cov_values = data.cov().values
-                # Compute inverse or pseudoinverse with conditioning checks
+                # Factorize, or fall back to inverse/pseudoinverse with conditioning checks
                 try:
                     det = np.linalg.det(cov_values)
                 except Exception:
@@ -1480,11 +2900,13 @@ class StatClean:
                     warnings.warn("Covariance matrix is singular; using pseudoinverse (pinv) for Mahalanobis distance.")
                     inv_cov_matrix = np.linalg.pinv(cov_values)
                 else:
-                    try:
-                        inv_cov_matrix = np.linalg.inv(cov_values)
-                    except np.linalg.LinAlgError:
-                        warnings.warn("Covariance inversion failed; using pseudoinverse (pinv).")
-                        inv_cov_matrix = np.linalg.pinv(cov_values)
+                    factor = _kernels.covariance_factor(cov_values)
+                    if factor is None:
+                        try:
+                            inv_cov_matrix = np.linalg.inv(cov_values)
+                        except np.linalg.LinAlgError:
+                            warnings.warn("Covariance inversion failed; using pseudoinverse (pinv).")
+                            inv_cov_matrix = np.linalg.pinv(cov_values)
             # Warn on ill-conditioning
             try:
                 cond = np.linalg.cond(cov_values)
@@ -1495,15 +2917,56 @@ class StatClean:
         except Exception as e:
             raise ValueError(f"Could not compute covariance inverse: {e}")
         
-        # Calculate Mahalanobis distances
-        def mahalanobis_distance(row):
-            diff = row - mean
-            return np.sqrt(diff.T @ inv_cov_matrix @ diff)
+        return complete, values, mean, cov_values, factor, inv_cov_matrix
+    
+    @instrumented
+    def detect_outliers_mahalanobis(self, columns: Optional[List[str]] = None, 
+                                   chi2_threshold: Optional[float] = None,
+                                   use_shrinkage: bool = False,
+                                   chunk_size: Optional[int] = None,
+                                   robust: bool = False) -> pd.Series:
+        """
+        Detect multivariate outliers using Mahalanobis distance.
+        
+        Distances are computed in row blocks against a single Cholesky factor of
+        the covariance matrix, so memory stays bounded by ``chunk_size`` rows.
+        
+        Parameters:
+        -----------
+        columns : list, optional
+            List of columns to include in multivariate analysis. 
+            If None, uses all numeric columns.
+        chi2_threshold : float, optional
+            Chi-square threshold for outlier detection.
+            If None, uses 97.5th percentile of chi-square distribution.
+        use_shrinkage : bool, default=False
+            Use the Ledoit-Wolf shrinkage covariance (requires scikit-learn)
+        chunk_size : int, optional
+            Number of rows processed per block. Defaults to 65536.
+        robust : bool, default=False
+            Use the reweighted Minimum Covariance Determinant location and
+            covariance (FastMCD), which the outliers themselves cannot
+            inflate. Cannot be combined with ``use_shrinkage``.
+            
+        Returns:
+        --------
+        pandas.Series
+            Boolean mask where True indicates outliers
+        """
+        if self._clean_df is None:
+            raise ValueError("No DataFrame has been set. Use set_data() first.")
+        
+        # Select columns
+        if columns is None:
+            columns = self._numeric_columns()
         
-        mahal_distances = data.apply(mahalanobis_distance, axis=1)
+        complete, values, mean, _, factor, inv_cov_matrix = self._fit_mahalanobis(columns, use_shrinkage, robust)
+        n_features = len(columns)
         
-        # Convert to chi-square statistics (square of Mahalanobis distance)
-        chi2_stats = mahal_distances ** 2
+        # Squared Mahalanobis distances are chi-square distributed statistics
+        chi2_stats = _kernels.mahalanobis_squared(values, mean,
+                                                  factor=factor, precision=inv_cov_matrix,
+                                                  chunk_size=chunk_size)
         
         # Set threshold
         if chi2_threshold is None:
@@ -1513,14 +2976,17 @@ class StatClean:
             chi2_threshold = chi2.ppf(chi2_threshold, df=n_features)
         
         # Create boolean mask for all rows in the original dataframe
-        outlier_mask = pd.Series(False, index=self.clean_df.index)
-        outlier_mask.loc[data.index] = chi2_stats > chi2_threshold
+        flags = np.zeros(len(complete), dtype=bool)
+        flags[complete] = chi2_stats > chi2_threshold
         
-        return outlier_mask
+        return pd.Series(flags, index=self._row_index())
     
+    @instrumented
     def remove_outliers_mahalanobis(self, columns: Optional[List[str]] = None, 
                                    chi2_threshold: Optional[float] = None,
-                                   use_shrinkage: bool = False) -> 'StatClean':
+                                   use_shrinkage: bool = False,
+                                   chunk_size: Optional[int] = None,
+                                   robust: bool = False) -> 'StatClean':
         """
         Remove multivariate outliers using Mahalanobis distance.
         
@@ -1530,6 +2996,13 @@ class StatClean:
             List of columns to include in multivariate analysis
         chi2_threshold : float, optional
             Chi-square threshold for outlier detection
+        use_shrinkage : bool, default=False
+            Use the Ledoit-Wolf shrinkage covariance (requires scikit-learn)
+        chunk_size : int, optional
+            Number of rows processed per block when computing distances
+        robust : bool, default=False
+            Use the Minimum Covariance Determinant estimate (FastMCD) instead
+            of the sample mean and covariance
             
         Returns:
         --------
@@ -1537,18 +3010,15 @@ class StatClean:
             Self for method chaining
         """
         if columns is None:
-            columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
+            columns = self._numeric_columns()
         
         # Get outlier mask
-        outlier_mask = self.detect_outliers_mahalanobis(columns, chi2_threshold, use_shrinkage=use_shrinkage)
-        outliers = self.clean_df[outlier_mask]
+        outlier_mask = self.detect_outliers_mahalanobis(columns, chi2_threshold, use_shrinkage=use_shrinkage,
+                                                        chunk_size=chunk_size, robust=robust)
         
         # Remove outliers
-        self.clean_df = self.clean_df[~outlier_mask].copy()
-        
-        # Reset index if not preserving
-        if not self.preserve_index:
-            self.clean_df.reset_index(drop=True, inplace=True)
+        outlier_index = self._drop_rows(outlier_mask)
+        num_outliers = len(outlier_index)
         
         # Calculate threshold if not provided
         if chi2_threshold is None:
@@ -1563,9 +3033,10 @@ class StatClean:
             'columns': columns,
             'chi2_threshold': chi2_threshold,
             'degrees_of_freedom': len(columns),
-            'num_outliers': len(outliers),
-            'percent_removed': (len(outliers) / len(self.original_df)) * 100,
-            'outlier_indices': outliers.index.tolist()
+            'robust': robust,
+            'num_outliers': num_outliers,
+            'percent_removed': (num_outliers / len(self.original_df)) * 100,
+            'outlier_indices': _kernels.compact_index_array(outlier_index)
         }
         
         # Store info using first column name as key
@@ -1575,6 +3046,7 @@ class StatClean:
         return self
     
     # Data transformation methods
+    @instrumented
     def transform_boxcox(self, column: str, lambda_param: Optional[float] = None) -> Tuple['StatClean', Dict[str, Any]]:
         """
         Apply Box-Cox transformation to reduce skewness and make data more normal.
@@ -1613,12 +3085,12 @@ class StatClean:
                 # Apply to non-NA values only
                 transformed_full = data_to_transform.copy()
                 transformed_full[non_na_mask] = boxcox(data_to_transform[non_na_mask], lmbda=optimal_lambda)
-                self.clean_df[column] = transformed_full
+                self._set_column(column, transformed_full)
             else:
                 # Use specified lambda
                 transformed_full = data_to_transform.copy()
                 transformed_full[non_na_mask] = boxcox(data_to_transform[non_na_mask], lmbda=lambda_param)
-                self.clean_df[column] = transformed_full
+                self._set_column(column, transformed_full)
                 optimal_lambda = lambda_param
                 
         except Exception as e:
@@ -1640,6 +3112,7 @@ class StatClean:
         
         return self, transform_info
     
+    @instrumented
     def transform_log(self, column: str, base: str = 'natural') -> Tuple['StatClean', Dict[str, Any]]:
         """
         Apply logarithmic transformation to reduce right skewness.
@@ -1672,13 +3145,13 @@ class StatClean:
         
         # Apply transformation based on base
         if base == 'natural':
-            self.clean_df[column] = np.log(data_to_transform)
+            self._set_column(column, np.log(data_to_transform))
             base_used = math.e
         elif base == '10':
-            self.clean_df[column] = np.log10(data_to_transform)
+            self._set_column(column, np.log10(data_to_transform))
             base_used = 10
         elif base == '2':
-            self.clean_df[column] = np.log2(data_to_transform)
+            self._set_column(column, np.log2(data_to_transform))
             base_used = 2
         else:
             raise ValueError("Base must be 'natural', '10', or '2'")
@@ -1699,6 +3172,7 @@ class StatClean:
         
         return self, transform_info
     
+    @instrumented
     def transform_sqrt(self, column: str) -> Tuple['StatClean', Dict[str, Any]]:
         """
         Apply square root transformation to reduce right skewness.
@@ -1728,7 +3202,7 @@ class StatClean:
             shift = 0
         
         # Apply transformation
-        self.clean_df[column] = np.sqrt(data_to_transform)
+        self._set_column(column, np.sqrt(data_to_transform))
         
         # Calculate transformation statistics
         transformed_skewness = self.clean_df[column].skew()
@@ -1779,13 +3253,13 @@ class StatClean:
                     pass
                 
                 # Test Log
-                temp_cleaner.clean_df[column] = data.copy()
+                temp_cleaner._set_column(column, data.copy())
                 _, log_info = temp_cleaner.transform_log(column, 'natural')
                 recommendations.append(log_info)
                 
             if (data >= 0).all():
                 # Test Square root
-                temp_cleaner.clean_df[column] = data.copy()
+                temp_cleaner._set_column(column, data.copy())
                 _, sqrt_info = temp_cleaner.transform_sqrt(column)
                 recommendations.append(sqrt_info)
                 
@@ -1812,10 +3286,18 @@ class StatClean:
                 'all_results': []
             }
         
-    def clean_columns(self, columns: Optional[List[str]] = None, method: str = 'auto', show_progress: bool = True, include_indices: bool = False, **kwargs: Any) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    @instrumented
+    def clean_columns(self, columns: Optional[List[str]] = None, method: str = 'auto', show_progress: bool = True, include_indices: bool = False,
+                      by: Optional[Union[str, List[str]]] = None, n_jobs: Optional[int] = None,
+                      random_state: Optional[int] = None, iterate: bool = False, max_iterations: int = 20,
+                      sequential: bool = True, **kwargs: Any) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Clean multiple columns using the most appropriate method for each column.
         
+        Columns are cleaned in order, each on the rows left by the previous
+        ones, so both the statistics and the removed rows depend on the order
+        of ``columns`` (unless ``sequential=False``).
+        
         Parameters:
         -----------
         columns : list or None, default=None
@@ -1830,6 +3312,37 @@ class StatClean:
             Whether to show a progress bar during cleaning
         include_indices : bool, default=False
             Whether to include outlier indices in the output DataFrame
+        by : str or list of str, optional
+            Column(s) defining segments; thresholds are computed per segment.
+            With method='auto' the method is still chosen from the whole column.
+        n_jobs : int, optional
+            Number of worker threads; -1 uses all CPUs. With
+            ``sequential=False`` the columns are cleaned in parallel. In the
+            default sequential mode each column depends on the rows left by
+            the previous ones, so columns are still cleaned one after the
+            other and the result is identical to ``n_jobs=None``; workers are
+            then only used with ``incremental=True``, to sort the upcoming
+            columns ahead of time (that work stays valid along the removal
+            chain). Otherwise no threads are started.
+        random_state : int, optional
+            Seed passed to ``analyze_distribution`` with method='auto', making
+            the chosen methods reproducible
+        iterate : bool, default=False
+            Remove outliers of each column until its re-estimated bounds flag
+            nothing (see ``remove_outliers_iqr``); the summary then has an
+            'Iterations' column and each column's trace is in ``outlier_info``
+        max_iterations : int, default=20
+            Maximum number of passes per column with ``iterate=True``
+        sequential : bool, default=True
+            If False, every column's method choice, statistics and outlier
+            mask are computed on the rows present at the call, independently
+            of the other columns (in parallel with ``n_jobs``); the masks are
+            then OR-ed in column order and the flagged rows removed at once,
+            like ``clean_file(sequential=False)``. The result no longer
+            depends on the column order, and a row flagged by several columns
+            counts in each of their summaries. Messages and warnings are
+            printed by the worker threads as they occur; instrumentation
+            events are delivered in column order.
         **kwargs:
             Additional arguments to pass to the cleaning methods:
             - threshold: for Z-score methods
@@ -1841,47 +3354,60 @@ class StatClean:
             - pandas.DataFrame: The cleaned DataFrame
             - pandas.DataFrame: Summary of outlier statistics for each column
         """
-        if self.clean_df is None:
+        if self._clean_df is None:
             raise ValueError("No DataFrame has been set. Use set_data() first.")
             
         # If no columns specified, use all numeric columns
         if columns is None:
-            columns = self.clean_df.select_dtypes(include=np.number).columns.tolist()
-            
-        # Create progress bar if requested
-        columns_to_iterate = tqdm(columns, desc="Cleaning columns") if show_progress else columns
+            columns = self._numeric_columns()
             
-        cleaning_results = []
+        iteration_options = {'iterate': iterate, 'max_iterations': max_iterations} if iterate else {}
         
-        for column in columns_to_iterate:
+        def clean_column(cleaner: 'StatClean', column: str) -> None:
             if method == 'auto':
                 # Analyze distribution and get recommended method
-                analysis = self.analyze_distribution(column)
+                analysis = cleaner.analyze_distribution(column, random_state=random_state)
                 recommended_method = analysis['recommended_method']
                 recommended_threshold = analysis['recommended_threshold']
                 
                 if recommended_method == 'iqr':
-                    self.remove_outliers_iqr(column, 
-                                           lower_factor=recommended_threshold['lower_factor'],
-                                           upper_factor=recommended_threshold['upper_factor'])
+                    cleaner.remove_outliers_iqr(column, 
+                                              lower_factor=recommended_threshold['lower_factor'],
+                                              upper_factor=recommended_threshold['upper_factor'],
+                                              by=by, **iteration_options)
                 elif recommended_method == 'modified_zscore':
-                    self.remove_outliers_modified_zscore(column, threshold=recommended_threshold)
+                    cleaner.remove_outliers_modified_zscore(column, threshold=recommended_threshold, by=by,
+                                                            **iteration_options)
                 else:
-                    self.remove_outliers_zscore(column, threshold=recommended_threshold)
+                    cleaner.remove_outliers_zscore(column, threshold=recommended_threshold, by=by,
+                                                   **iteration_options)
             else:
                 if method == 'iqr':
-                    self.remove_outliers_iqr(column, **kwargs)
+                    cleaner.remove_outliers_iqr(column, by=by, **iteration_options, **kwargs)
                 elif method == 'zscore':
-                    self.remove_outliers_zscore(column, **kwargs)
+                    cleaner.remove_outliers_zscore(column, by=by, **iteration_options, **kwargs)
                 elif method == 'modified_zscore':
-                    self.remove_outliers_modified_zscore(column, **kwargs)
+                    cleaner.remove_outliers_modified_zscore(column, by=by, **iteration_options, **kwargs)
                 else:
                     available_methods = ['iqr', 'zscore', 'modified_zscore', 'auto']
                     raise ValueError(f"Unknown method '{method}'. Available methods: {', '.join(available_methods)}")
+        
+        # Create progress bar if requested
+        progress = None
+        if show_progress:
+            from tqdm import tqdm
+            progress = tqdm(total=len(columns), desc="Cleaning columns")
+        try:
+            # Grouped removals read per-segment statistics instead of the incremental ones
+            infos = self._run_columns(columns, clean_column, n_jobs, progress, sequential,
+                                      tracked=columns if by is None else [])
+        finally:
+            if progress is not None:
+                progress.close()
             
-            # Get the outlier info for this column
-            info = self.outlier_info[column]
-            
+        cleaning_results = []
+        
+        for column, info in zip(columns, infos):
             # Create a summary row
             summary = {
                 'Column': column,
@@ -1890,8 +3416,13 @@ class StatClean:
                 'Percent Removed': round(info['percent_removed'], 2)
             }
             
+            if 'iterations' in info:
+                summary['Iterations'] = len(info['iterations'])
+            
             # Add method-specific statistics
-            if info['method'] == 'IQR':
+            if 'group_stats' in info:
+                summary['Groups'] = len(info['group_stats'])
+            elif info['method'] == 'IQR':
                 summary.update({
                     'Lower Bound': info['lower_bound'],
                     'Upper Bound': info['upper_bound'],
@@ -1917,7 +3448,7 @@ class StatClean:
             
             # Add outlier indices if requested
             if include_indices:
-                summary['Outlier Indices'] = info.get('outlier_indices', [])
+                summary['Outlier Indices'] = info.get('outlier_indices', np.empty(0, dtype=np.int64))
                 
             cleaning_results.append(summary)
         
@@ -1926,6 +3457,10 @@ class StatClean:
         
         # Reorder columns for better presentation
         column_order = ['Column', 'Method', 'Outliers Found', 'Percent Removed']
+        if 'Iterations' in results_df.columns:
+            column_order.append('Iterations')
+        if 'Groups' in results_df.columns:
+            column_order.append('Groups')
         if 'Lower Bound' in results_df.columns:
             column_order.extend(['Lower Bound', 'Upper Bound', 'Q1', 'Q3', 'IQR', 'Below Lower', 'Above Upper'])
         if 'Mean' in results_df.columns:
@@ -1957,6 +3492,7 @@ class StatClean:
             
         outlier_info = self.outlier_info[column]
         
+        plt, sns = _plotting_modules()
         plt.figure(figsize=(12, 6))
         
         # Create subplot for the boxplot
@@ -1968,7 +3504,10 @@ class StatClean:
         plt.subplot(1, 2, 2)
         sns.histplot(self.original_df[column], kde=True)
         
-        if outlier_info['method'] == 'IQR':
+        if 'group_stats' in outlier_info:
+            # Bounds differ per segment; the histogram is shown without them
+            pass
+        elif outlier_info['method'] == 'IQR':
             plt.axvline(outlier_info['lower_bound'], color='r', linestyle='--', 
                        label=f"Lower bound: {outlier_info['lower_bound']:.2f}")
             plt.axvline(outlier_info['upper_bound'], color='r', linestyle='--',
@@ -1998,7 +3537,8 @@ class StatClean:
                         label=f"Upper bound ({label_suffix}): {upper_bound:.2f}")
         
         plt.title(f'Distribution of {column} with Outlier Bounds')
-        plt.legend()
+        if 'group_stats' not in outlier_info:
+            plt.legend()
         
         plt.tight_layout()
         plt.show()
@@ -2062,13 +3602,12 @@ class StatClean:
         Reset the cleaner to the original DataFrame and clear all cached data.
         """
         if self.original_df is not None:
-            self.clean_df = self.original_df.copy()
+            self._attach_clean_df()
             self.outlier_info = {}
-            # Clear stats cache if it exists
-            if hasattr(self, '_stats_cache'):
-                self._stats_cache = {}
+            self._stats_cache.clear()
 
-    def get_outlier_indices(self, column: Optional[str] = None) -> Dict[str, List[int]]:
+    def get_outlier_indices(self, column: Optional[str] = None,
+                            as_list: bool = False) -> Dict[str, Union[np.ndarray, List[Any]]]:
         """
         Get the indices of outliers for specified column(s).
         
@@ -2077,20 +3616,27 @@ class StatClean:
         column : str or None, default=None
             Column name to get outlier indices for.
             If None, returns indices for all columns that have been cleaned.
+        as_list : bool, default=False
+            Whether to convert the stored index arrays to Python lists
             
         Returns:
         --------
         dict
-            Dictionary mapping column names to lists of outlier indices.
-            For columns without outlier information, returns an empty list.
+            Dictionary mapping column names to NumPy arrays of outlier indices
+            (lists if ``as_list=True``).
+            For columns without outlier information, returns an empty array.
         """
+        def convert(indices: np.ndarray) -> Union[np.ndarray, List[Any]]:
+            return indices.tolist() if as_list else indices
+        
+        empty = np.empty(0, dtype=np.int64)
         if column is not None:
             if column not in self.outlier_info:
-                return {column: []}
+                return {column: convert(empty)}
             info = self.outlier_info[column]
-            return {column: info.get('outlier_indices', [])}
+            return {column: convert(info.get('outlier_indices', empty))}
         
-        return {col: info.get('outlier_indices', []) 
+        return {col: convert(info.get('outlier_indices', empty))
                for col, info in self.outlier_info.items()}
 
 
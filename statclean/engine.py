@@ -0,0 +1,450 @@
+"""
+Columnar NumPy engine for cleaning tall numeric data without pandas.
+
+``ArrayEngine`` stores each numeric column as a 1D NumPy array and tracks
+removed rows in a single boolean alive mask, so removal steps never copy
+the data. It accepts 2D arrays, ``np.memmap`` objects and ``.npy`` files
+(opened memory-mapped), mappings of 1D arrays and DataFrames; pandas is
+only involved when a DataFrame goes in or ``to_frame`` is called.
+
+Memory-mapped columns are processed in chunks of ``chunk_size`` rows, with
+the exact multi-pass selection used by ``clean_file`` for quantiles, medians
+and MADs, so arrays larger than memory can be cleaned. In-memory columns are
+reduced directly with NumPy and give the same statistics as the
+pandas-based ``StatClean`` methods.
+"""
+
+import os
+import tempfile
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from . import _kernels
+from .outofcore import SUPPORTED_METHODS, _Stage
+
+
+_METHOD_LABELS = {
+    'iqr': 'IQR',
+    'zscore': 'Z-score',
+    'modified_zscore': 'Modified Z-score',
+}
+
+ArrayInput = Union[np.ndarray, Mapping[str, np.ndarray], pd.DataFrame, str, os.PathLike]
+
+
+def _quantiles(values: np.ndarray, qs: Sequence[float]) -> np.ndarray:
+    """Quantiles of non-missing values, evaluated the way ``Series.quantile`` does."""
+    if len(values) == 0:
+        return np.full(len(qs), np.nan)
+    return np.percentile(values, np.asarray(qs, dtype=float) * 100)
+
+
+def _in_memory_statistics(values: np.ndarray, stage: _Stage) -> Dict[str, float]:
+    """
+    Statistics for ``stage`` from a fully loaded column.
+
+    Follows the single-column conventions of StatClean: quantiles, means and
+    medians skip NaN, the standard deviation uses ddof=1 and the MAD is NaN
+    when the column has missing values.
+    """
+    present = values[~np.isnan(values)]
+    if stage.method == 'iqr':
+        Q1, Q3 = _quantiles(present, [0.25, 0.75])
+        IQR = Q3 - Q1
+        return {'Q1': Q1, 'Q3': Q3, 'IQR': IQR,
+                'lower_bound': Q1 - stage.lower_factor * IQR,
+                'upper_bound': Q3 + stage.upper_factor * IQR}
+    if stage.method == 'winsorize_percentile':
+        lower, upper = _quantiles(present, [stage.lower_percentile / 100.0, stage.upper_percentile / 100.0])
+        return {'lower_bound': lower, 'upper_bound': upper}
+    if stage.method == 'zscore':
+        count = len(present)
+        if count == 0:
+            return {'mean': np.nan, 'std': np.nan}
+        # Summed with missing entries as zeros, like pandas' nanmean/nanvar,
+        # so the results equal Series.mean()/std() bit for bit
+        missing = np.isnan(values)
+        filled = np.where(missing, 0.0, values)
+        mean = filled.sum() / count
+        if count < 2:
+            return {'mean': mean, 'std': np.nan}
+        squares = (mean - filled) ** 2
+        squares[missing] = 0.0
+        return {'mean': mean, 'std': np.sqrt(squares.sum() / (count - 1))}
+    median = np.median(present) if len(present) else np.nan
+    mad = np.median(np.abs(values - median)) if len(present) and len(present) == len(values) else np.nan
+    return {'median': median, 'mad': mad}
+
+
+class ArrayEngine:
+    """
+    Outlier detection and treatment over NumPy columns and a row-alive mask.
+
+    Removal only clears entries of the alive mask; winsorizing replaces the
+    column with a private capped copy, so the input arrays (or files) are
+    never written to. The copy of a memory-mapped column is written chunk by
+    chunk to a temporary file in ``temp_dir`` and memory-mapped in turn.
+
+    Parameters:
+    -----------
+    data : numpy.ndarray, numpy.memmap, mapping, pandas.DataFrame or str
+        A 2D array of shape (n_rows, n_columns) or 1D array, a mapping of
+        column names to 1D arrays of equal length, a DataFrame (its numeric
+        columns are used), or the path of a ``.npy`` file, which is opened
+        memory-mapped and read-only
+    columns : list of str, optional
+        Names for the columns of an array input (defaults to 'x0', 'x1', ...),
+        or the subset of columns to use from a mapping or DataFrame
+    chunk_size : int, default=1000000
+        Rows per chunk when processing memory-mapped columns
+    alive : numpy.ndarray, optional
+        Initial boolean alive-rows mask. It is used (and updated) in place.
+    temp_dir : str, optional
+        Directory for the temporary files holding winsorized copies of
+        memory-mapped columns (defaults to the system temporary directory)
+
+    Example:
+    --------
+        engine = ArrayEngine.from_npy('sensors.npy', columns=['temp', 'load'])
+        engine.remove('temp', 'iqr').winsorize('load', 'percentile')
+        engine.save('sensors_clean.npy')
+    """
+
+    def __init__(self, data: ArrayInput, columns: Optional[List[str]] = None,
+                 chunk_size: int = 1_000_000, alive: Optional[np.ndarray] = None,
+                 temp_dir: Optional[Union[str, os.PathLike]] = None) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if isinstance(data, (str, os.PathLike)):
+            data = np.load(data, mmap_mode='r')
+
+        if isinstance(data, pd.DataFrame):
+            names = columns if columns is not None else data.select_dtypes(include=np.number).columns.tolist()
+            arrays = {name: data[name].to_numpy(dtype=float, na_value=np.nan) for name in names}
+        elif isinstance(data, Mapping):
+            names = columns if columns is not None else list(data)
+            arrays = {name: np.asarray(data[name]) for name in names}
+        else:
+            data = np.asarray(data) if not isinstance(data, np.ndarray) else data
+            if data.ndim == 1:
+                data = data.reshape(-1, 1)
+            if data.ndim != 2:
+                raise ValueError("Array input must be 1D or 2D (rows x columns)")
+            names = columns if columns is not None else [f'x{j}' for j in range(data.shape[1])]
+            if len(names) != data.shape[1]:
+                raise ValueError(f"Got {len(names)} column names for {data.shape[1]} columns")
+            arrays = {name: data[:, j] for j, name in enumerate(names)}
+
+        if not arrays:
+            raise ValueError("No numeric columns to clean")
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        for name, values in arrays.items():
+            if values.ndim != 1 or not np.issubdtype(values.dtype, np.number):
+                raise ValueError(f"Column '{name}' must be a 1D numeric array")
+
+        self._data: Dict[str, np.ndarray] = arrays
+        self._owned: set = set()
+        self.n_total = lengths.pop()
+        self.chunk_size = int(chunk_size)
+        self.temp_dir = temp_dir
+        self._spill_files: List[Any] = []
+        if alive is not None and len(alive) != self.n_total:
+            raise ValueError("alive mask must have one entry per row")
+        self.alive: Optional[np.ndarray] = alive
+        self.outlier_info: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_npy(cls, path: Union[str, os.PathLike], columns: Optional[List[str]] = None,
+                 chunk_size: int = 1_000_000,
+                 temp_dir: Optional[Union[str, os.PathLike]] = None) -> 'ArrayEngine':
+        """Open a ``.npy`` file memory-mapped (read-only) and wrap it in an engine."""
+        return cls(np.load(path, mmap_mode='r'), columns=columns, chunk_size=chunk_size,
+                   temp_dir=temp_dir)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._data)
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows not removed so far."""
+        return self.n_total if self.alive is None else int(self.alive.sum())
+
+    def _check_column(self, column: str) -> np.ndarray:
+        if column not in self._data:
+            raise ValueError(f"Column '{column}' not found. Available columns: {', '.join(self._data)}")
+        return self._data[column]
+
+    def _is_chunked(self, column: str) -> bool:
+        return isinstance(self._data[column], np.memmap)
+
+    def _row_chunks(self, column: str) -> Iterator[Tuple[int, int]]:
+        step = self.chunk_size if self._is_chunked(column) else max(self.n_total, 1)
+        for start in range(0, self.n_total, step):
+            yield start, min(start + step, self.n_total)
+
+    def _chunk(self, column: str, start: int, stop: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Float values of rows [start, stop) and the alive mask of that range."""
+        values = np.asarray(self._data[column][start:stop], dtype=float)
+        return values, None if self.alive is None else self.alive[start:stop]
+
+    def _private_column(self, column: str) -> np.ndarray:
+        """
+        Empty float64 array for a private copy of a column.
+
+        For memory-mapped columns it is mapped onto an anonymous temporary
+        file, so writing the copy never holds the whole column in memory.
+        """
+        if not self._is_chunked(column):
+            return np.empty(self.n_total, dtype=float)
+        spill = tempfile.TemporaryFile(dir=self.temp_dir)
+        self._spill_files.append(spill)
+        return np.memmap(spill, dtype=np.float64, mode='w+', shape=(self.n_total,))
+
+    def values(self, column: str) -> np.ndarray:
+        """Values of the rows not removed so far (loads the column into memory)."""
+        self._check_column(column)
+        values = np.asarray(self._data[column], dtype=float)
+        return values if self.alive is None else values[self.alive]
+
+    def _stage(self, column: str, method: str, params: Dict[str, Any]) -> _Stage:
+        self._check_column(column)
+        if method == 'percentile':
+            method = 'winsorize_percentile'
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore, percentile")
+        stage = _Stage(column, {'method': method, **params}, self.chunk_size)
+        if not self._is_chunked(column):
+            stage.stats = _in_memory_statistics(self.values(column), stage)
+            return stage
+        while not stage.ready:
+            for start, stop in self._row_chunks(column):
+                values, alive = self._chunk(column, start, stop)
+                stage.feed(values if alive is None else values[alive])
+            stage.end_pass()
+        return stage
+
+    def statistics(self, column: str, method: str = 'iqr', **params: Any) -> Dict[str, float]:
+        """
+        Statistics and bounds of one method over the rows not removed so far.
+
+        Parameters:
+        -----------
+        column : str
+            Column name
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold),
+            'modified_zscore' (threshold) or 'percentile' (lower_percentile,
+            upper_percentile)
+
+        Returns:
+        --------
+        dict
+            'Q1', 'Q3', 'IQR' and bounds for IQR; 'mean' and 'std' for
+            Z-scores; 'median' and 'mad' for modified Z-scores; bounds for
+            percentiles
+        """
+        return dict(self._stage(column, method, params).stats)
+
+    def _masks(self, stage: _Stage) -> Iterator[Tuple[int, int, np.ndarray, Optional[np.ndarray]]]:
+        """Per chunk: range, outlier mask over all rows of the range, alive mask."""
+        for start, stop in self._row_chunks(stage.column):
+            values, alive = self._chunk(stage.column, start, stop)
+            mask = stage.outlier_mask(values)
+            yield start, stop, mask if alive is None else mask & alive, alive
+
+    def detect(self, column: str, method: str = 'iqr', **params: Any) -> np.ndarray:
+        """
+        Flag outliers without removing them.
+
+        Returns:
+        --------
+        numpy.ndarray
+            Boolean mask over the rows not removed so far
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        stage = self._stage(column, method, params)
+        parts = [mask if alive is None else mask[alive] for _, _, mask, alive in self._masks(stage)]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=bool)
+
+    def remove(self, column: str, method: str = 'iqr', **params: Any) -> 'ArrayEngine':
+        """
+        Remove outlier rows (only the alive mask is updated).
+
+        Parameters:
+        -----------
+        column : str
+            Column to check
+        method : str, default='iqr'
+            'iqr', 'zscore' or 'modified_zscore'
+        **params
+            lower_factor/upper_factor or threshold
+
+        Returns:
+        --------
+        ArrayEngine
+            Self for method chaining
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        stage = self._stage(column, method, params)
+        if self.alive is None:
+            self.alive = np.ones(self.n_total, dtype=bool)
+        removed = []
+        for start, stop, mask, _ in self._masks(stage):
+            positions = np.flatnonzero(mask)
+            self.alive[start + positions] = False
+            removed.append(start + positions)
+        removed = np.concatenate(removed) if removed else np.zeros(0, dtype=np.intp)
+
+        self.outlier_info[column] = {
+            'method': _METHOD_LABELS[method],
+            'column': column,
+            **stage.parameters(),
+            **stage.stats,
+            'num_outliers': len(removed),
+            'percent_removed': len(removed) / self.n_total * 100 if self.n_total else 0.0,
+            'outlier_indices': _kernels.compact_index_array(removed),
+        }
+        return self
+
+    def winsorize(self, column: str, method: str = 'iqr', **params: Any) -> 'ArrayEngine':
+        """
+        Cap values outside the bounds of a method instead of removing rows.
+
+        The column is replaced by a private capped copy (a memory-mapped
+        column is loaded into memory at this point).
+
+        Parameters:
+        -----------
+        column : str
+            Column to winsorize
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold) or
+            'percentile' (lower_percentile, upper_percentile)
+
+        Returns:
+        --------
+        ArrayEngine
+            Self for method chaining
+        """
+        if method not in ('iqr', 'zscore', 'percentile'):
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, percentile")
+        stage = self._stage(column, method, params)
+        stats = stage.stats
+        if method == 'zscore':
+            if stats['std'] == 0 or pd.isna(stats['std']):
+                print(f"Warning: Column '{column}' has zero or NaN standard deviation. No winsorization applied.")
+                return self
+            stats = {**stats,
+                     'lower_bound': stats['mean'] - stage.threshold * stats['std'],
+                     'upper_bound': stats['mean'] + stage.threshold * stats['std']}
+        lower, upper = stats['lower_bound'], stats['upper_bound']
+
+        source = self._data[column]
+        target = source if column in self._owned else self._private_column(column)
+        capped, n_below, n_above = [], 0, 0
+        for start, stop in self._row_chunks(column):
+            if target is not source:
+                target[start:stop] = source[start:stop]
+            values = target[start:stop]
+            below = values < lower
+            above = values > upper
+            # Only out-of-bounds entries are written; NaN bounds cap nothing
+            np.putmask(values, below, lower)
+            np.putmask(values, above, upper)
+            if self.alive is not None:
+                below &= self.alive[start:stop]
+                above &= self.alive[start:stop]
+            n_below += int(below.sum())
+            n_above += int(above.sum())
+            capped.append(np.flatnonzero(below | above) + start)
+        if isinstance(target, np.memmap):
+            target.flush()
+        self._data[column] = target
+        self._owned.add(column)
+        capped = np.concatenate(capped) if capped else np.empty(0, dtype=np.intp)
+
+        label = {'iqr': 'IQR Winsorizing', 'zscore': 'Z-score Winsorizing',
+                 'percentile': 'Percentile Winsorizing'}[method]
+        self.outlier_info[column] = {
+            'method': label,
+            'column': column,
+            **stage.parameters(),
+            **stats,
+            'num_winsorized': len(capped),
+            'num_winsorized_lower': n_below,
+            'num_winsorized_upper': n_above,
+            'percent_winsorized': len(capped) / self.n_rows * 100 if self.n_rows else 0.0,
+            'winsorized_indices': _kernels.compact_index_array(capped),
+        }
+        return self
+
+    def apply_cleaning_strategy(self, strategy: Dict[str, Dict[str, Any]]) -> 'ArrayEngine':
+        """
+        Apply a cleaning strategy in order, each step on the rows left by the previous ones.
+
+        Takes the same format as ``StatClean.apply_cleaning_strategy``; methods
+        'iqr', 'zscore' and 'modified_zscore' remove rows and
+        'winsorize_percentile' caps values.
+
+        Returns:
+        --------
+        ArrayEngine
+            Self for method chaining
+        """
+        for column, config in strategy.items():
+            params = {key: value for key, value in config.items() if key != 'method'}
+            method = config.get('method')
+            if method == 'winsorize_percentile':
+                self.winsorize(column, 'percentile', **params)
+            elif method in _METHOD_LABELS:
+                self.remove(column, method, **params)
+            else:
+                raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                                 f"ArrayEngine supports: {', '.join(SUPPORTED_METHODS)}")
+        return self
+
+    def row_positions(self) -> np.ndarray:
+        """Positions (in the input) of the rows not removed so far."""
+        if self.alive is None:
+            return np.arange(self.n_total)
+        return np.flatnonzero(self.alive)
+
+    def to_numpy(self, columns: Optional[List[str]] = None) -> np.ndarray:
+        """Cleaned data as a 2D float array of shape (n_rows, n_columns)."""
+        columns = columns if columns is not None else self.columns
+        result = np.empty((self.n_rows, len(columns)), dtype=float, order='F')
+        for j, column in enumerate(columns):
+            result[:, j] = self.values(column)
+        return result
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Cleaned data as a DataFrame indexed by the rows' input positions."""
+        columns = columns if columns is not None else self.columns
+        return pd.DataFrame({column: self.values(column) for column in columns},
+                            index=self.row_positions())
+
+    def save(self, path: Union[str, os.PathLike], columns: Optional[List[str]] = None) -> None:
+        """
+        Write the cleaned data to a ``.npy`` file, ``chunk_size`` rows at a time.
+        """
+        columns = columns if columns is not None else self.columns
+        for column in columns:
+            self._check_column(column)
+        output = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                           shape=(self.n_rows, len(columns)))
+        row = 0
+        for start in range(0, self.n_total, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_total)
+            keep = slice(None) if self.alive is None else self.alive[start:stop]
+            block = np.column_stack([np.asarray(self._data[column][start:stop], dtype=float)[keep]
+                                     for column in columns])
+            output[row:row + len(block)] = block
+            row += len(block)
+        output.flush()
+        del output
@@ -0,0 +1,231 @@
+"""
+Instrumentation: structured start/end events from StatClean's public methods.
+
+The detection, removal, winsorizing and transform methods, as well as
+``analyze_distribution``, ``clean_columns`` and ``apply_cleaning_strategy``,
+emit a 'start' event when called and an 'end' event when they return or
+raise. Events are plain dicts:
+
+- 'event': 'start' or 'end'
+- 'method': method name, e.g. 'remove_outliers_iqr'
+- 'column': column name (or list of columns), None for whole-frame methods
+- 'rows_in': rows of the cleaned data at the start
+- 'rows_out', 'wall_time' (seconds), 'error' (repr or None): end events only
+- 'peak_memory': tracemalloc peak in bytes during the call (end events of
+  top-level calls, when a listener asked for ``track_memory``), else None
+- 'depth': nesting level (0 for calls made by user code)
+- 'timestamp': ``time.time()`` when the event was emitted
+
+Register a callback with ``add_listener`` or collect events with
+``EventRecorder``. With no listener registered an instrumented call only
+adds two attribute checks.
+
+Example:
+--------
+    with EventRecorder(track_memory=True) as recorder:
+        cleaner.clean_columns(method='auto', show_progress=False)
+    print(recorder.to_frame().sort_values('wall_time').tail())
+"""
+
+import contextlib
+import functools
+import inspect
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+
+# (callback, track_memory) pairs; replaced, never mutated, so emitters can iterate without a lock
+_listeners: Tuple[Tuple[Callable[[Dict[str, Any]], None], bool], ...] = ()
+_registry_lock = threading.Lock()
+_local = threading.local()
+
+
+def add_listener(callback: Callable[[Dict[str, Any]], None],
+                 track_memory: bool = False) -> Callable[[Dict[str, Any]], None]:
+    """
+    Register a callback receiving every event.
+
+    Parameters:
+    -----------
+    callback : callable
+        Called with each event dict, in the thread that runs the method
+    track_memory : bool, default=False
+        Measure the tracemalloc peak of top-level calls (starts tracing for
+        the duration of the call if it is not already on; adds overhead)
+
+    Returns:
+    --------
+    callable
+        The callback, for use with ``remove_listener``
+    """
+    global _listeners
+    with _registry_lock:
+        _listeners = _listeners + ((callback, track_memory),)
+    return callback
+
+
+def remove_listener(callback: Callable[[Dict[str, Any]], None]) -> None:
+    """Unregister a callback added with ``add_listener``."""
+    global _listeners
+    with _registry_lock:
+        _listeners = tuple(entry for entry in _listeners if entry[0] != callback)
+
+
+def dispatch(event: Dict[str, Any]) -> None:
+    """Deliver an event to the listeners, or to the current thread's redirect buffer."""
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is not None:
+        buffer.append(('event', event))
+        return
+    for callback, _ in _listeners:
+        callback(event)
+
+
+def current_depth() -> int:
+    """Nesting level of instrumented calls in the current thread."""
+    return getattr(_local, 'depth', 0)
+
+
+@contextlib.contextmanager
+def redirect(buffer: List[Tuple[str, Any]], depth: int = 0) -> Iterator[None]:
+    """
+    Append this thread's events to ``buffer`` as ('event', event) instead of dispatching them.
+
+    Used for work in worker threads whose events must not reach the
+    listeners, or only once (with ``dispatch``) its result is kept.
+    ``depth`` is the nesting level of the thread that submitted the work.
+    """
+    previous = getattr(_local, 'buffer', None), current_depth()
+    _local.buffer, _local.depth = buffer, depth
+    try:
+        yield
+    finally:
+        _local.buffer, _local.depth = previous
+
+
+def _column_argument(function: Callable) -> Tuple[Optional[str], int]:
+    """Name and positional index (after ``self``) of a method's column argument."""
+    names = list(inspect.signature(function).parameters)[1:]
+    for name in ('column', 'columns'):
+        if name in names:
+            return name, names.index(name)
+    return None, -1
+
+
+def instrumented(function: Callable) -> Callable:
+    """Decorate a StatClean method so that it emits start and end events."""
+    name = function.__name__
+    column_name, column_position = _column_argument(function)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if not _listeners and getattr(_local, 'buffer', None) is None:
+            return function(self, *args, **kwargs)
+
+        if column_name is None:
+            column = None
+        elif len(args) > column_position:
+            column = args[column_position]
+        else:
+            column = kwargs.get(column_name)
+        depth = current_depth()
+        rows_in = self._n_rows() if self._clean_df is not None else None
+        dispatch({'event': 'start', 'method': name, 'column': column, 'rows_in': rows_in,
+                  'depth': depth, 'timestamp': time.time()})
+
+        track_memory = depth == 0 and any(wants_memory for _, wants_memory in _listeners)
+        started_tracing = False
+        if track_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+
+        error = None
+        _local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        except BaseException as exc:
+            error = repr(exc)
+            raise
+        finally:
+            wall_time = time.perf_counter() - start
+            _local.depth = depth
+            peak_memory = None
+            if track_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            rows_out = self._n_rows() if self._clean_df is not None else None
+            dispatch({'event': 'end', 'method': name, 'column': column, 'rows_in': rows_in,
+                      'rows_out': rows_out, 'wall_time': wall_time, 'peak_memory': peak_memory,
+                      'error': error, 'depth': depth, 'timestamp': time.time()})
+
+    return wrapper
+
+
+class EventRecorder:
+    """
+    Listener that keeps events in memory and exports them as a table.
+
+    Use as a context manager (registered on enter, removed on exit) or
+    register it with ``start``/``stop``.
+
+    Parameters:
+    -----------
+    track_memory : bool, default=False
+        Record the tracemalloc peak of top-level calls
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        self.track_memory = track_memory
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def start(self) -> 'EventRecorder':
+        add_listener(self, track_memory=self.track_memory)
+        return self
+
+    def stop(self) -> None:
+        remove_listener(self)
+
+    def __enter__(self) -> 'EventRecorder':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events = []
+
+    def to_frame(self, event: Optional[str] = 'end') -> pd.DataFrame:
+        """
+        Events as a DataFrame, one row per event.
+
+        Parameters:
+        -----------
+        event : str or None, default='end'
+            Keep only 'start' or 'end' events; None keeps both
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Columns 'event', 'method', 'column', 'rows_in', 'rows_out',
+            'wall_time', 'peak_memory', 'error', 'depth', 'timestamp'
+        """
+        columns = ['event', 'method', 'column', 'rows_in', 'rows_out', 'wall_time',
+                   'peak_memory', 'error', 'depth', 'timestamp']
+        with self._lock:
+            events = [item for item in self.events if event is None or item['event'] == event]
+        return pd.DataFrame(events, columns=columns)
@@ -0,0 +1,491 @@
+"""
+Out-of-core cleaning of CSV and Parquet files that do not fit in memory.
+
+``clean_file`` applies a cleaning strategy (the same per-column configuration
+used by ``StatClean.apply_cleaning_strategy``) to a file by streaming it in
+chunks. Statistics passes read only the columns they need; a final pass
+rewrites the file with outlier rows removed / values capped and produces a
+JSON-serializable report. Peak memory is bounded by the chunk size.
+
+Quantiles, medians and MADs are exact: each order statistic is located by
+histogramming order-preserving integer keys of the values and narrowing to
+the bin that holds the requested rank, then collecting that bin once it has
+at most ``chunksize`` values. This usually takes two or three extra passes
+over the needed column.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from . import _kernels
+from .sketches import KLLSketch
+from .streaming import RunningMoments
+
+
+SUPPORTED_METHODS = ('iqr', 'zscore', 'modified_zscore', 'winsorize_percentile')
+
+_DEFAULTS = {
+    'lower_factor': 1.5,
+    'upper_factor': 1.5,
+    'zscore_threshold': 3.0,
+    'modified_zscore_threshold': 3.5,
+    'lower_percentile': 5.0,
+    'upper_percentile': 95.0,
+}
+
+_HISTOGRAM_BITS = 16
+_FULL_RANGE = (0, (1 << 64) - 1)
+
+
+def _detect_format(path: str, file_format: Optional[str] = None) -> str:
+    if file_format is not None:
+        file_format = file_format.lower()
+    else:
+        extension = os.path.splitext(str(path))[1].lower()
+        file_format = {'.csv': 'csv', '.txt': 'csv', '.parquet': 'parquet', '.pq': 'parquet'}.get(extension)
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f"Cannot determine file format for '{path}'. Use file_format='csv' or 'parquet'")
+    return file_format
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("Parquet support requires pyarrow. Install it with: pip install pyarrow") from exc
+    return pyarrow
+
+
+def _iter_chunks(path: str, file_format: str, chunksize: int,
+                 columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    if file_format == 'csv':
+        # Round-trip parsing so untouched values are written back unchanged
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, float_precision='round_trip')
+    else:
+        pyarrow = _require_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+
+
+class _ChunkWriter:
+    """Append cleaned chunks to a CSV or Parquet file."""
+
+    def __init__(self, path: str, file_format: str) -> None:
+        self.path = path
+        self.file_format = file_format
+        self._writer = None
+        self._started = False
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.file_format == 'csv':
+            chunk.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        else:
+            pyarrow = _require_pyarrow()
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if self._writer is None:
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        self._started = True
+
+    def close(self, empty: pd.DataFrame) -> None:
+        if not self._started:
+            self.write(empty)
+        if self._writer is not None:
+            self._writer.close()
+
+
+class _OrderStatistics:
+    """
+    Exact order statistics of one column computed over repeated passes.
+
+    ``rank_function`` receives the number of non-missing values once it is
+    known and returns the 0-based ranks to locate. Each unresolved rank keeps
+    a key interval that contains it and the number of keys below the interval;
+    every pass either histograms an interval into 2**16 bins or, once small
+    enough, collects its keys and sorts them.
+    """
+
+    def __init__(self, rank_function: Callable[[int], List[int]], buffer_limit: int,
+                 transform: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> None:
+        self.rank_function = rank_function
+        self.buffer_limit = buffer_limit
+        self.transform = transform
+        self.count = 0
+        self.has_missing = False
+        self.values: Dict[int, float] = {}
+        self._pending: Dict[Tuple[int, int], Dict[str, Any]] = {
+            _FULL_RANGE: {'below': 0, 'size': None, 'ranks': None}
+        }
+        self._first_pass = True
+        self._begin_pass()
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+    def _begin_pass(self) -> None:
+        for (lo, hi), target in self._pending.items():
+            collect = target['size'] is not None and target['size'] <= self.buffer_limit
+            target['collect'] = collect
+            if collect:
+                target['keys'] = []
+            else:
+                target['width'] = ((hi - lo) >> _HISTOGRAM_BITS) + 1
+                target['histogram'] = np.zeros(1 << _HISTOGRAM_BITS, dtype=np.int64)
+
+    def feed(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        missing = np.isnan(values)
+        if missing.any():
+            self.has_missing = True
+            values = values[~missing]
+        if self.transform is not None:
+            values = self.transform(values)
+        if self._first_pass:
+            self.count += len(values)
+        keys = _kernels.sortable_keys(values)
+        for (lo, hi), target in self._pending.items():
+            inside = keys if (lo, hi) == _FULL_RANGE else keys[(keys >= np.uint64(lo)) & (keys <= np.uint64(hi))]
+            if target['collect']:
+                target['keys'].append(inside)
+            else:
+                bins = (inside - np.uint64(lo)) // np.uint64(target['width'])
+                target['histogram'] += np.bincount(bins.astype(np.intp), minlength=len(target['histogram']))
+
+    def end_pass(self) -> None:
+        if self._first_pass:
+            self._first_pass = False
+            if self.count == 0:
+                self._pending = {}
+                return
+            self._pending[_FULL_RANGE]['ranks'] = sorted(set(self.rank_function(self.count)))
+
+        pending: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for (lo, hi), target in self._pending.items():
+            if target['collect']:
+                keys = np.sort(np.concatenate(target['keys']))
+                for rank in target['ranks']:
+                    self.values[rank] = float(_kernels.keys_to_values(keys[rank - target['below']]))
+                continue
+            histogram = target['histogram']
+            cumulative = np.cumsum(histogram)
+            width = target['width']
+            for rank in target['ranks']:
+                b = int(np.searchsorted(cumulative, rank - target['below'], side='right'))
+                new_lo = lo + b * width
+                new_hi = min(new_lo + width - 1, hi)
+                if new_lo == new_hi:
+                    self.values[rank] = float(_kernels.keys_to_values(np.uint64(new_lo)))
+                    continue
+                below = target['below'] + (int(cumulative[b - 1]) if b > 0 else 0)
+                entry = pending.setdefault((new_lo, new_hi),
+                                           {'below': below, 'size': int(histogram[b]), 'ranks': []})
+                entry['ranks'].append(rank)
+        self._pending = pending
+        self._begin_pass()
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return np.nan
+        lower, upper, gamma = _kernels.quantile_ranks(self.count, q)
+        return _kernels.quantile_from_ranks(self.values[lower], self.values[upper], gamma)
+
+    def median(self) -> float:
+        if self.count == 0:
+            return np.nan
+        upper = self.values[self.count // 2]
+        if self.count % 2 == 1:
+            return upper
+        return float((self.values[(self.count - 1) // 2] + upper) / 2)
+
+
+class _SketchQuantiles:
+    """Approximate quantiles from a KLL sketch, built in a single pass."""
+
+    def __init__(self, epsilon: float) -> None:
+        self.sketch = KLLSketch(epsilon, random_state=0)
+        self.done = False
+
+    def feed(self, values: np.ndarray) -> None:
+        self.sketch.update(values)
+
+    def end_pass(self) -> None:
+        self.done = True
+
+    def quantile(self, q: float) -> float:
+        return self.sketch.quantile(q)
+
+
+def _quantile_ranks(*qs: float) -> Callable[[int], List[int]]:
+    def ranks(count: int) -> List[int]:
+        result = []
+        for q in qs:
+            lower, upper, _ = _kernels.quantile_ranks(count, q)
+            result.extend([lower, upper])
+        return result
+    return ranks
+
+
+def _median_ranks(count: int) -> List[int]:
+    return [(count - 1) // 2, count // 2]
+
+
+class _Stage:
+    """One step of the strategy: statistics to gather and the rule they define."""
+
+    def __init__(self, column: str, config: Dict[str, Any], buffer_limit: int,
+                 sketch_epsilon: Optional[float] = None) -> None:
+        method = config.get('method')
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                             f"Out-of-core cleaning supports: {', '.join(SUPPORTED_METHODS)}")
+        self.column = column
+        self.method = method
+        self.buffer_limit = buffer_limit
+        self.stats: Dict[str, Any] = {}
+        self.moments: Optional[RunningMoments] = None
+        self.order: Optional[_OrderStatistics] = None
+        self._median: Optional[float] = None
+
+        if method == 'iqr':
+            self.lower_factor = config.get('lower_factor') or _DEFAULTS['lower_factor']
+            self.upper_factor = config.get('upper_factor') or _DEFAULTS['upper_factor']
+            if self.lower_factor < 0 or self.upper_factor < 0:
+                raise ValueError("Factors must be non-negative values")
+            self.order = (_SketchQuantiles(sketch_epsilon) if sketch_epsilon
+                          else _OrderStatistics(_quantile_ranks(0.25, 0.75), buffer_limit))
+        elif method == 'zscore':
+            self.threshold = config.get('threshold') or _DEFAULTS['zscore_threshold']
+            if self.threshold <= 0:
+                raise ValueError("Threshold must be a positive value")
+            self.moments = RunningMoments()
+        elif method == 'modified_zscore':
+            self.threshold = config.get('threshold') or _DEFAULTS['modified_zscore_threshold']
+            if self.threshold <= 0:
+                raise ValueError("Threshold must be a positive value")
+            self.order = _OrderStatistics(_median_ranks, buffer_limit)
+        else:
+            self.lower_percentile = config.get('lower_percentile', _DEFAULTS['lower_percentile'])
+            self.upper_percentile = config.get('upper_percentile', _DEFAULTS['upper_percentile'])
+            if not (0 <= self.lower_percentile < self.upper_percentile <= 100):
+                raise ValueError("Percentiles must be between 0-100 and lower < upper")
+            self.order = (_SketchQuantiles(sketch_epsilon) if sketch_epsilon else _OrderStatistics(
+                _quantile_ranks(self.lower_percentile / 100.0, self.upper_percentile / 100.0), buffer_limit))
+
+    @property
+    def removes_rows(self) -> bool:
+        return self.method != 'winsorize_percentile'
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.stats)
+
+    def feed(self, values: np.ndarray) -> None:
+        if self.moments is not None:
+            self.moments.update(values)
+        if self.order is not None:
+            self.order.feed(values)
+
+    def end_pass(self) -> None:
+        if self.moments is not None:
+            moments = self.moments
+            self.moments = None
+            self.stats = {'mean': moments.mean if moments.count else np.nan, 'std': moments.std}
+            return
+        order = self.order
+        order.end_pass()
+        if not order.done:
+            return
+        if self.method == 'iqr':
+            Q1, Q3 = order.quantile(0.25), order.quantile(0.75)
+            IQR = Q3 - Q1
+            self.stats = {'Q1': Q1, 'Q3': Q3, 'IQR': IQR,
+                          'lower_bound': Q1 - self.lower_factor * IQR,
+                          'upper_bound': Q3 + self.upper_factor * IQR}
+        elif self.method == 'winsorize_percentile':
+            self.stats = {'lower_bound': order.quantile(self.lower_percentile / 100.0),
+                          'upper_bound': order.quantile(self.upper_percentile / 100.0)}
+        elif self._median is None:
+            # Median found; the MAD needs another selection over |x - median|
+            median = order.median()
+            if order.has_missing or order.count == 0:
+                # Matches scipy's median_abs_deviation, which propagates NaN
+                self.stats = {'median': median, 'mad': np.nan}
+            else:
+                self._median = median
+                self.order = _OrderStatistics(_median_ranks, self.buffer_limit,
+                                              transform=lambda values: np.abs(values - median))
+                return
+        else:
+            self.stats = {'median': self._median, 'mad': order.median()}
+        self.order = None
+
+    def outlier_mask(self, values: np.ndarray) -> np.ndarray:
+        stats = self.stats
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self.method == 'iqr':
+                return (values < stats['lower_bound']) | (values > stats['upper_bound'])
+            if self.method == 'zscore':
+                if stats['std'] == 0 or pd.isna(stats['std']):
+                    return np.zeros(len(values), dtype=bool)
+                return np.abs((values - stats['mean']) / stats['std']) > self.threshold
+            if stats['mad'] == 0 or pd.isna(stats['mad']):
+                return np.zeros(len(values), dtype=bool)
+            return np.abs(0.6745 * (values - stats['median']) / stats['mad']) > self.threshold
+
+    def apply(self, chunk: pd.DataFrame, counts: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+        """Apply this stage's rule to a chunk, returning the surviving/capped rows."""
+        if self.removes_rows:
+            values = chunk[self.column].to_numpy(dtype=float, na_value=np.nan)
+            mask = self.outlier_mask(values)
+            if counts is not None:
+                counts['num_outliers'] += int(mask.sum())
+            return chunk[~mask] if mask.any() else chunk
+        lower, upper = self.stats['lower_bound'], self.stats['upper_bound']
+        series = chunk[self.column]
+        if counts is not None:
+            counts['num_outliers'] += int(((series < lower) | (series > upper)).sum())
+        chunk = chunk.copy()
+        chunk[self.column] = series.clip(lower, upper)
+        return chunk
+
+    def parameters(self) -> Dict[str, Any]:
+        if self.method == 'iqr':
+            return {'lower_factor': self.lower_factor, 'upper_factor': self.upper_factor}
+        if self.method == 'winsorize_percentile':
+            return {'lower_percentile': self.lower_percentile, 'upper_percentile': self.upper_percentile}
+        return {'threshold': self.threshold}
+
+
+def _gather_statistics(path: str, file_format: str, chunksize: int,
+                       stages: List[_Stage], applied: List[_Stage]) -> int:
+    """Run passes until every stage in ``stages`` has its statistics; returns the pass count."""
+    columns = list(dict.fromkeys([stage.column for stage in applied + stages]))
+    passes = 0
+    while not all(stage.ready for stage in stages):
+        active = [stage for stage in stages if not stage.ready]
+        for chunk in _iter_chunks(path, file_format, chunksize, columns):
+            for stage in applied:
+                chunk = stage.apply(chunk)
+            for stage in active:
+                stage.feed(chunk[stage.column].to_numpy(dtype=float, na_value=np.nan))
+        for stage in active:
+            stage.end_pass()
+        passes += 1
+    return passes
+
+
+def clean_file(input_path: str, output_path: str, strategy: Dict[str, Dict[str, Any]],
+               chunksize: int = 100_000, report_path: Optional[str] = None,
+               file_format: Optional[str] = None, output_format: Optional[str] = None,
+               sequential: bool = True, approximate: bool = False,
+               sketch_epsilon: float = 0.01) -> Dict[str, Any]:
+    """
+    Clean a CSV or Parquet file chunk by chunk without loading it into memory.
+
+    Parameters:
+    -----------
+    input_path : str
+        Path of the CSV or Parquet file to clean
+    output_path : str
+        Path of the cleaned file to write
+    strategy : dict
+        Column configurations in the format of ``apply_cleaning_strategy``,
+        applied in order. Supported methods: 'iqr' (lower_factor,
+        upper_factor), 'zscore' (threshold), 'modified_zscore' (threshold) and
+        'winsorize_percentile' (lower_percentile, upper_percentile).
+    chunksize : int, default=100000
+        Rows per chunk; also the largest number of values buffered when
+        locating exact quantiles
+    report_path : str, optional
+        Where to write the JSON outlier report
+    file_format : str, optional
+        'csv' or 'parquet'; inferred from ``input_path`` if None
+    output_format : str, optional
+        'csv' or 'parquet'; inferred from ``output_path`` if None
+    sequential : bool, default=True
+        If True, each step's statistics are computed on the rows left by the
+        previous steps, exactly like ``apply_cleaning_strategy`` (statistics
+        passes per step). If False, all statistics are computed on the input
+        file at once, which needs fewer passes.
+    approximate : bool, default=False
+        Estimate the quantiles of 'iqr' and 'winsorize_percentile' steps with a
+        KLL sketch in a single pass instead of exact selection passes
+    sketch_epsilon : float, default=0.01
+        Rank error bound of the sketches used with ``approximate=True``
+
+    Returns:
+    --------
+    dict
+        Report with input/output row counts, the number of passes and, per
+        step, the statistics, bounds and number of rows removed or capped
+
+    Example:
+    --------
+        report = clean_file('events.csv', 'events_clean.csv',
+                            {'latency': {'method': 'iqr'},
+                             'amount': {'method': 'zscore', 'threshold': 3.0}})
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    if not strategy:
+        raise ValueError("Strategy must configure at least one column")
+    file_format = _detect_format(input_path, file_format)
+    output_format = _detect_format(output_path, output_format)
+    stages = [_Stage(column, config, chunksize, sketch_epsilon if approximate else None)
+              for column, config in strategy.items()]
+
+    passes = 0
+    if sequential:
+        for position, stage in enumerate(stages):
+            passes += _gather_statistics(input_path, file_format, chunksize, [stage], stages[:position])
+    else:
+        passes += _gather_statistics(input_path, file_format, chunksize, stages, [])
+
+    counts = [{'num_outliers': 0} for _ in stages]
+    rows_in = rows_out = 0
+    writer = _ChunkWriter(output_path, output_format)
+    empty = None
+    try:
+        for chunk in _iter_chunks(input_path, file_format, chunksize):
+            rows_in += len(chunk)
+            if empty is None:
+                empty = chunk.iloc[:0]
+            for stage, stage_counts in zip(stages, counts):
+                chunk = stage.apply(chunk, stage_counts)
+            rows_out += len(chunk)
+            writer.write(chunk)
+    finally:
+        writer.close(empty if empty is not None else pd.DataFrame(columns=list(strategy)))
+    passes += 1
+
+    steps = []
+    for stage, stage_counts in zip(stages, counts):
+        step = {'column': stage.column, 'method': stage.method, **stage.parameters(), **stage.stats}
+        key = 'num_outliers' if stage.removes_rows else 'num_winsorized'
+        step[key] = stage_counts['num_outliers']
+        step['percent_removed' if stage.removes_rows else 'percent_winsorized'] = (
+            stage_counts['num_outliers'] / rows_in * 100 if rows_in else 0.0)
+        steps.append({key: (float(value) if isinstance(value, np.floating) else value)
+                      for key, value in step.items()})
+
+    report = {
+        'input_path': str(input_path),
+        'output_path': str(output_path),
+        'rows_in': rows_in,
+        'rows_out': rows_out,
+        'rows_removed': rows_in - rows_out,
+        'passes': passes,
+        'sequential': sequential,
+        'approximate': approximate,
+        'steps': steps,
+    }
+    if report_path is not None:
+        with open(report_path, 'w') as handle:
+            json.dump(report, handle, indent=2, allow_nan=True)
+    return report
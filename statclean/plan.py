@@ -0,0 +1,403 @@
+"""
+Fitted cleaning plans: learn thresholds once, apply them to new batches.
+
+``CleaningPlan.fit`` runs a sequence of StatClean steps on reference data
+and records what each step learned: bounds and scores for removals, caps
+for winsorizing, shift/lambda/base for the transforms and the mean and
+precision (inverse covariance) matrix for Mahalanobis. ``transform`` then
+applies those parameters to any frame with elementwise comparisons and
+clips, one linear pass per step, without recomputing a statistic.
+
+``save``/``load`` store a fitted plan as a JSON manifest plus one ``.npz``
+file holding every learned number, so serving processes can load it in
+milliseconds instead of refitting (this module does not import the
+plotting libraries).
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy import special
+from scipy.linalg import cho_solve
+from scipy.stats import chi2
+
+from . import _kernels
+
+
+REMOVAL_METHODS = ('remove_outliers_iqr', 'remove_outliers_zscore',
+                   'remove_outliers_modified_zscore', 'remove_outliers_mahalanobis')
+WINSORIZE_METHODS = ('winsorize_outliers_iqr', 'winsorize_outliers_zscore', 'winsorize_outliers_percentile')
+TRANSFORM_METHODS = ('transform_boxcox', 'transform_log', 'transform_sqrt')
+PLAN_METHODS = REMOVAL_METHODS + WINSORIZE_METHODS + TRANSFORM_METHODS
+
+# apply_cleaning_strategy method names and their StatClean methods
+_STRATEGY_METHODS = {
+    'iqr': 'remove_outliers_iqr',
+    'zscore': 'remove_outliers_zscore',
+    'modified_zscore': 'remove_outliers_modified_zscore',
+    'winsorize_percentile': 'winsorize_outliers_percentile',
+}
+
+_LOG_FUNCTIONS = {'natural': np.log, '10': np.log10, '2': np.log2}
+
+PLAN_FORMAT = 'statclean-plan'
+PLAN_FORMAT_VERSION = 1
+_MANIFEST_FILE = 'manifest.json'
+_ARRAYS_FILE = 'arrays.npz'
+# Step fields kept in the manifest; every other field is a learned number
+_MANIFEST_FIELDS = ('method', 'column', 'columns', 'base', 'factor')
+
+
+def _normalize_steps(steps: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Step list from a list of step dicts or an ``apply_cleaning_strategy`` dict."""
+    if isinstance(steps, dict):
+        normalized = []
+        for column, config in steps.items():
+            method = config.get('method')
+            if method not in _STRATEGY_METHODS:
+                raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                                 f"Plans support: {', '.join(_STRATEGY_METHODS)}")
+            params = {key: value for key, value in config.items() if key != 'method'}
+            normalized.append({'method': _STRATEGY_METHODS[method], 'column': column, **params})
+        return normalized
+
+    normalized = []
+    for step in steps:
+        method = step.get('method')
+        if method not in PLAN_METHODS:
+            raise ValueError(f"Unsupported plan step '{method}'. Available steps: {', '.join(PLAN_METHODS)}")
+        if step.get('by') is not None:
+            raise ValueError("Plans do not support per-segment (by=) steps")
+        if method != 'remove_outliers_mahalanobis' and 'column' not in step:
+            raise ValueError(f"Plan step '{method}' requires a 'column'")
+        normalized.append(dict(step))
+    return normalized
+
+
+class CleaningPlan:
+    """
+    Cleaning steps with their parameters fitted on reference data.
+
+    Create one with ``CleaningPlan.fit`` or ``StatClean.fit_plan``. Each
+    fitted step is a dict with the StatClean ``method`` name, the column(s)
+    and the learned parameters:
+
+    - removals: ``Q1``/``Q3`` and ``lower_bound``/``upper_bound`` (IQR), or ``center``,
+      ``scale``, ``threshold`` and ``factor`` (Z-score, Modified Z-score)
+    - winsorizing: ``lower_bound``/``upper_bound``
+    - transforms: ``shift`` plus ``lambda`` (Box-Cox) or ``base`` (log)
+    - Mahalanobis: ``columns``, ``mean``, ``precision``, ``chi2_threshold``
+
+    Parameters:
+    -----------
+    steps : list of dict
+        Fitted steps, in order
+
+    Example:
+    --------
+        plan = CleaningPlan.fit(reference_df, [
+            {'method': 'transform_log', 'column': 'amount'},
+            {'method': 'remove_outliers_zscore', 'column': 'amount', 'threshold': 3.0},
+            {'method': 'winsorize_outliers_iqr', 'column': 'latency'},
+        ])
+        cleaned = plan.transform(hourly_batch)
+    """
+
+    def __init__(self, steps: List[Dict[str, Any]]) -> None:
+        self.steps = list(steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __repr__(self) -> str:
+        methods = ', '.join(step['method'] for step in self.steps)
+        return f"CleaningPlan([{methods}])"
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame, steps: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]],
+            thresholds: Optional[Dict[str, float]] = None) -> 'CleaningPlan':
+        """
+        Fit a plan by running its steps on reference data.
+
+        Steps run in order with StatClean's semantics, so every step is
+        fitted on the rows and values left by the previous ones. ``df`` is
+        not modified.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            Reference data
+        steps : list of dict or dict
+            Steps as dicts holding a StatClean method name under 'method',
+            the 'column' (or 'columns' for Mahalanobis) and that method's
+            keyword arguments, e.g. ``{'method': 'remove_outliers_iqr',
+            'column': 'a', 'lower_factor': 2.0}``. Supported methods are the
+            ``remove_outliers_*``, ``winsorize_outliers_*`` and
+            ``transform_*`` methods. A strategy dict in the format of
+            ``apply_cleaning_strategy`` is also accepted.
+        thresholds : dict, optional
+            Default thresholds for steps that do not set them, as keyword
+            arguments of ``set_thresholds``
+
+        Returns:
+        --------
+        CleaningPlan
+            The fitted plan
+        """
+        from .cleaner import StatClean
+
+        steps = _normalize_steps(steps)
+        cleaner = StatClean(df, copy=False, deferred=True)
+        if thresholds:
+            cleaner.set_thresholds(**thresholds)
+
+        fitted = []
+        for step in steps:
+            method = step['method']
+            params = {key: value for key, value in step.items() if key not in ('method', 'column')}
+            column = step.get('column')
+
+            if method == 'remove_outliers_iqr':
+                cleaner.remove_outliers_iqr(column, **params)
+                info = cleaner.outlier_info[column]
+                fitted.append({'method': method, 'column': column, 'Q1': float(info['Q1']), 'Q3': float(info['Q3']),
+                               'lower_bound': float(info['lower_bound']), 'upper_bound': float(info['upper_bound'])})
+            elif method in ('remove_outliers_zscore', 'remove_outliers_modified_zscore'):
+                threshold = params.get('threshold')
+                if method == 'remove_outliers_zscore':
+                    center, scale, threshold = cleaner._calculate_zscore_stats(column, threshold)
+                    factor = None
+                else:
+                    center, scale, threshold = cleaner._calculate_modified_zscore_stats(column, threshold)
+                    factor = 0.6745
+                getattr(cleaner, method)(column, **params)
+                if params.get('iterate'):
+                    # Keep the fixed-point statistics of the last iteration
+                    info = cleaner.outlier_info[column]
+                    center, scale = ((info['mean'], info['std']) if factor is None
+                                     else (info['median'], info['mad']))
+                fitted.append({'method': method, 'column': column, 'center': float(center),
+                               'scale': float(scale), 'threshold': float(threshold), 'factor': factor})
+            elif method == 'remove_outliers_mahalanobis':
+                fitted.append(cls._fit_mahalanobis(cleaner, params))
+                cleaner.remove_outliers_mahalanobis(**params)
+            elif method in WINSORIZE_METHODS:
+                getattr(cleaner, method)(column, **params)
+                # A zero-std Z-score winsorize is a no-op and records nothing
+                info = cleaner.outlier_info.pop(column, {})
+                fitted.append({'method': method, 'column': column,
+                               'lower_bound': float(info.get('lower_bound', np.nan)),
+                               'upper_bound': float(info.get('upper_bound', np.nan))})
+            else:
+                _, info = getattr(cleaner, method)(column, **params)
+                record = {'method': method, 'column': column, 'shift': float(info['shift_applied'])}
+                if method == 'transform_boxcox':
+                    record['lambda'] = float(info['lambda'])
+                elif method == 'transform_log':
+                    record['base'] = params.get('base', 'natural')
+                fitted.append(record)
+
+        return cls(fitted)
+
+    @staticmethod
+    def _fit_mahalanobis(cleaner: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Mean, precision matrix and threshold of a Mahalanobis step."""
+        columns = params.get('columns')
+        if columns is None:
+            columns = cleaner._numeric_columns()
+        _, _, mean, covariance, factor, precision = cleaner._fit_mahalanobis(
+            columns, params.get('use_shrinkage', False), params.get('robust', False))
+        if precision is None:
+            precision = cho_solve((factor, True), np.eye(len(columns)))
+        chi2_threshold = params.get('chi2_threshold')
+        if chi2_threshold is None:
+            chi2_threshold = chi2.ppf(0.975, df=len(columns))
+        elif 0 < chi2_threshold <= 1:
+            chi2_threshold = chi2.ppf(chi2_threshold, df=len(columns))
+        return {'method': 'remove_outliers_mahalanobis', 'columns': list(columns),
+                'mean': np.asarray(mean, dtype=float), 'precision': np.asarray(precision, dtype=float),
+                'chi2_threshold': float(chi2_threshold)}
+
+    @staticmethod
+    def _step_flags(step: Dict[str, Any], frame: pd.DataFrame) -> np.ndarray:
+        """Rows a removal step flags, from its fitted parameters."""
+        method = step['method']
+        if method == 'remove_outliers_mahalanobis':
+            values = frame[step['columns']].to_numpy(dtype=float, na_value=np.nan)
+            complete = ~np.isnan(values).any(axis=1)
+            flags = np.zeros(len(values), dtype=bool)
+            if complete.any():
+                distances = _kernels.mahalanobis_squared(values[complete], step['mean'],
+                                                         precision=step['precision'])
+                flags[complete] = distances > step['chi2_threshold']
+            return flags
+
+        values = frame[step['column']].to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            if method == 'remove_outliers_iqr':
+                return (values < step['lower_bound']) | (values > step['upper_bound'])
+            scale = step['scale']
+            if scale == 0 or np.isnan(scale):
+                return np.zeros(len(values), dtype=bool)
+            deviation = values - step['center']
+            if step['factor'] is not None:
+                deviation = step['factor'] * deviation
+            return np.abs(deviation / scale) > step['threshold']
+
+    @staticmethod
+    def _step_values(step: Dict[str, Any], data: pd.Series) -> pd.Series:
+        """New values of a winsorize or transform step, from its fitted parameters."""
+        method = step['method']
+        if method in WINSORIZE_METHODS:
+            lower, upper = step['lower_bound'], step['upper_bound']
+            return data.clip(None if np.isnan(lower) else lower, None if np.isnan(upper) else upper)
+        shifted = data + step['shift'] if step['shift'] else data
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if method == 'transform_boxcox':
+                return pd.Series(special.boxcox(shifted.to_numpy(dtype=float, na_value=np.nan), step['lambda']),
+                                 index=data.index, name=data.name)
+            if method == 'transform_log':
+                return _LOG_FUNCTIONS[step['base']](shifted)
+            return np.sqrt(shifted)
+
+    def _apply(self, df: pd.DataFrame) -> tuple:
+        """(frame with replaced columns, boolean mask of rows to remove)."""
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("transform requires a pandas DataFrame")
+        frame = df
+        flags = np.zeros(len(df), dtype=bool)
+        for step in self.steps:
+            columns = step.get('columns') or [step['column']]
+            missing = [column for column in columns if column not in frame.columns]
+            if missing:
+                raise ValueError(f"Column '{missing[0]}' not found in DataFrame. "
+                                 f"Available columns: {', '.join(map(str, frame.columns))}")
+            if step['method'] in REMOVAL_METHODS:
+                flags |= self._step_flags(step, frame)
+            else:
+                if frame is df:
+                    frame = df.copy(deep=False)
+                frame[step['column']] = self._step_values(step, frame[step['column']])
+        return frame, flags
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the fitted plan to a frame.
+
+        Removal steps flag rows against their fitted bounds, winsorize steps
+        clip to their fitted caps and transforms use their fitted shift and
+        parameters; rows are selected once at the end. No statistic is
+        recomputed. The index is preserved and ``df`` is not modified.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            Batch with the columns the plan was fitted on
+
+        Returns:
+        --------
+        pandas.DataFrame
+            The cleaned batch
+        """
+        frame, flags = self._apply(df)
+        if not flags.any():
+            return frame.copy(deep=False) if frame is df else frame
+        return frame[~flags]
+
+    def outlier_mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Rows of ``df`` that ``transform`` would remove.
+
+        Returns:
+        --------
+        pandas.Series
+            Boolean mask where True indicates a row flagged by a removal step
+        """
+        _, flags = self._apply(df)
+        return pd.Series(flags, index=df.index)
+
+    def save(self, path: str) -> None:
+        """
+        Save the plan to a directory.
+
+        Writes ``manifest.json`` (step methods, columns and options) and
+        ``arrays.npz`` (all fitted numbers: scalar parameters packed in one
+        float64 array, Mahalanobis means and precision matrices). Values
+        round-trip exactly.
+
+        Parameters:
+        -----------
+        path : str
+            Directory to write; created if needed
+        """
+        scalars: List[float] = []
+        arrays: Dict[str, np.ndarray] = {}
+        manifest_steps = []
+        for position, step in enumerate(self.steps):
+            entry: Dict[str, Any] = {'scalars': [], 'arrays': []}
+            for key, value in step.items():
+                if key in _MANIFEST_FIELDS:
+                    entry[key] = value
+                elif isinstance(value, np.ndarray):
+                    arrays[f'step{position}_{key}'] = value
+                    entry['arrays'].append(key)
+                else:
+                    scalars.append(float(value))
+                    entry['scalars'].append(key)
+            manifest_steps.append(entry)
+
+        os.makedirs(path, exist_ok=True)
+        np.savez(os.path.join(path, _ARRAYS_FILE), scalars=np.asarray(scalars, dtype=np.float64), **arrays)
+        manifest = {'format': PLAN_FORMAT, 'version': PLAN_FORMAT_VERSION, 'steps': manifest_steps}
+        with open(os.path.join(path, _MANIFEST_FILE), 'w') as handle:
+            json.dump(manifest, handle)
+
+    @classmethod
+    def load(cls, path: str) -> 'CleaningPlan':
+        """
+        Load a plan written by ``save``.
+
+        Parameters:
+        -----------
+        path : str
+            Directory holding ``manifest.json`` and ``arrays.npz``
+
+        Returns:
+        --------
+        CleaningPlan
+            The fitted plan, ready for ``transform``
+        """
+        with open(os.path.join(path, _MANIFEST_FILE)) as handle:
+            manifest = json.load(handle)
+        if manifest.get('format') != PLAN_FORMAT or manifest.get('version') != PLAN_FORMAT_VERSION:
+            raise ValueError(f"Unsupported plan format in '{path}': "
+                             f"{manifest.get('format')} version {manifest.get('version')}")
+
+        with np.load(os.path.join(path, _ARRAYS_FILE), allow_pickle=False) as stored:
+            scalars = stored['scalars'].tolist()
+            steps = []
+            offset = 0
+            for position, entry in enumerate(manifest['steps']):
+                step = {key: value for key, value in entry.items() if key in _MANIFEST_FIELDS}
+                names = entry['scalars']
+                step.update(zip(names, scalars[offset:offset + len(names)]))
+                offset += len(names)
+                for key in entry['arrays']:
+                    step[key] = stored[f'step{position}_{key}']
+                steps.append(step)
+        return cls(steps)
+
+    def scorer(self) -> 'RecordScorer':
+        """
+        Compile the plan for scoring single records.
+
+        Returns:
+        --------
+        RecordScorer
+            Scorer over this plan's fitted parameters (see ``statclean.scoring``)
+        """
+        from .scoring import RecordScorer
+        return RecordScorer(self)
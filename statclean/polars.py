@@ -0,0 +1,390 @@
+"""
+Polars backend: cleaning strategies compiled into Polars expressions.
+
+``compile_strategy`` turns a strategy (the dict format of
+``StatClean.apply_cleaning_strategy``) into a single ``polars.LazyFrame``
+query. Each step's statistics are aggregation expressions evaluated inside
+its ``filter`` / ``with_columns``, so they are computed on the rows left by
+the previous steps, exactly as in the pandas path, and the whole plan runs
+in Polars' multithreaded engine (and can start from ``scan_parquet`` or
+``scan_csv``). ``PolarsEngine`` offers the per-method API of ``ArrayEngine``
+on a ``polars.DataFrame`` and records the outlier information of each step.
+
+NaN and null both count as missing, as in pandas: statistics skip them and
+they are never flagged. polars is an optional dependency, imported when it
+is first needed.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from . import _kernels
+from .outofcore import SUPPORTED_METHODS, _DEFAULTS
+
+
+_METHOD_LABELS = {
+    'iqr': 'IQR',
+    'zscore': 'Z-score',
+    'modified_zscore': 'Modified Z-score',
+}
+
+
+def _require_polars():
+    try:
+        import polars
+    except ImportError as exc:
+        raise ImportError("The Polars backend requires polars. Install it with: pip install polars") from exc
+    return polars
+
+
+def _parameters(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Validated parameters of a method, with StatClean's defaults filled in."""
+    if method == 'iqr':
+        lower_factor = params.get('lower_factor') or _DEFAULTS['lower_factor']
+        upper_factor = params.get('upper_factor') or _DEFAULTS['upper_factor']
+        if lower_factor < 0 or upper_factor < 0:
+            raise ValueError("Factors must be non-negative values")
+        return {'lower_factor': lower_factor, 'upper_factor': upper_factor}
+    if method in ('zscore', 'modified_zscore'):
+        threshold = params.get('threshold') or _DEFAULTS[f'{method}_threshold']
+        if threshold <= 0:
+            raise ValueError("Threshold must be a positive value")
+        return {'threshold': threshold}
+    if method == 'percentile':
+        lower_percentile = params.get('lower_percentile', _DEFAULTS['lower_percentile'])
+        upper_percentile = params.get('upper_percentile', _DEFAULTS['upper_percentile'])
+        if not (0 <= lower_percentile < upper_percentile <= 100):
+            raise ValueError("Percentiles must be between 0-100 and lower < upper")
+        return {'lower_percentile': lower_percentile, 'upper_percentile': upper_percentile}
+    raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore, percentile")
+
+
+def _values(column: str) -> Any:
+    """Column as Float64 with NaN turned into null."""
+    pl = _require_polars()
+    return pl.col(column).cast(pl.Float64).fill_nan(None)
+
+
+def _statistics_expressions(column: str, method: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregation expressions for the statistics and bounds of a method."""
+    pl = _require_polars()
+    values = _values(column)
+    if method == 'iqr':
+        Q1 = values.quantile(0.25, interpolation='linear')
+        Q3 = values.quantile(0.75, interpolation='linear')
+        IQR = Q3 - Q1
+        return {'Q1': Q1, 'Q3': Q3, 'IQR': IQR,
+                'lower_bound': Q1 - parameters['lower_factor'] * IQR,
+                'upper_bound': Q3 + parameters['upper_factor'] * IQR}
+    if method == 'zscore':
+        return {'mean': values.mean(), 'std': values.std(ddof=1)}
+    if method == 'modified_zscore':
+        median = values.median()
+        # NaN when the column has missing values, like scipy's median_abs_deviation
+        mad = pl.when(values.null_count() == 0).then((values - median).abs().median())
+        return {'median': median, 'mad': mad}
+    return {'lower_bound': values.quantile(parameters['lower_percentile'] / 100.0, interpolation='linear'),
+            'upper_bound': values.quantile(parameters['upper_percentile'] / 100.0, interpolation='linear')}
+
+
+def _as_expression(value: Any) -> Any:
+    pl = _require_polars()
+    if isinstance(value, pl.Expr):
+        return value
+    return pl.lit(None if value is None or np.isnan(value) else value, dtype=pl.Float64)
+
+
+def _outlier_expression(column: str, method: str, stats: Dict[str, Any],
+                        parameters: Dict[str, Any]) -> Any:
+    """
+    Boolean expression flagging outliers; never null.
+
+    ``stats`` may hold aggregation expressions (evaluated in the query) or
+    already computed numbers. A zero or undefined scale flags nothing.
+    """
+    pl = _require_polars()
+    values = _values(column)
+    if method == 'iqr':
+        flagged = (values < _as_expression(stats['lower_bound'])) | (values > _as_expression(stats['upper_bound']))
+        return flagged.fill_null(False)
+    if method == 'zscore':
+        center, scale, factor = stats['mean'], stats['std'], None
+    else:
+        center, scale, factor = stats['median'], stats['mad'], 0.6745
+    center, scale = _as_expression(center), _as_expression(scale)
+    deviation = values - center if factor is None else factor * (values - center)
+    flagged = ((deviation / scale).abs() > parameters['threshold']).fill_null(False)
+    return pl.when(scale > 0).then(flagged).otherwise(False)
+
+
+def _capped_expression(column: str, lower: Any, upper: Any) -> Any:
+    """Values capped to [lower, upper]; missing values and NaN bounds leave values unchanged."""
+    pl = _require_polars()
+    values = _values(column)
+    lower, upper = _as_expression(lower), _as_expression(upper)
+    return (pl.when(values < lower).then(lower)
+            .when(values > upper).then(upper)
+            .otherwise(pl.col(column).cast(pl.Float64)))
+
+
+def compile_strategy(frame: Any, strategy: Dict[str, Dict[str, Any]]) -> Any:
+    """
+    Compile a cleaning strategy into one Polars lazy query.
+
+    Parameters:
+    -----------
+    frame : polars.DataFrame or polars.LazyFrame
+        Input data (e.g. from ``polars.scan_parquet``)
+    strategy : dict
+        Column configurations in the format of ``apply_cleaning_strategy``,
+        applied in order. Supported methods: 'iqr' (lower_factor,
+        upper_factor), 'zscore' (threshold), 'modified_zscore' (threshold)
+        and 'winsorize_percentile' (lower_percentile, upper_percentile).
+
+    Returns:
+    --------
+    polars.LazyFrame
+        Query producing the cleaned data; call ``collect()`` to run it
+
+    Example:
+    --------
+        query = compile_strategy(pl.scan_parquet('events.parquet'),
+                                 {'latency': {'method': 'iqr'},
+                                  'amount': {'method': 'zscore', 'threshold': 3.0}})
+        cleaned = query.collect()
+    """
+    query = frame.lazy()
+    for column, config in strategy.items():
+        method = config.get('method')
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                             f"The Polars backend supports: {', '.join(SUPPORTED_METHODS)}")
+        params = {key: value for key, value in config.items() if key != 'method'}
+        if method == 'winsorize_percentile':
+            parameters = _parameters('percentile', params)
+            stats = _statistics_expressions(column, 'percentile', parameters)
+            query = query.with_columns(
+                _capped_expression(column, stats['lower_bound'], stats['upper_bound']).alias(column))
+        else:
+            parameters = _parameters(method, params)
+            stats = _statistics_expressions(column, method, parameters)
+            query = query.filter(~_outlier_expression(column, method, stats, parameters))
+    return query
+
+
+class PolarsEngine:
+    """
+    Outlier detection and treatment on a ``polars.DataFrame``.
+
+    Mirrors ``ArrayEngine``: ``detect``, ``remove``, ``winsorize``,
+    ``statistics`` and ``apply_cleaning_strategy``, with the same defaults
+    and threshold rules as the corresponding ``StatClean`` methods. Each
+    step computes its statistics in one aggregation query and applies them
+    with one filter or column expression. The cleaned data is available as
+    ``frame``.
+
+    Parameters:
+    -----------
+    frame : polars.DataFrame or polars.LazyFrame
+        Data to clean (a LazyFrame is collected)
+    columns : list of str, optional
+        Columns that may be cleaned. Defaults to the numeric columns.
+
+    Example:
+    --------
+        engine = PolarsEngine(pl.read_parquet('events.parquet'))
+        engine.apply_cleaning_strategy({'latency': {'method': 'iqr'}})
+        engine.frame.write_parquet('events_clean.parquet')
+    """
+
+    def __init__(self, frame: Any, columns: Optional[List[str]] = None) -> None:
+        pl = _require_polars()
+        if isinstance(frame, pl.LazyFrame):
+            frame = frame.collect()
+        if not isinstance(frame, pl.DataFrame):
+            raise ValueError("PolarsEngine requires a polars.DataFrame or LazyFrame")
+        if columns is None:
+            columns = [name for name, dtype in frame.schema.items() if dtype.is_numeric()]
+        for column in columns:
+            if column not in frame.columns:
+                raise ValueError(f"Column '{column}' not found in frame. "
+                                 f"Available columns: {', '.join(frame.columns)}")
+
+        self._pl = pl
+        self.columns = list(columns)
+        self.n_total = frame.height
+        self.frame = frame
+        # Input row number of every current row, filtered along with the frame
+        self._row_ids = pl.Series('row', np.arange(self.n_total, dtype=np.int64))
+        self.outlier_info: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows not removed so far."""
+        return self.frame.height
+
+    def _check_column(self, column: str) -> None:
+        if column not in self.columns:
+            raise ValueError(f"Column '{column}' not found. Available columns: {', '.join(self.columns)}")
+
+    def statistics(self, column: str, method: str = 'iqr', **params: Any) -> Dict[str, float]:
+        """
+        Statistics and bounds of one method over the current rows.
+
+        Parameters:
+        -----------
+        column : str
+            Column name
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold),
+            'modified_zscore' (threshold) or 'percentile' (lower_percentile,
+            upper_percentile)
+
+        Returns:
+        --------
+        dict
+            Parameters used, statistics and bounds
+        """
+        self._check_column(column)
+        parameters = _parameters(method, params)
+        expressions = _statistics_expressions(column, method, parameters)
+        row = self.frame.lazy().select(**expressions).collect().row(0, named=True)
+        stats = {key: np.nan if value is None else float(value) for key, value in row.items()}
+        return {**parameters, **stats}
+
+    def detect(self, column: str, method: str = 'iqr', **params: Any) -> Any:
+        """
+        Flag outliers without removing them.
+
+        Returns:
+        --------
+        polars.Series
+            Boolean mask over the current rows
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        self._check_column(column)
+        parameters = _parameters(method, params)
+        expression = _outlier_expression(column, method, _statistics_expressions(column, method, parameters),
+                                         parameters)
+        return self.frame.lazy().select(expression.alias(column)).collect().to_series()
+
+    def remove(self, column: str, method: str = 'iqr', **params: Any) -> 'PolarsEngine':
+        """
+        Remove outlier rows.
+
+        Parameters:
+        -----------
+        column : str
+            Column to check
+        method : str, default='iqr'
+            'iqr', 'zscore' or 'modified_zscore'
+        **params
+            lower_factor/upper_factor or threshold
+
+        Returns:
+        --------
+        PolarsEngine
+            Self for method chaining
+        """
+        if method not in _METHOD_LABELS:
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        stats = self.statistics(column, method, **params)
+        mask = self.frame.lazy().select(
+            _outlier_expression(column, method, stats, stats).alias(column)).collect().to_series()
+        removed = self._row_ids.filter(mask).to_numpy()
+        if len(removed):
+            self.frame = self.frame.filter(~mask)
+            self._row_ids = self._row_ids.filter(~mask)
+
+        self.outlier_info[column] = {
+            'method': _METHOD_LABELS[method],
+            'column': column,
+            **stats,
+            'num_outliers': len(removed),
+            'percent_removed': len(removed) / self.n_total * 100 if self.n_total else 0.0,
+            'outlier_indices': _kernels.compact_index_array(removed),
+        }
+        return self
+
+    def winsorize(self, column: str, method: str = 'iqr', **params: Any) -> 'PolarsEngine':
+        """
+        Cap values outside the bounds of a method instead of removing rows.
+
+        Parameters:
+        -----------
+        column : str
+            Column to winsorize
+        method : str, default='iqr'
+            'iqr' (lower_factor, upper_factor), 'zscore' (threshold) or
+            'percentile' (lower_percentile, upper_percentile)
+
+        Returns:
+        --------
+        PolarsEngine
+            Self for method chaining
+        """
+        if method not in ('iqr', 'zscore', 'percentile'):
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, percentile")
+        pl = self._pl
+        stats = self.statistics(column, method, **params)
+        if method == 'zscore':
+            if stats['std'] == 0 or np.isnan(stats['std']):
+                print(f"Warning: Column '{column}' has zero or NaN standard deviation. No winsorization applied.")
+                return self
+            stats['lower_bound'] = stats['mean'] - stats['threshold'] * stats['std']
+            stats['upper_bound'] = stats['mean'] + stats['threshold'] * stats['std']
+        lower, upper = stats['lower_bound'], stats['upper_bound']
+
+        values = _values(column)
+        flags = self.frame.lazy().select(
+            (values < _as_expression(lower)).fill_null(False).alias('below'),
+            (values > _as_expression(upper)).fill_null(False).alias('above'),
+        ).collect()
+        self.frame = self.frame.with_columns(_capped_expression(column, lower, upper).alias(column))
+
+        num_lower = int(flags['below'].sum())
+        num_upper = int(flags['above'].sum())
+        winsorized = self._row_ids.filter(flags['below'] | flags['above']).to_numpy()
+        label = {'iqr': 'IQR Winsorizing', 'zscore': 'Z-score Winsorizing',
+                 'percentile': 'Percentile Winsorizing'}[method]
+        self.outlier_info[column] = {
+            'method': label,
+            'column': column,
+            **stats,
+            'num_winsorized': num_lower + num_upper,
+            'num_winsorized_lower': num_lower,
+            'num_winsorized_upper': num_upper,
+            'percent_winsorized': (num_lower + num_upper) / self.n_rows * 100 if self.n_rows else 0.0,
+            'winsorized_indices': _kernels.compact_index_array(winsorized),
+        }
+        return self
+
+    def apply_cleaning_strategy(self, strategy: Dict[str, Dict[str, Any]]) -> 'PolarsEngine':
+        """
+        Apply a cleaning strategy in order, each step on the rows left by the previous ones.
+
+        Gives the same data as ``compile_strategy(frame, strategy).collect()``
+        and also records ``outlier_info`` per step.
+
+        Returns:
+        --------
+        PolarsEngine
+            Self for method chaining
+        """
+        for column, config in strategy.items():
+            params = {key: value for key, value in config.items() if key != 'method'}
+            method = config.get('method')
+            if method == 'winsorize_percentile':
+                self.winsorize(column, 'percentile', **params)
+            elif method in _METHOD_LABELS:
+                self.remove(column, method, **params)
+            else:
+                raise ValueError(f"Unsupported method '{method}' for column '{column}'. "
+                                 f"The Polars backend supports: {', '.join(SUPPORTED_METHODS)}")
+        return self
+
+    def row_positions(self) -> np.ndarray:
+        """Positions (in the input frame) of the rows not removed so far."""
+        return self._row_ids.to_numpy()
@@ -0,0 +1,219 @@
+"""
+Single-record scoring on fitted cleaning plans.
+
+``RecordScorer`` compiles a ``CleaningPlan`` into flat tuples of Python
+floats (and small NumPy arrays for Mahalanobis), so scoring one record is a
+short loop of scalar comparisons with no pandas objects involved. It is
+meant for request-time checks such as "is this transaction an outlier?".
+
+Latency target: under 20 microseconds per record for a plan of about ten
+univariate steps plus one Mahalanobis step over a few columns, on a current
+server CPU (``benchmarks/bench_scoring.py`` measures it against the
+one-row DataFrame path).
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .plan import CleaningPlan
+
+
+# Compiled operation codes
+_BOUNDS, _SCORE, _MAHALANOBIS, _CLIP, _LOG, _SQRT, _BOXCOX = range(7)
+
+_LOG_FUNCTIONS = {'natural': math.log, '10': math.log10, '2': math.log2}
+
+
+def _log(value: float, function: Any) -> float:
+    if value > 0:
+        return function(value)
+    return -math.inf if value == 0 else math.nan
+
+
+def _boxcox(value: float, lmbda: float) -> float:
+    """Box-Cox of one value, evaluated like ``scipy.special.boxcox``."""
+    if value > 0:
+        log_value = math.log(value)
+        if abs(lmbda) < 1e-19:
+            return log_value
+        if lmbda * log_value < 709.78:
+            return math.expm1(lmbda * log_value) / lmbda
+        return math.copysign(1.0, lmbda) * math.exp(lmbda * log_value - math.log(abs(lmbda))) - 1 / lmbda
+    if value == 0:
+        if abs(lmbda) < 1e-19 or lmbda < 0:
+            return -math.inf
+        return -1 / lmbda
+    return math.nan
+
+
+class RecordScorer:
+    """
+    Score single records against a fitted ``CleaningPlan``.
+
+    Steps are evaluated in plan order: transforms and winsorizing update
+    the record's values, removal steps flag and score them. Missing values
+    (NaN, or keys absent from a dict record) are never flagged.
+
+    Parameters:
+    -----------
+    plan : CleaningPlan
+        Fitted plan (``CleaningPlan.fit``, ``StatClean.fit_plan`` or
+        ``CleaningPlan.load``)
+
+    Attributes:
+    -----------
+    columns : list of str
+        Column order expected for flat array records
+
+    Example:
+    --------
+        scorer = plan.scorer()
+        result = scorer.score({'amount': 912.5, 'latency': 0.31})
+        if result['outlier']:
+            ...
+    """
+
+    def __init__(self, plan: CleaningPlan) -> None:
+        columns: List[str] = []
+        positions: Dict[str, int] = {}
+
+        def position(column: str) -> int:
+            if column not in positions:
+                positions[column] = len(columns)
+                columns.append(column)
+            return positions[column]
+
+        operations = []
+        flagged: List[str] = []
+        self.has_mahalanobis = False
+        for step in plan.steps:
+            method = step['method']
+            if method == 'remove_outliers_mahalanobis':
+                indices = [position(column) for column in step['columns']]
+                operations.append((_MAHALANOBIS, indices, np.asarray(step['mean'], dtype=float),
+                                   np.asarray(step['precision'], dtype=float), step['chi2_threshold']))
+                self.has_mahalanobis = True
+                continue
+
+            index = position(step['column'])
+            if method == 'remove_outliers_iqr':
+                operations.append((_BOUNDS, index, step['lower_bound'], step['upper_bound'],
+                                   step['Q1'], step['Q3']))
+            elif method in ('remove_outliers_zscore', 'remove_outliers_modified_zscore'):
+                factor = 1.0 if step['factor'] is None else step['factor']
+                operations.append((_SCORE, index, step['center'], step['scale'], step['threshold'], factor))
+            elif method.startswith('winsorize_'):
+                operations.append((_CLIP, index, step['lower_bound'], step['upper_bound']))
+            elif method == 'transform_log':
+                operations.append((_LOG, index, step['shift'], _LOG_FUNCTIONS[step['base']]))
+            elif method == 'transform_sqrt':
+                operations.append((_SQRT, index, step['shift']))
+            else:
+                operations.append((_BOXCOX, index, step['shift'], step['lambda']))
+            if method.startswith('remove_') and step['column'] not in flagged:
+                flagged.append(step['column'])
+
+        self.columns = columns
+        self._operations = operations
+        self._flagged = flagged
+
+    def _values(self, record: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> List[float]:
+        if isinstance(record, Mapping):
+            values = []
+            for column in self.columns:
+                value = record.get(column)
+                values.append(math.nan if value is None else float(value))
+            return values
+        if len(record) != len(self.columns):
+            raise ValueError(f"Record has {len(record)} values; expected {len(self.columns)} "
+                             f"in the order of scorer.columns: {', '.join(self.columns)}")
+        if isinstance(record, np.ndarray):
+            return record.astype(float, copy=False).tolist()
+        return [float(value) for value in record]
+
+    def score(self, record: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> Dict[str, Any]:
+        """
+        Flag and score one record.
+
+        Parameters:
+        -----------
+        record : dict or sequence of float
+            Values by column name, or a flat sequence/1D array in the order
+            of ``columns``
+
+        Returns:
+        --------
+        dict
+            'outlier': whether any removal step flags the record;
+            'flags' and 'scores': per column of the univariate removal steps
+            (scores in standard deviations for Z-score, in robust units for
+            Modified Z-score and in IQRs beyond the quartiles for IQR);
+            'mahalanobis': Mahalanobis distance (NaN for incomplete records,
+            None when the plan has no Mahalanobis step; the last one is
+            reported if there are several) and 'mahalanobis_outlier'
+        """
+        values = self._values(record)
+        flags = dict.fromkeys(self._flagged, False)
+        scores: Dict[str, float] = {}
+        distance: Optional[float] = None
+        multivariate_flag = False
+
+        for operation in self._operations:
+            kind, index = operation[0], operation[1]
+            if kind == _BOUNDS:
+                _, _, lower, upper, q1, q3 = operation
+                value = values[index]
+                if value != value:
+                    scores[self.columns[index]] = math.nan
+                    continue
+                excess = q1 - value if value < q1 else (value - q3 if value > q3 else 0.0)
+                iqr = q3 - q1
+                scores[self.columns[index]] = excess / iqr if iqr > 0 else (0.0 if excess == 0 else math.inf)
+                if value < lower or value > upper:
+                    flags[self.columns[index]] = True
+            elif kind == _SCORE:
+                _, _, center, scale, threshold, factor = operation
+                if scale > 0:
+                    score = abs(factor * (values[index] - center) / scale)
+                    if score > threshold:
+                        flags[self.columns[index]] = True
+                else:
+                    score = math.nan
+                scores[self.columns[index]] = score
+            elif kind == _MAHALANOBIS:
+                _, indices, mean, precision, threshold = operation
+                deviation = np.array([values[i] for i in indices]) - mean
+                squared = float(deviation @ precision @ deviation)
+                distance = math.sqrt(squared) if squared >= 0 else math.nan
+                if squared > threshold:
+                    multivariate_flag = True
+            elif kind == _CLIP:
+                _, _, lower, upper = operation
+                value = values[index]
+                if value < lower:
+                    values[index] = lower
+                elif value > upper:
+                    values[index] = upper
+            elif kind == _LOG:
+                values[index] = _log(values[index] + operation[2], operation[3])
+            elif kind == _SQRT:
+                value = values[index] + operation[2]
+                values[index] = math.sqrt(value) if value >= 0 else math.nan
+            else:
+                values[index] = _boxcox(values[index] + operation[2], operation[3])
+
+        return {
+            'outlier': multivariate_flag or any(flags.values()),
+            'flags': flags,
+            'scores': scores,
+            'mahalanobis': distance,
+            'mahalanobis_outlier': multivariate_flag,
+        }
+
+    def is_outlier(self, record: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> bool:
+        """
+        Whether any removal step of the plan flags the record.
+        """
+        return self.score(record)['outlier']
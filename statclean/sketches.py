@@ -0,0 +1,176 @@
+"""
+Mergeable quantile sketches for approximate IQR bounds and percentile winsorizing.
+
+``KLLSketch`` summarizes a stream of values in O(k log(n / k)) memory, where
+``k`` is derived from the requested rank error. Sketches built on separate
+partitions or processes can be merged into one sketch of the combined data,
+so quantile bounds can be computed map-reduce style without sorting (or even
+holding) the full column.
+"""
+
+from typing import Iterable, List, Optional, Sequence, Union
+import numpy as np
+
+
+# Empirical constant relating the normalized rank error to the KLL parameter k
+# (k = _K_FACTOR / epsilon keeps the error below epsilon with high probability).
+_K_FACTOR = 3.0
+# Capacity ratio between consecutive levels, as in the KLL paper
+_CAPACITY_RATIO = 2.0 / 3.0
+_MIN_CAPACITY = 2
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Values are kept in a hierarchy of compactors. Level h holds items of weight
+    2**h; when a level exceeds its capacity it is sorted and every other item
+    (random offset) is promoted to the next level. Level capacities shrink
+    geometrically towards the bottom, so the sketch holds O(k log(n / k))
+    items for n values. Missing values are ignored.
+
+    Parameters:
+    -----------
+    epsilon : float, default=0.01
+        Target normalized rank error: ``quantile(q)`` returns a value whose
+        rank is within ``epsilon * n`` of ``q * n`` with high probability
+    random_state : int or numpy.random.Generator, optional
+        Seed for the compaction coin flips
+
+    Example:
+    --------
+        left = KLLSketch(0.01).update(partition_a)
+        right = KLLSketch(0.01).update(partition_b)
+        Q1, Q3 = left.merge(right).quantiles([0.25, 0.75])
+    """
+
+    def __init__(self, epsilon: float = 0.01,
+                 random_state: Optional[Union[int, np.random.Generator]] = None) -> None:
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        self.epsilon = float(epsilon)
+        self.k = max(8, int(np.ceil(_K_FACTOR / epsilon)))
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], epsilon: float = 0.01,
+                    random_state: Optional[Union[int, np.random.Generator]] = None,
+                    chunk_size: int = 65536) -> 'KLLSketch':
+        """Build a sketch from an array, feeding it in chunks of ``chunk_size``."""
+        sketch = cls(epsilon, random_state)
+        values = np.asarray(values, dtype=float).ravel()
+        for start in range(0, len(values), chunk_size):
+            sketch.update(values[start:start + chunk_size])
+        return sketch
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def num_retained(self) -> int:
+        """Number of items currently stored."""
+        return sum(len(level) for level in self._levels)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(int(np.ceil(self.k * _CAPACITY_RATIO ** depth)), _MIN_CAPACITY)
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so that weight is conserved
+                keep = items[:len(items) % 2]
+                pairs = items[len(keep):]
+                promoted = pairs[self._rng.integers(2)::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate((self._levels[level + 1], promoted))
+            level += 1
+
+    def update(self, values: Union[float, Iterable[float]]) -> 'KLLSketch':
+        """
+        Add values to the sketch.
+
+        Returns:
+        --------
+        KLLSketch
+            Self for method chaining
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self._compress()
+        return self
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Fold another sketch (e.g. built on a different partition) into this one.
+
+        Returns:
+        --------
+        KLLSketch
+            Self, now summarizing both inputs
+        """
+        if not isinstance(other, KLLSketch):
+            raise ValueError("Can only merge with another KLLSketch")
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with different error bounds "
+                             f"(epsilon={self.epsilon} and epsilon={other.epsilon})")
+        if other.count == 0:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _sorted_items(self):
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind='mergesort')
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Approximate quantiles for probabilities in [0, 1] (NaN for an empty sketch).
+        """
+        qs = np.asarray(qs, dtype=float)
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError("Quantile probabilities must be between 0 and 1")
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+        items, cumulative = self._sorted_items()
+        position = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+        result = items[np.minimum(position, len(items) - 1)]
+        result = np.where(qs <= 0, self.min, result)
+        return np.where(qs >= 1, self.max, result)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile for one probability."""
+        return float(self.quantiles([q])[0])
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of values less than or equal to ``value``."""
+        if self.count == 0:
+            return np.nan
+        items, cumulative = self._sorted_items()
+        position = np.searchsorted(items, value, side='right')
+        return float(cumulative[position - 1] / cumulative[-1]) if position > 0 else 0.0
@@ -0,0 +1,284 @@
+"""
+Constant-memory streaming statistics for outlier detection on unbounded data.
+
+``StreamingDetector`` keeps, per column, a running mean/variance (Welford's
+algorithm, merged chunk by chunk) and a ``KLLSketch`` from which Q1, the
+median, Q3 and the MAD are read. Chunks are folded in with vectorized NumPy
+operations, memory is bounded by the sketch's error parameter rather than the
+length of the stream, detectors built on separate partitions can be merged, and
+``detect`` applies the same threshold rules as ``StatClean.detect_outliers_iqr``,
+``detect_outliers_zscore`` and ``detect_outliers_modified_zscore``.
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+from .sketches import KLLSketch
+
+
+class RunningMoments:
+    """
+    Running count, mean and sum of squared deviations (Welford's algorithm).
+
+    Chunks are reduced with NumPy and folded into the running state with the
+    pairwise update of Chan et al., which is the batch form of Welford's
+    recurrence. Missing values are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: Union[np.ndarray, Sequence[float]]) -> 'RunningMoments':
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        n_b = len(values)
+        if n_b == 0:
+            return self
+        mean_b = values.mean()
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * n_a * n_b / n
+        self.count = n
+        return self
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        """Fold another accumulator (e.g. from a different partition) into this one."""
+        if other.count == 0:
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / n
+        self.mean += delta * other.count / n
+        self.count = n
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), NaN with fewer than two observations."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+
+def _sketch_quartiles(sketch: KLLSketch) -> np.ndarray:
+    """
+    Q1, median, Q3 and MAD of the values summarized by ``sketch``.
+
+    While the sketch has not compacted anything every value is retained with
+    weight 1 and the results are exact (linear interpolation, as
+    ``Series.quantile``). Afterwards the quartiles are sketch quantiles and the
+    MAD is the weighted median of the retained items' deviations from the
+    median estimate.
+    """
+    if sketch.count == 0:
+        return np.full(4, np.nan)
+    if sketch.num_retained == sketch.count:
+        values = sketch._levels[0]
+        Q1, median, Q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        return np.array([Q1, median, Q3, np.median(np.abs(values - median))])
+    Q1, median, Q3 = sketch.quantiles([0.25, 0.5, 0.75])
+    deviations = np.abs(np.concatenate(sketch._levels) - median)
+    weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(sketch._levels)])
+    order = np.argsort(deviations, kind='mergesort')
+    cumulative = np.cumsum(weights[order])
+    position = np.searchsorted(cumulative, 0.5 * cumulative[-1], side='left')
+    return np.array([Q1, median, Q3, deviations[order[position]]])
+
+
+class StreamingDetector:
+    """
+    Streaming outlier detector with O(1) memory per column.
+
+    Feed chunks with ``update`` and flag values with ``detect``. Thresholds
+    follow the in-memory detectors: IQR bounds ``Q1 - lower_factor * IQR`` and
+    ``Q3 + upper_factor * IQR``; ``|x - mean| / std > threshold`` for Z-scores;
+    ``|0.6745 * (x - median) / MAD| > threshold`` for modified Z-scores. A zero
+    or NaN scale flags nothing.
+
+    Means and standard deviations are exact. Quartiles and medians are read
+    from a KLL sketch with normalized rank error ``epsilon``, and the MAD is the
+    weighted median of the sketch items' deviations from the median estimate,
+    so IQR and modified Z-score bounds are approximations. Streams shorter than
+    the sketch capacity (about ``3 / epsilon`` values) give exact statistics.
+
+    Parameters:
+    -----------
+    columns : list of str, optional
+        Columns to track. Defaults to the numeric columns of the first chunk.
+    lower_factor, upper_factor : float, default=1.5
+        IQR factors
+    zscore_threshold : float, default=3.0
+        Z-score threshold
+    modified_zscore_threshold : float, default=3.5
+        Modified Z-score threshold
+    epsilon : float, default=0.01
+        Rank error bound of the per-column quantile sketches
+    random_state : int or numpy.random.Generator, optional
+        Seed for the sketch compactions
+
+    Example:
+    --------
+        detector = StreamingDetector(columns=['latency'])
+        for chunk in chunks:
+            detector.update(chunk)
+            flagged = detector.detect(chunk, method='zscore')
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, lower_factor: float = 1.5,
+                 upper_factor: float = 1.5, zscore_threshold: float = 3.0,
+                 modified_zscore_threshold: float = 3.5, epsilon: float = 0.01,
+                 random_state: Optional[Union[int, np.random.Generator]] = None) -> None:
+        if lower_factor < 0 or upper_factor < 0:
+            raise ValueError("Factors must be non-negative values")
+        if zscore_threshold <= 0 or modified_zscore_threshold <= 0:
+            raise ValueError("Threshold must be a positive value")
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        self.columns = list(columns) if columns is not None else None
+        self.lower_factor = lower_factor
+        self.upper_factor = upper_factor
+        self.zscore_threshold = zscore_threshold
+        self.modified_zscore_threshold = modified_zscore_threshold
+        self.epsilon = epsilon
+        self._rng = np.random.default_rng(random_state)
+        self._moments: Dict[str, RunningMoments] = {}
+        self._sketches: Dict[str, KLLSketch] = {}
+
+    @staticmethod
+    def _as_frame(chunk: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+        return chunk.to_frame() if isinstance(chunk, pd.Series) else chunk
+
+    def _resolve_columns(self, frame: pd.DataFrame) -> List[str]:
+        if self.columns is None:
+            self.columns = frame.select_dtypes(include=np.number).columns.tolist()
+        missing = [col for col in self.columns if col not in frame.columns]
+        if missing:
+            raise ValueError(f"Column(s) {missing} not found in chunk")
+        return self.columns
+
+    def update(self, chunk: Union[pd.DataFrame, pd.Series]) -> 'StreamingDetector':
+        """
+        Fold a chunk of observations into the running statistics.
+
+        Returns:
+        --------
+        StreamingDetector
+            Self for method chaining
+        """
+        frame = self._as_frame(chunk)
+        for column in self._resolve_columns(frame):
+            values = frame[column].to_numpy(dtype=float, na_value=np.nan)
+            if column not in self._moments:
+                self._moments[column] = RunningMoments()
+                self._sketches[column] = KLLSketch(self.epsilon, self._rng)
+            self._moments[column].update(values)
+            self._sketches[column].update(values)
+        return self
+
+    def merge(self, other: 'StreamingDetector') -> 'StreamingDetector':
+        """
+        Fold another detector (e.g. fed a different partition) into this one.
+
+        Returns:
+        --------
+        StreamingDetector
+            Self, now summarizing both streams
+        """
+        if not isinstance(other, StreamingDetector):
+            raise ValueError("Can only merge with another StreamingDetector")
+        for column, moments in other._moments.items():
+            if column not in self._moments:
+                self._moments[column] = RunningMoments()
+                self._sketches[column] = KLLSketch(self.epsilon, self._rng)
+            self._moments[column].merge(moments)
+            self._sketches[column].merge(other._sketches[column])
+        if self.columns is None:
+            self.columns = other.columns
+        return self
+
+    def statistics(self) -> pd.DataFrame:
+        """
+        Current per-column estimates.
+
+        Returns:
+        --------
+        pandas.DataFrame
+            One row per column with count, mean, std, Q1, median, Q3, IQR and mad
+        """
+        rows = {}
+        for column, moments in self._moments.items():
+            Q1, median, Q3, mad = _sketch_quartiles(self._sketches[column])
+            rows[column] = {
+                'count': moments.count,
+                'mean': moments.mean if moments.count else np.nan,
+                'std': moments.std,
+                'Q1': Q1,
+                'median': median,
+                'Q3': Q3,
+                'IQR': Q3 - Q1,
+                'mad': mad,
+            }
+        return pd.DataFrame.from_dict(rows, orient='index',
+                                      columns=['count', 'mean', 'std', 'Q1', 'median', 'Q3', 'IQR', 'mad'])
+
+    def detect(self, chunk: Union[pd.DataFrame, pd.Series], method: str = 'iqr') -> Union[pd.DataFrame, pd.Series]:
+        """
+        Flag outliers in a chunk using the statistics seen so far.
+
+        Parameters:
+        -----------
+        chunk : pandas.DataFrame or pandas.Series
+            Observations to check; they are not added to the statistics
+        method : str, default='iqr'
+            'iqr', 'zscore' or 'modified_zscore'
+
+        Returns:
+        --------
+        pandas.DataFrame or pandas.Series
+            Boolean mask(s) where True indicates outliers, shaped like ``chunk``
+            (tracked columns only)
+        """
+        if method not in ('iqr', 'zscore', 'modified_zscore'):
+            raise ValueError(f"Unknown method '{method}'. Available methods: iqr, zscore, modified_zscore")
+        frame = self._as_frame(chunk)
+        columns = self._resolve_columns(frame)
+        unseen = [col for col in columns if col not in self._moments]
+        if unseen:
+            raise ValueError(f"No statistics for column(s) {unseen}. Call update() first.")
+        stats = self.statistics()
+
+        masks = {}
+        for column in columns:
+            values = frame[column].to_numpy(dtype=float, na_value=np.nan)
+            row = stats.loc[column]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if method == 'iqr':
+                    lower_bound = row['Q1'] - self.lower_factor * row['IQR']
+                    upper_bound = row['Q3'] + self.upper_factor * row['IQR']
+                    mask = (values < lower_bound) | (values > upper_bound)
+                elif method == 'zscore':
+                    std = row['std']
+                    if std == 0 or pd.isna(std):
+                        mask = np.zeros(len(values), dtype=bool)
+                    else:
+                        mask = np.abs((values - row['mean']) / std) > self.zscore_threshold
+                else:
+                    mad = row['mad']
+                    if mad == 0 or pd.isna(mad):
+                        mask = np.zeros(len(values), dtype=bool)
+                    else:
+                        mask = np.abs(0.6745 * (values - row['median']) / mad) > self.modified_zscore_threshold
+            masks[column] = mask
+
+        result = pd.DataFrame(masks, index=frame.index)
+        if isinstance(chunk, pd.Series):
+            return result.iloc[:, 0].rename(chunk.name)
+        return result
@@ -1,14 +1,23 @@
 """
 Utility functions for outlier visualization and plotting.
+
+matplotlib and seaborn are imported when a plot is first drawn, so
+importing StatClean does not load them or select a GUI backend.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import pandas as pd
 from typing import Union, Optional
 from scipy import stats
 
+
+def _plotting_modules():
+    """Return (matplotlib.pyplot, seaborn), importing them on first use."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
+
+
 def plot_outliers(data: Union[pd.Series, np.ndarray], 
                  outliers: Union[pd.Series, np.ndarray],
                  title: Optional[str] = None,
@@ -27,6 +36,7 @@ def plot_outliers(data: Union[pd.Series, np.ndarray],
     figsize : tuple
         Figure size as (width, height)
     """
+    plt, sns = _plotting_modules()
     plt.figure(figsize=figsize)
     
     # Convert data to numpy array if it's a pandas Series
@@ -67,6 +77,7 @@ def plot_distribution(data: Union[pd.Series, np.ndarray],
     figsize : tuple
         Figure size as (width, height)
     """
+    plt, sns = _plotting_modules()
     plt.figure(figsize=figsize)
     
     # Convert to numpy arrays if needed
@@ -108,6 +119,7 @@ def plot_boxplot(data: Union[pd.Series, np.ndarray],
     figsize : tuple
         Figure size as (width, height)
     """
+    plt, sns = _plotting_modules()
     plt.figure(figsize=figsize)
     
     # Convert to numpy arrays if needed
@@ -147,6 +159,7 @@ def plot_qq(data: Union[pd.Series, np.ndarray],
     figsize : tuple
         Figure size as (width, height)
     """
+    plt, _ = _plotting_modules()
     plt.figure(figsize=figsize)
     
     # Convert to numpy arrays if needed
@@ -191,6 +204,7 @@ def plot_outlier_analysis(data: Union[pd.Series, np.ndarray],
     figsize : tuple
         Figure size as (width, height)
     """
+    plt, sns = _plotting_modules()
     # Create a figure with a 2x2 subplot layout
     fig = plt.figure(figsize=figsize)
     fig.suptitle(title or 'Comprehensive Outlier Analysis', fontsize=14)
@@ -1,6 +1,13 @@
+import contextlib
+import importlib.util
+import io
+import json
 import os
+import subprocess
 import sys
+import tempfile
 import unittest
+import warnings
 import numpy as np
 
 # Add the parent directory to the Python path
@@ -11,7 +18,10 @@ try:
 except ImportError:
     raise ImportError("pandas is required for testing. Install with: pip install pandas")
 
-from statclean import StatClean
+from scipy.stats import chi2
+
+from statclean import instrumentation
+from statclean import StatClean, StreamingDetector, KLLSketch, ArrayEngine, ArrowEngine, PolarsEngine, CleaningPlan, EventRecorder, clean_file
 
 class TestStatClean(unittest.TestCase):
     def setUp(self):
@@ -177,5 +187,1360 @@ class TestStatCleanFunctional(unittest.TestCase):
         # Verify that obvious outliers were detected
         self.assertIn(0, outliers['height'])  # Index 0 has the obvious outlier (250)
 
+class TestMahalanobisEngine(unittest.TestCase):
+    """Tests for the chunked Mahalanobis distance engine"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame(rng.normal(size=(500, 3)), columns=['a', 'b', 'c'])
+        self.df.loc[0, ['a', 'b', 'c']] = [8.0, -8.0, 8.0]
+        self.df.loc[1, 'b'] = np.nan
+
+    def test_matches_rowwise_distances(self):
+        """Chunked distances match a direct quadratic form"""
+        cleaner = StatClean(self.df)
+        complete = self.df.dropna()
+        diff = complete.values - complete.values.mean(axis=0)
+        inv_cov = np.linalg.inv(np.cov(complete.values, rowvar=False))
+        expected = np.einsum('ij,jk,ik->i', diff, inv_cov, diff) > chi2.ppf(0.975, df=3)
+
+        mask = cleaner.detect_outliers_mahalanobis(chunk_size=7)
+        np.testing.assert_array_equal(mask.loc[complete.index].values, expected)
+        self.assertFalse(mask.loc[1])
+        self.assertTrue(mask.loc[0])
+
+    def test_chunk_size_invariance(self):
+        """Results do not depend on the block size"""
+        cleaner = StatClean(self.df)
+        small = cleaner.detect_outliers_mahalanobis(chunk_size=1)
+        large = cleaner.detect_outliers_mahalanobis(chunk_size=10_000)
+        pd.testing.assert_series_equal(small, large)
+
+        cleaner.remove_outliers_mahalanobis(chunk_size=16)
+        self.assertEqual(len(cleaner.clean_df), len(self.df) - small.sum())
+
+
+class TestBlockStatistics(unittest.TestCase):
+    """Tests for the shared multi-column statistics engine"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.df = pd.DataFrame({
+            'normal': rng.normal(0, 1, 300),
+            'skewed': rng.exponential(2, 300),
+            'ints': rng.integers(0, 100, 300),
+            'label': ['x'] * 300
+        })
+        self.df.loc[0, 'normal'] = 12.0
+        self.df.loc[5, 'skewed'] = np.nan
+        self.cleaner = StatClean(self.df)
+
+    def test_detect_all_matches_single_column_detectors(self):
+        """Batched masks equal the per-column detector results"""
+        self.cleaner.add_zscore_columns(['normal'])
+        results = self.cleaner.detect_all_outliers(columns=['normal', 'skewed', 'ints'])
+        for column, by_method in results.items():
+            np.testing.assert_array_equal(by_method['iqr'].values,
+                                          self.cleaner.detect_outliers_iqr(column).values)
+            np.testing.assert_array_equal(by_method['zscore'].values,
+                                          self.cleaner.detect_outliers_zscore(column).values)
+            np.testing.assert_array_equal(by_method['modified_zscore'].values,
+                                          self.cleaner.detect_outliers_modified_zscore(column).values)
+        self.assertTrue(results['normal']['zscore'].loc[0])
+
+    def test_get_outlier_stats_values(self):
+        """Reported statistics agree with pandas reductions"""
+        stats = self.cleaner.get_outlier_stats(include_indices=True)
+        self.assertEqual(set(stats['Column']), {'normal', 'skewed', 'ints'})
+        row = stats[(stats['Column'] == 'skewed') & (stats['Method'] == 'IQR')].iloc[0]
+        self.assertAlmostEqual(row['Q1'], self.df['skewed'].quantile(0.25))
+        self.assertAlmostEqual(row['Q3'], self.df['skewed'].quantile(0.75))
+        row = stats[(stats['Column'] == 'normal') & (stats['Method'] == 'Z-score')].iloc[0]
+        self.assertAlmostEqual(row['Std'], self.df['normal'].std())
+        self.assertIn(0, row['Outlier Indices'])
+
+
+class TestDeferredRemoval(unittest.TestCase):
+    """Tests for deferred (alive-mask) row removal"""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, 400),
+            'b': rng.exponential(1, 400),
+            'c': rng.normal(10, 2, 400),
+            'label': rng.choice(['x', 'y'], 400)
+        }, index=np.arange(1000, 1400))
+        self.df.loc[1000, 'a'] = 9.0
+        self.df.loc[1001, 'c'] = -20.0
+        self.df.loc[1002, 'b'] = np.nan
+
+    def _run_chain(self, cleaner):
+        cleaner.remove_outliers_iqr('a')
+        cleaner.remove_outliers_zscore('c', threshold=2.5)
+        cleaner.remove_outliers_modified_zscore('b')
+        cleaner.remove_outliers_mahalanobis(['a', 'c'])
+        return cleaner
+
+    def test_matches_eager_results(self):
+        """Deferred and eager chains give identical frames and outlier info"""
+        for preserve_index in (True, False):
+            eager = self._run_chain(StatClean(self.df, preserve_index=preserve_index))
+            lazy = self._run_chain(StatClean(self.df, preserve_index=preserve_index, deferred=True))
+            self.assertIsNotNone(lazy._alive)
+            pd.testing.assert_frame_equal(eager.clean_df, lazy.clean_df)
+            self.assertIsNone(lazy._alive)
+            for key, info in eager.outlier_info.items():
+                np.testing.assert_array_equal(info['outlier_indices'], lazy.outlier_info[key]['outlier_indices'])
+                self.assertEqual(info['num_outliers'], lazy.outlier_info[key]['num_outliers'])
+
+    def test_clean_columns_deferred(self):
+        """clean_columns materializes the deferred result once at the end"""
+        eager_df, eager_summary = StatClean(self.df).clean_columns(
+            ['a', 'b', 'c'], method='iqr', show_progress=False)
+        lazy_df, lazy_summary = StatClean(self.df, deferred=True).clean_columns(
+            ['a', 'b', 'c'], method='iqr', show_progress=False)
+        pd.testing.assert_frame_equal(eager_df, lazy_df)
+        pd.testing.assert_frame_equal(eager_summary, lazy_summary)
+
+
+class TestCopyFreeConstruction(unittest.TestCase):
+    """Tests for copy=False construction"""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.df = pd.DataFrame({'a': rng.normal(0, 1, 200), 'b': rng.exponential(1, 200)})
+        self.df.loc[0, 'a'] = 10.0
+        self.snapshot = self.df.copy()
+
+    def test_shares_input_until_written(self):
+        """The input is referenced, not copied, and never modified"""
+        cleaner = StatClean(self.df, copy=False)
+        self.assertIs(cleaner.original_df, self.df)
+        self.assertTrue(np.shares_memory(cleaner.clean_df['a'].values, self.df['a'].values))
+
+        cleaner.winsorize_outliers_iqr('a')
+        cleaner.transform_sqrt('b')
+        pd.testing.assert_frame_equal(self.df, self.snapshot)
+        self.assertFalse(np.shares_memory(cleaner.clean_df['a'].values, self.df['a'].values))
+        self.assertLess(cleaner.clean_df['a'].max(), 10.0)
+
+        cleaner.reset()
+        self.assertTrue(np.shares_memory(cleaner.clean_df['b'].values, self.df['b'].values))
+        pd.testing.assert_frame_equal(cleaner.clean_df, self.snapshot)
+
+    def test_removal_matches_copying_mode(self):
+        """Copy-free and copying cleaners produce the same results"""
+        shared = StatClean(self.df, copy=False).remove_outliers_zscore('a')
+        copied = StatClean(self.df).remove_outliers_zscore('a')
+        pd.testing.assert_frame_equal(shared.clean_df, copied.clean_df)
+        pd.testing.assert_frame_equal(self.df, self.snapshot)
+
+
+class TestCompactIndices(unittest.TestCase):
+    """Tests for array-backed outlier index storage"""
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.df = pd.DataFrame({'a': rng.normal(0, 1, 500), 'b': rng.normal(0, 1, 500)})
+        self.df.loc[[3, 7, 400], 'a'] = [9.0, -9.0, 12.0]
+        self.cleaner = StatClean(self.df)
+
+    def test_indices_stored_as_narrow_arrays(self):
+        """Removal and winsorize info store compact integer arrays"""
+        self.cleaner.remove_outliers_zscore('a')
+        indices = self.cleaner.outlier_info['a']['outlier_indices']
+        self.assertIsInstance(indices, np.ndarray)
+        self.assertEqual(indices.dtype, np.int16)
+        np.testing.assert_array_equal(indices, [3, 7, 400])
+
+        self.cleaner.winsorize_outliers_iqr('b')
+        self.assertIsInstance(self.cleaner.outlier_info['b']['winsorized_indices'], np.ndarray)
+
+    def test_get_outlier_indices_as_list(self):
+        """Lists are only produced on explicit request"""
+        self.cleaner.remove_outliers_zscore('a')
+        self.assertIsInstance(self.cleaner.get_outlier_indices('a')['a'], np.ndarray)
+        self.assertEqual(self.cleaner.get_outlier_indices('a', as_list=True), {'a': [3, 7, 400]})
+        self.assertEqual(self.cleaner.get_outlier_indices('missing', as_list=True), {'missing': []})
+
+    def test_compare_methods_arrays(self):
+        """compare_methods reports index arrays"""
+        comparison = self.cleaner.compare_methods(columns=['a'])
+        common = comparison['a']['common_outliers']
+        self.assertIsInstance(common, np.ndarray)
+        self.assertTrue(set([3, 7, 400]).issubset(set(common.tolist())))
+
+
+class TestGeneralizedESD(unittest.TestCase):
+    """Tests for the generalized ESD (iterative Grubbs) test"""
+
+    # Rosner (1983) example data, as used in the NIST handbook
+    ROSNER = [-0.25, 0.68, 0.94, 1.15, 1.20, 1.26, 1.26, 1.34, 1.38, 1.43, 1.49, 1.49,
+              1.55, 1.56, 1.58, 1.65, 1.69, 1.70, 1.76, 1.77, 1.81, 1.91, 1.94, 1.96,
+              1.99, 2.06, 2.09, 2.10, 2.14, 2.15, 2.23, 2.24, 2.26, 2.35, 2.37, 2.40,
+              2.47, 2.54, 2.62, 2.64, 2.90, 2.92, 2.92, 2.93, 3.21, 3.26, 3.30, 3.59,
+              3.68, 4.30, 4.64, 5.34, 5.42, 6.01]
+
+    def test_matches_reference_example(self):
+        """Reproduces the published statistics and finds three outliers"""
+        result = StatClean(pd.DataFrame({'x': self.ROSNER})).generalized_esd_test('x', max_outliers=10)
+        self.assertEqual(result['num_outliers'], 3)
+        np.testing.assert_allclose(result['outlier_values'], [6.01, 5.42, 5.34])
+        steps = result['steps']
+        self.assertEqual(len(steps), 10)
+        np.testing.assert_allclose(steps['statistic'][:3], [3.118, 2.942, 3.179], atol=1e-3)
+        np.testing.assert_allclose(steps['critical_value'][:3], [3.158, 3.151, 3.143], atol=1e-3)
+
+    def test_matches_iterated_grubbs_statistics(self):
+        """Per-step statistics equal a naive drop-and-recompute loop"""
+        rng = np.random.default_rng(6)
+        values = np.r_[rng.normal(0, 1, 300), [1e9, -40.0, 25.0]]
+        data = pd.Series(values, index=np.arange(1000, 1303))
+        result = StatClean(pd.DataFrame({'v': data})).generalized_esd_test('v', max_outliers=5)
+
+        remaining = data.copy()
+        for step in range(5):
+            z = (remaining - remaining.mean()).abs() / remaining.std()
+            label = z.idxmax()
+            self.assertEqual(result['steps']['index'][step], label)
+            self.assertAlmostEqual(result['steps']['statistic'][step], z[label], places=8)
+            remaining = remaining.drop(label)
+        np.testing.assert_array_equal(result['outlier_indices'][:3], [1300, 1301, 1302])
+        self.assertEqual(result['outlier_indices'].dtype, np.int16)
+
+    def test_invalid_arguments(self):
+        """Too few observations or too many requested outliers raise"""
+        cleaner = StatClean(pd.DataFrame({'x': [1.0, 2.0, 3.0, np.nan]}))
+        self.assertEqual(cleaner.generalized_esd_test('x', max_outliers=1)['n_observations'], 3)
+        with self.assertRaises(ValueError):
+            cleaner.generalized_esd_test('x', max_outliers=2)
+        with self.assertRaises(ValueError):
+            StatClean(pd.DataFrame({'x': [1.0, 2.0]})).generalized_esd_test('x')
+
+
+class TestGroupedOutlierTests(unittest.TestCase):
+    """Tests for batched Grubbs/Dixon testing across groups"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        sizes = [2, 5, 12, 25, 40]
+        self.df = pd.DataFrame({
+            'sensor': np.repeat(['s0', 's1', 's2', 's3', 's4'], sizes),
+            'value': rng.normal(10, 1, sum(sizes)),
+        }).sample(frac=1, random_state=1)
+        self.df.loc[self.df.index[self.df['sensor'] == 's2'][0], 'value'] = 30.0
+        self.cleaner = StatClean(self.df)
+
+    def test_matches_per_group_tests(self):
+        """Each group row equals the scalar test on that group"""
+        results = self.cleaner.grouped_outlier_tests('value', by='sensor')
+        self.assertEqual(len(results), 10)
+        self.assertEqual(list(results.columns[:3]), ['sensor', 'test', 'n'])
+
+        for _, row in results[results['n'] >= 3].iterrows():
+            group = StatClean(self.df[self.df['sensor'] == row['sensor']])
+            if row['test'] == 'grubbs':
+                expected = group.grubbs_test('value')
+            elif row['n'] <= 30:
+                expected = group.dixon_q_test('value')
+            else:
+                self.assertTrue(np.isnan(row['critical_value']))
+                continue
+            self.assertAlmostEqual(row['statistic'], expected['statistic'])
+            self.assertAlmostEqual(row['critical_value'], expected['critical_value'])
+            self.assertEqual(row['is_outlier'], expected['is_outlier'])
+            self.assertEqual(row['outlier_index'], expected['outlier_index'])
+
+        flagged = results[results['is_outlier']]
+        self.assertEqual(set(flagged['sensor']), {'s2'})
+
+    def test_small_groups_and_test_selection(self):
+        """Groups too small to test are reported without raising"""
+        results = self.cleaner.grouped_outlier_tests('value', by='sensor', tests=['grubbs'])
+        small = results[results['sensor'] == 's0'].iloc[0]
+        self.assertEqual(small['n'], 2)
+        self.assertTrue(np.isnan(small['statistic']))
+        self.assertFalse(small['is_outlier'])
+        self.assertIsNone(small['outlier_index'])
+        with self.assertRaises(ValueError):
+            self.cleaner.grouped_outlier_tests('value', by='sensor', tests=['esd'])
+        with self.assertRaises(ValueError):
+            self.cleaner.grouped_outlier_tests('value', by='missing')
+
+
+class TestGroupedThresholds(unittest.TestCase):
+    """Tests for per-segment thresholds via by="""
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        self.df = pd.DataFrame({
+            'store': rng.choice(['a', 'b', 'c', 'd'], 800),
+            'sales': rng.normal(0, 1, 800),
+        })
+        # Segments live on very different scales
+        self.df['sales'] += self.df['store'].map({'a': 0, 'b': 100, 'c': 1000, 'd': -50})
+        self.df.loc[[10, 20, 30], 'sales'] += [15.0, -15.0, 20.0]
+        self.df.loc[40, 'sales'] = np.nan
+        self.df.loc[50, 'store'] = None
+
+    def expected_mask(self, detector, **kwargs):
+        expected = pd.Series(False, index=self.df.index)
+        for _, segment in self.df.groupby('store'):
+            expected.loc[segment.index] = getattr(StatClean(segment), detector)('sales', **kwargs)
+        return expected
+
+    def test_detect_matches_per_group_instances(self):
+        """Grouped masks equal running one StatClean per segment"""
+        cleaner = StatClean(self.df)
+        for detector in ['detect_outliers_iqr', 'detect_outliers_zscore', 'detect_outliers_modified_zscore']:
+            mask = getattr(cleaner, detector)('sales', by='store')
+            pd.testing.assert_series_equal(mask, self.expected_mask(detector), check_names=False)
+        self.assertTrue(cleaner.detect_outliers_zscore('sales', by='store').loc[[10, 20, 30]].all())
+        self.assertFalse(cleaner.detect_outliers_zscore('sales').loc[[10, 20, 30]].any())
+
+    def test_remove_records_group_stats(self):
+        """Removal drops flagged rows and stores per-group statistics"""
+        cleaner = StatClean(self.df)
+        expected = self.expected_mask('detect_outliers_iqr')
+        cleaner.remove_outliers_iqr('sales', by='store')
+        info = cleaner.outlier_info['sales']
+        self.assertEqual(info['by'], 'store')
+        self.assertEqual(list(info['group_stats'].index), ['a', 'b', 'c', 'd'])
+        self.assertEqual(info['group_stats']['num_outliers'].sum(), expected.sum())
+        self.assertEqual(len(cleaner.clean_df), len(self.df) - expected.sum())
+
+    def test_winsorize_and_clean_columns(self):
+        """Winsorizing caps at segment bounds; clean_columns forwards by"""
+        cleaner = StatClean(self.df)
+        cleaner.winsorize_outliers_zscore('sales', by='store', threshold=3.0)
+        stats = cleaner.outlier_info['sales']['group_stats']
+        store = self.df.loc[30, 'store']
+        self.assertAlmostEqual(cleaner.clean_df.loc[30, 'sales'], stats.loc[store, 'upper_bound'])
+        self.assertTrue(np.isnan(cleaner.clean_df.loc[40, 'sales']))
+
+        cleaner = StatClean(self.df, deferred=True)
+        _, summary = cleaner.clean_columns(['sales'], method='modified_zscore', by='store', show_progress=False)
+        self.assertEqual(summary.loc[0, 'Groups'], 4)
+        self.assertEqual(summary.loc[0, 'Outliers Found'],
+                         self.expected_mask('detect_outliers_modified_zscore').sum())
+
+
+class TestStreamingDetector(unittest.TestCase):
+    """Tests for constant-memory streaming detection"""
+
+    def setUp(self):
+        rng = np.random.default_rng(9)
+        self.values = rng.normal(50, 5, 20000)
+        self.values[[100, 5000, 15000]] = [120.0, -30.0, 150.0]
+        self.values[7] = np.nan
+        self.chunks = [pd.DataFrame({'x': part}) for part in np.array_split(self.values, 13)]
+        self.detector = StreamingDetector(epsilon=0.002, random_state=0)
+        for chunk in self.chunks:
+            self.detector.update(chunk)
+
+    def test_moments_exact_and_quantiles_close(self):
+        """Welford moments are exact; sketch estimates track exact quantiles"""
+        stats = self.detector.statistics().loc['x']
+        series = pd.Series(self.values)
+        self.assertEqual(stats['count'], series.count())
+        self.assertAlmostEqual(stats['mean'], series.mean(), places=9)
+        self.assertAlmostEqual(stats['std'], series.std(), places=9)
+        for key, q in [('Q1', 0.25), ('median', 0.5), ('Q3', 0.75)]:
+            self.assertAlmostEqual(stats[key], series.quantile(q), delta=0.05)
+        exact_mad = (series - series.median()).abs().median()
+        self.assertAlmostEqual(stats['mad'], exact_mad, delta=0.05)
+
+    def test_detect_matches_in_memory_thresholds(self):
+        """detect applies the same rules as the in-memory detectors"""
+        frame = pd.DataFrame({'x': self.values})
+        cleaner = StatClean(frame)
+        zscore = self.detector.detect(frame, method='zscore')['x']
+        pd.testing.assert_series_equal(zscore, cleaner.detect_outliers_zscore('x'), check_names=False)
+        for method in ['iqr', 'modified_zscore']:
+            flagged = self.detector.detect(frame['x'], method=method)
+            self.assertTrue(flagged.loc[[100, 5000, 15000]].all())
+            self.assertFalse(flagged.loc[7])
+
+    def test_merge_partitions(self):
+        """Detectors fed separate partitions merge into one summary"""
+        left = StreamingDetector(epsilon=0.002, random_state=1)
+        right = StreamingDetector(epsilon=0.002, random_state=2)
+        for i, chunk in enumerate(self.chunks):
+            (left if i % 2 else right).update(chunk)
+        stats = left.merge(right).statistics().loc['x']
+        expected = self.detector.statistics().loc['x']
+        self.assertEqual(stats['count'], expected['count'])
+        self.assertAlmostEqual(stats['mean'], expected['mean'], places=9)
+        self.assertAlmostEqual(stats['std'], expected['std'], places=9)
+        for key in ['Q1', 'median', 'Q3', 'mad']:
+            self.assertAlmostEqual(stats[key], expected[key], delta=0.05)
+        with self.assertRaises(ValueError):
+            left.merge(StreamingDetector(epsilon=0.01).update(self.chunks[0]))
+
+    def test_small_streams_and_errors(self):
+        """Estimates are exact before the sketch compacts; misuse raises"""
+        detector = StreamingDetector(columns=['x']).update(pd.DataFrame({'x': [3.0, 1.0, 2.0, 10.0]}))
+        stats = detector.statistics().loc['x']
+        self.assertEqual(stats['median'], 2.5)
+        self.assertEqual(stats['Q3'], pd.Series([3.0, 1.0, 2.0, 10.0]).quantile(0.75))
+        with self.assertRaises(ValueError):
+            detector.detect(pd.DataFrame({'x': [1.0]}), method='mahalanobis')
+        with self.assertRaises(ValueError):
+            StreamingDetector().detect(pd.DataFrame({'x': [1.0]}))
+
+
+class TestOutOfCoreCleaning(unittest.TestCase):
+    """Tests for chunked file cleaning"""
+
+    def setUp(self):
+        rng = np.random.default_rng(10)
+        n = 20000
+        self.df = pd.DataFrame({
+            'id': np.arange(n),
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'c': np.round(rng.normal(0, 1, n), 2),
+            'label': rng.choice(['x', 'y'], n),
+        })
+        self.df.loc[rng.choice(n, 200, replace=False), 'a'] *= 10
+        self.df.loc[rng.choice(n, 20, replace=False), 'c'] = np.nan
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.source = os.path.join(self.tmpdir.name, 'input.csv')
+        self.df.to_csv(self.source, index=False)
+
+    def read(self, name):
+        return pd.read_csv(os.path.join(self.tmpdir.name, name), float_precision='round_trip')
+
+    def test_matches_apply_cleaning_strategy(self):
+        """Chunked cleaning reproduces the in-memory strategy exactly"""
+        strategy = {
+            'a': {'method': 'iqr'},
+            'b': {'method': 'modified_zscore', 'threshold': 3.0},
+            'c': {'method': 'zscore'},
+        }
+        report_path = os.path.join(self.tmpdir.name, 'report.json')
+        # A small chunk size forces several histogram refinement passes
+        report = clean_file(self.source, os.path.join(self.tmpdir.name, 'out.csv'), strategy,
+                            chunksize=700, report_path=report_path)
+
+        cleaner = StatClean(pd.read_csv(self.source, float_precision='round_trip'))
+        cleaner.apply_cleaning_strategy(strategy)
+        expected = cleaner.clean_df.reset_index(drop=True)
+        output = self.read('out.csv')
+        pd.testing.assert_frame_equal(output, expected)
+
+        self.assertEqual(report['rows_out'], len(expected))
+        self.assertEqual(report['steps'][0]['Q1'], cleaner.outlier_info['a']['Q1'])
+        self.assertEqual(report['steps'][0]['num_outliers'], cleaner.outlier_info['a']['num_outliers'])
+        self.assertEqual(report['steps'][1]['num_outliers'], cleaner.outlier_info['b']['num_outliers'])
+        with open(report_path) as handle:
+            self.assertEqual(json.load(handle)['rows_removed'], len(self.df) - len(expected))
+
+    def test_strategy_with_percentile_caps(self):
+        """One strategy with caps and removals gives the same frame in memory and chunked"""
+        strategy = {
+            'b': {'method': 'winsorize_percentile', 'lower_percentile': 2, 'upper_percentile': 98},
+            'a': {'method': 'iqr'},
+            'c': {'method': 'zscore', 'threshold': 2.5},
+        }
+        clean_file(self.source, os.path.join(self.tmpdir.name, 'out.csv'), strategy, chunksize=3000)
+
+        cleaner = StatClean(pd.read_csv(self.source, float_precision='round_trip'))
+        cleaner.apply_cleaning_strategy(strategy)
+        expected = cleaner.clean_df.reset_index(drop=True)
+        self.assertLess(expected['b'].max(), self.df['b'].max())
+        pd.testing.assert_frame_equal(self.read('out.csv'), expected)
+
+    def test_non_sequential_matches_statclean(self):
+        """clean_file(sequential=False) and apply_cleaning_strategy(sequential=False) keep the same rows"""
+        strategy = {
+            'b': {'method': 'winsorize_percentile', 'lower_percentile': 2, 'upper_percentile': 98},
+            'a': {'method': 'iqr'},
+            'c': {'method': 'modified_zscore', 'threshold': 3.0},
+        }
+        clean_file(self.source, os.path.join(self.tmpdir.name, 'out.csv'), strategy,
+                   chunksize=3000, sequential=False)
+        cleaner = StatClean(pd.read_csv(self.source, float_precision='round_trip'))
+        cleaner.apply_cleaning_strategy(strategy, n_jobs=2, sequential=False)
+        pd.testing.assert_frame_equal(self.read('out.csv'), cleaner.clean_df.reset_index(drop=True))
+
+    def test_percentile_winsorize_and_errors(self):
+        """Percentile caps equal winsorize_outliers_percentile; bad input raises"""
+        clean_file(self.source, os.path.join(self.tmpdir.name, 'capped.csv'),
+                   {'b': {'method': 'winsorize_percentile', 'lower_percentile': 2, 'upper_percentile': 98}},
+                   chunksize=3000)
+        cleaner = StatClean(pd.read_csv(self.source, float_precision='round_trip'))
+        cleaner.winsorize_outliers_percentile('b', 2, 98)
+        np.testing.assert_array_equal(self.read('capped.csv')['b'].to_numpy(), cleaner.clean_df['b'].to_numpy())
+
+        with self.assertRaises(ValueError):
+            clean_file(self.source, os.path.join(self.tmpdir.name, 'x.csv'), {'a': {'method': 'auto'}})
+        with self.assertRaises(ValueError):
+            clean_file(self.source, os.path.join(self.tmpdir.name, 'x.unknown'), {'a': {'method': 'iqr'}})
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow not installed")
+    def test_parquet_round_trip(self):
+        """Parquet input/output goes through the same stages"""
+        source = os.path.join(self.tmpdir.name, 'input.parquet')
+        output = os.path.join(self.tmpdir.name, 'out.parquet')
+        self.df.to_parquet(source, row_group_size=4000)
+        strategy = {'a': {'method': 'modified_zscore'}, 'b': {'method': 'winsorize_percentile'}}
+        report = clean_file(source, output, strategy, chunksize=2500)
+
+        cleaner = StatClean(self.df).remove_outliers_modified_zscore('a').winsorize_outliers_percentile('b')
+        result = pd.read_parquet(output)
+        self.assertEqual(report['rows_out'], len(cleaner.clean_df))
+        np.testing.assert_array_equal(result['id'].to_numpy(), cleaner.clean_df['id'].to_numpy())
+        np.testing.assert_array_equal(result['b'].to_numpy(), cleaner.clean_df['b'].to_numpy())
+
+
+class TestQuantileSketches(unittest.TestCase):
+    """Tests for mergeable KLL sketches and approximate=True"""
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.values = rng.lognormal(0, 1, 100000)
+        self.sorted_values = np.sort(self.values)
+
+    def rank_error(self, estimates, qs):
+        ranks = np.searchsorted(self.sorted_values, estimates, side='right') / len(self.values)
+        return np.max(np.abs(ranks - np.asarray(qs)))
+
+    def test_merged_partitions_within_error_bound(self):
+        """Sketches of separate partitions merge into global quantiles"""
+        qs = np.linspace(0.01, 0.99, 50)
+        partitions = np.array_split(self.values, 6)
+        sketch = KLLSketch(0.01, random_state=1).update(partitions[0])
+        for seed, part in enumerate(partitions[1:]):
+            sketch.merge(KLLSketch(0.01, random_state=seed).update(part))
+        self.assertEqual(sketch.count, len(self.values))
+        self.assertLess(sketch.num_retained, 2000)
+        self.assertLess(self.rank_error(sketch.quantiles(qs), qs), 0.01)
+        self.assertEqual(sketch.quantile(0.0), self.values.min())
+        self.assertEqual(sketch.quantile(1.0), self.values.max())
+        with self.assertRaises(ValueError):
+            sketch.merge(KLLSketch(0.05))
+
+    def test_approximate_bounds(self):
+        """approximate=True gives bounds close to the exact ones"""
+        df = pd.DataFrame({'x': self.values})
+        cleaner = StatClean(df).set_thresholds(sketch_epsilon=0.005)
+        _, _, exact = cleaner._calculate_iqr_bounds('x')
+        _, _, approx = cleaner._calculate_iqr_bounds('x', approximate=True)
+        self.assertLess(self.rank_error([approx['Q1'], approx['Q3']], [0.25, 0.75]), 0.005)
+        self.assertAlmostEqual(approx['Q3'], exact['Q3'], delta=0.05)
+
+        stats = cleaner.get_outlier_stats(['x'], methods=['iqr'], approximate=True)
+        exact_count = cleaner.detect_outliers_iqr('x').sum()
+        self.assertAlmostEqual(stats.loc[0, 'Potential Outliers'], exact_count, delta=0.02 * exact_count)
+
+        cleaner.winsorize_outliers_percentile('x', 5, 95, approximate=True)
+        self.assertLess(self.rank_error([cleaner.outlier_info['x']['upper_bound']], [0.95]), 0.005)
+        with self.assertRaises(ValueError):
+            cleaner.detect_outliers_iqr('x', by='x', approximate=True)
+
+
+class TestParallelCleaning(unittest.TestCase):
+    """Tests for n_jobs in clean_columns and apply_cleaning_strategy"""
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        n = 8000
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'c': rng.integers(0, 5, n).astype(float),
+            'd': rng.standard_t(3, n),
+            'e': rng.uniform(0, 1, n),
+        })
+
+    def assert_same_cleaning(self, serial, parallel):
+        pd.testing.assert_frame_equal(serial.clean_df, parallel.clean_df)
+        self.assertEqual(list(serial.outlier_info), list(parallel.outlier_info))
+        for column, info in serial.outlier_info.items():
+            key = 'outlier_indices' if 'outlier_indices' in info else 'winsorized_indices'
+            np.testing.assert_array_equal(info[key], parallel.outlier_info[column][key])
+            self.assertEqual(info['method'], parallel.outlier_info[column]['method'])
+
+    def test_clean_columns_matches_serial(self):
+        """Sequential cleaning with n_jobs gives exactly the serial result"""
+        for init in ({}, {'deferred': True}, {'incremental': True}):
+            for method in ('auto', 'iqr'):
+                serial = StatClean(self.df, **init)
+                parallel = StatClean(self.df, **init)
+                _, serial_summary = serial.clean_columns(method=method, show_progress=False, random_state=0)
+                _, parallel_summary = parallel.clean_columns(method=method, show_progress=False,
+                                                             n_jobs=3, random_state=0)
+                self.assert_same_cleaning(serial, parallel)
+                pd.testing.assert_frame_equal(serial_summary, parallel_summary)
+
+    def test_apply_cleaning_strategy_matches_serial(self):
+        """Column order semantics are kept when strategies run in parallel"""
+        strategy = {'b': {'method': 'iqr'}, 'a': {'method': 'zscore', 'threshold': 2.5},
+                    'c': {'method': 'unknown'}, 'e': {'method': 'auto'}, 'd': {'method': 'modified_zscore'}}
+        serial = StatClean(self.df).apply_cleaning_strategy(strategy, random_state=0)
+        parallel = StatClean(self.df).apply_cleaning_strategy(strategy, n_jobs=2, random_state=0)
+        self.assert_same_cleaning(serial, parallel)
+        self.assertNotIn('c', parallel.outlier_info)
+
+    def test_output_stays_in_calling_thread(self):
+        """Messages, warnings and events are those of the serial run; no process-wide hooks are swapped"""
+        df = self.df.assign(f=1.0, g=np.r_[np.zeros(7999), 50.0])
+        strategy = {'a': {'method': 'iqr'}, 'f': {'method': 'zscore'}, 'g': {'method': 'modified_zscore'}}
+        runs = []
+        for n_jobs in (None, 3):
+            streams = []
+
+            def listener(event):
+                streams.append((sys.stdout, warnings.showwarning))
+
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer), warnings.catch_warnings(record=True) as caught, \
+                    EventRecorder() as recorder:
+                warnings.simplefilter('always')
+                instrumentation.add_listener(listener)
+                try:
+                    StatClean(df).apply_cleaning_strategy(strategy, n_jobs=n_jobs)
+                finally:
+                    instrumentation.remove_listener(listener)
+                showwarning = warnings.showwarning
+            self.assertTrue(all(stream is buffer and hook is showwarning for stream, hook in streams))
+            runs.append((buffer.getvalue(), [str(w.message) for w in caught],
+                         recorder.to_frame()[['method', 'column', 'rows_in', 'rows_out']]))
+        self.assertEqual(runs[0][0], runs[1][0])
+        self.assertEqual(runs[0][1], runs[1][1])
+        self.assertTrue(runs[0][1])
+        pd.testing.assert_frame_equal(runs[0][2], runs[1][2])
+
+    def test_non_sequential_mode(self):
+        """sequential=False flags every column on the same rows and removes their union once"""
+        strategy = {'b': {'method': 'iqr'}, 'a': {'method': 'zscore', 'threshold': 2.5},
+                    'e': {'method': 'winsorize_percentile'}, 'd': {'method': 'modified_zscore'}}
+        reference = StatClean(self.df)
+        flagged = (reference.detect_outliers_iqr('b') | reference.detect_outliers_zscore('a', 2.5)
+                   | reference.detect_outliers_modified_zscore('d'))
+        capped = StatClean(self.df).winsorize_outliers_percentile('e').clean_df['e']
+        expected = self.df.assign(e=capped)[~flagged]
+        for init in ({}, {'deferred': True}, {'incremental': True}):
+            results = []
+            for n_jobs in (None, 3):
+                with EventRecorder() as recorder:
+                    cleaner = StatClean(self.df, **init).apply_cleaning_strategy(strategy, n_jobs=n_jobs,
+                                                                                 sequential=False)
+                pd.testing.assert_frame_equal(cleaner.clean_df, expected)
+                self.assertEqual(cleaner.outlier_info['b']['num_outliers'],
+                                 int(reference.detect_outliers_iqr('b').sum()))
+                results.append((cleaner, recorder.to_frame(None)[['event', 'method', 'column', 'depth']]))
+            self.assert_same_cleaning(results[0][0], results[1][0])
+            pd.testing.assert_frame_equal(results[0][1], results[1][1])
+            self.assertEqual(results[0][1]['column'].dropna().unique().tolist(), list(strategy))
+
+        cleaned, summary = StatClean(self.df).clean_columns(method='iqr', show_progress=False,
+                                                              n_jobs=2, sequential=False)
+        reference = StatClean(self.df)
+        flagged = np.logical_or.reduce([reference.detect_outliers_iqr(column).to_numpy()
+                                        for column in self.df.columns])
+        pd.testing.assert_frame_equal(cleaned, self.df[~flagged])
+        self.assertEqual(summary['Column'].tolist(), list(self.df.columns))
+
+    def test_invalid_n_jobs(self):
+        with self.assertRaises(ValueError):
+            StatClean(self.df).clean_columns(show_progress=False, n_jobs=0)
+        with self.assertRaises(ValueError):
+            StatClean(self.df).clean_columns(method='bogus', show_progress=False, n_jobs=2)
+
+
+class TestArrayEngine(unittest.TestCase):
+    """Tests for the NumPy columnar engine and engine='numpy'"""
+
+    def setUp(self):
+        rng = np.random.default_rng(13)
+        n = 20000
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'c': rng.standard_t(3, n),
+        })
+        self.df.loc[rng.integers(0, n, 50), 'b'] = np.nan
+        self.strategy = {'a': {'method': 'iqr'}, 'b': {'method': 'zscore', 'threshold': 2.5},
+                         'c': {'method': 'winsorize_percentile', 'lower_percentile': 1, 'upper_percentile': 99}}
+
+    def test_numpy_engine_matches_pandas(self):
+        """engine='numpy' gives the same frames, masks and statistics"""
+        results = []
+        for engine in ('pandas', 'numpy'):
+            cleaner = StatClean(self.df, engine=engine, deferred=True)
+            cleaner.remove_outliers_iqr('a').remove_outliers_zscore('b')
+            cleaner.winsorize_outliers_percentile('c', 2, 98)
+            results.append((cleaner, cleaner.detect_outliers_modified_zscore('c')))
+        (pandas_cleaner, pandas_mask), (numpy_cleaner, numpy_mask) = results
+        pd.testing.assert_frame_equal(pandas_cleaner.clean_df, numpy_cleaner.clean_df)
+        pd.testing.assert_series_equal(pandas_mask, numpy_mask)
+        for key in ('lower_bound', 'upper_bound'):
+            self.assertEqual(pandas_cleaner.outlier_info['a'][key], numpy_cleaner.outlier_info['a'][key])
+        self.assertEqual(pandas_cleaner.outlier_info['b']['std'], numpy_cleaner.outlier_info['b']['std'])
+        with self.assertRaises(ValueError):
+            StatClean(self.df, engine='spark')
+
+    def test_memory_mapped_npy(self):
+        """Chunked processing of a .npy file matches the in-memory engine and StatClean"""
+        array = self.df.to_numpy()
+        in_memory = ArrayEngine(array, columns=['a', 'b', 'c']).apply_cleaning_strategy(self.strategy)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.npy')
+            np.save(path, array)
+            mapped = ArrayEngine.from_npy(path, columns=['a', 'b', 'c'], chunk_size=3000)
+            mapped.apply_cleaning_strategy(self.strategy)
+            output = os.path.join(tmp, 'clean.npy')
+            mapped.save(output)
+            saved = np.load(output)
+            np.testing.assert_array_equal(np.load(path), array)
+
+        np.testing.assert_array_equal(saved, in_memory.to_numpy())
+        for column in ('a', 'b'):
+            np.testing.assert_array_equal(mapped.outlier_info[column]['outlier_indices'],
+                                          in_memory.outlier_info[column]['outlier_indices'])
+        reference = StatClean(self.df).apply_cleaning_strategy({'a': self.strategy['a'], 'b': self.strategy['b']})
+        reference.winsorize_outliers_percentile('c', 1, 99)
+        np.testing.assert_array_equal(in_memory.to_numpy(), reference.clean_df.to_numpy())
+        np.testing.assert_array_equal(in_memory.row_positions(), reference.clean_df.index.to_numpy())
+
+    def test_memory_mapped_winsorize_stays_mapped(self):
+        """Winsorizing a mapped column writes a mapped copy chunk by chunk"""
+        array = self.df.to_numpy()
+        in_memory = ArrayEngine(array, columns=['a', 'b', 'c'])
+        in_memory.remove('a', 'iqr').winsorize('c', 'zscore', threshold=2.0).winsorize('c', 'percentile')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.npy')
+            np.save(path, array)
+            mapped = ArrayEngine.from_npy(path, columns=['a', 'b', 'c'], chunk_size=3000, temp_dir=tmp)
+            mapped.remove('a', 'iqr').winsorize('c', 'zscore', threshold=2.0)
+            self.assertIsInstance(mapped._data['c'], np.memmap)
+            mapped.winsorize('c', 'percentile')
+            np.testing.assert_array_equal(mapped.to_numpy(), in_memory.to_numpy())
+            np.testing.assert_array_equal(np.load(path), array)
+            for key in ['num_winsorized', 'num_winsorized_lower', 'num_winsorized_upper']:
+                self.assertEqual(mapped.outlier_info['c'][key], in_memory.outlier_info['c'][key])
+            np.testing.assert_array_equal(mapped.outlier_info['c']['winsorized_indices'],
+                                          in_memory.outlier_info['c']['winsorized_indices'])
+            del mapped
+
+    def test_numpy_engine_reuses_converted_columns(self):
+        """engine='numpy' converts non-float columns once per column version"""
+        df = pd.DataFrame({'k': np.arange(1000) % 97, 'x': np.linspace(0, 1, 1000)})
+        df.loc[::50, 'k'] = 500
+        cleaner = StatClean(df, engine='numpy')
+        first = cleaner._column_engine('k')._data['k']
+        self.assertIs(cleaner._column_engine('k')._data['k'], first)
+        self.assertTrue(np.shares_memory(cleaner._column_engine('x')._data['x'], cleaner.clean_df['x'].to_numpy()))
+        cleaner.clean_df.loc[0, 'k'] = 10_000
+        cleaner.invalidate('k')
+        self.assertEqual(cleaner._column_engine('k')._data['k'][0], 10_000)
+        cleaner.remove_outliers_iqr('k')
+        self.assertEqual(len(cleaner._column_engine('k')._data['k']), len(cleaner.clean_df))
+
+    def test_input_not_modified(self):
+        array = self.df.to_numpy().copy()
+        engine = ArrayEngine(array, columns=['a', 'b', 'c'])
+        engine.winsorize('a', 'zscore', threshold=2.0)
+        np.testing.assert_array_equal(array, self.df.to_numpy())
+        self.assertGreater(engine.outlier_info['a']['num_winsorized'], 0)
+        self.assertEqual(engine.detect('b', 'iqr').shape, (len(self.df),))
+        with self.assertRaises(ValueError):
+            engine.remove('a', 'percentile')
+
+
+@unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow not installed")
+class TestArrowEngine(unittest.TestCase):
+    """Tests for the pyarrow.compute backend"""
+
+    def setUp(self):
+        import pyarrow
+        self.pa = pyarrow
+        rng = np.random.default_rng(17)
+        n = 6000
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'k': rng.integers(0, 100, n),
+            'label': rng.choice(['x', 'y'], n),
+        })
+        self.df.loc[rng.integers(0, n, 30), 'b'] = np.nan
+        table = pyarrow.Table.from_pandas(self.df, preserve_index=False)
+        # Several chunks per column
+        self.table = pyarrow.concat_tables([table.slice(start, 1000) for start in range(0, n, 1000)])
+
+    def test_strategy_matches_statclean(self):
+        """Filtering and capping on a multi-chunk table match the pandas path"""
+        strategy = {'a': {'method': 'iqr'}, 'b': {'method': 'modified_zscore', 'threshold': 3.0},
+                    'k': {'method': 'winsorize_percentile', 'lower_percentile': 5, 'upper_percentile': 90}}
+        engine = ArrowEngine(self.table).apply_cleaning_strategy(strategy)
+        self.assertIsInstance(engine.table, self.pa.Table)
+        self.assertGreater(engine.table.column('a').num_chunks, 1)
+
+        cleaner = StatClean(self.df).remove_outliers_iqr('a').remove_outliers_modified_zscore('b', threshold=3.0)
+        cleaner.winsorize_outliers_percentile('k', 5, 90)
+        np.testing.assert_array_equal(engine.row_positions(), cleaner.clean_df.index.to_numpy())
+        result = engine.table.to_pandas()
+        np.testing.assert_array_equal(result['k'].to_numpy(dtype=float), cleaner.clean_df['k'].to_numpy(dtype=float))
+        np.testing.assert_array_equal(result['label'].to_numpy(), cleaner.clean_df['label'].to_numpy())
+        self.assertEqual(engine.outlier_info['k']['num_winsorized'], cleaner.outlier_info['k']['num_winsorized'])
+
+    def test_zscore_and_missing_values(self):
+        """Missing values are skipped by the statistics and kept by winsorizing"""
+        engine = ArrowEngine(self.table)
+        stats = engine.statistics('b', 'zscore')
+        self.assertAlmostEqual(stats['mean'], self.df['b'].mean(), places=12)
+        self.assertAlmostEqual(stats['std'], self.df['b'].std(), places=12)
+        np.testing.assert_array_equal(engine.detect('b', 'zscore').to_numpy(),
+                                      StatClean(self.df).detect_outliers_zscore('b').to_numpy())
+        engine.winsorize('b', 'zscore', threshold=2.0)
+        self.assertEqual(engine.table.column('b').null_count, self.df['b'].isna().sum())
+        with self.assertRaises(ValueError):
+            engine.remove('label', 'iqr')
+
+
+@unittest.skipUnless(importlib.util.find_spec('polars'), "polars not installed")
+class TestPolarsEngine(unittest.TestCase):
+    """Tests for the Polars backend and compiled lazy strategies"""
+
+    def setUp(self):
+        import polars
+        self.pl = polars
+        rng = np.random.default_rng(19)
+        n = 6000
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'k': rng.integers(0, 100, n),
+            'label': rng.choice(['x', 'y'], n),
+        })
+        self.df.loc[rng.integers(0, n, 30), 'b'] = np.nan
+        self.frame = polars.DataFrame({column: self.df[column].to_numpy() for column in self.df.columns})
+        self.strategy = {'a': {'method': 'iqr'}, 'b': {'method': 'zscore', 'threshold': 2.5},
+                         'k': {'method': 'winsorize_percentile', 'lower_percentile': 5, 'upper_percentile': 90}}
+
+    def test_strategy_matches_statclean(self):
+        """The engine and the compiled lazy query give the pandas result"""
+        from statclean.polars import compile_strategy
+        engine = PolarsEngine(self.frame).apply_cleaning_strategy(self.strategy)
+        query = compile_strategy(self.frame.lazy(), self.strategy)
+        self.assertIsInstance(query, self.pl.LazyFrame)
+        compiled = query.collect()
+
+        cleaner = StatClean(self.df).remove_outliers_iqr('a').remove_outliers_zscore('b', threshold=2.5)
+        cleaner.winsorize_outliers_percentile('k', 5, 90)
+        np.testing.assert_array_equal(engine.row_positions(), cleaner.clean_df.index.to_numpy())
+        for result in (engine.frame, compiled):
+            for column in ('a', 'b', 'k'):
+                np.testing.assert_array_equal(result[column].to_numpy().astype(float),
+                                              cleaner.clean_df[column].to_numpy(dtype=float))
+            np.testing.assert_array_equal(result['label'].to_numpy(), cleaner.clean_df['label'].to_numpy())
+        self.assertEqual(engine.outlier_info['a']['upper_bound'], cleaner.outlier_info['a']['upper_bound'])
+        self.assertEqual(engine.outlier_info['k']['num_winsorized'], cleaner.outlier_info['k']['num_winsorized'])
+
+    def test_missing_values_and_validation(self):
+        """NaN is skipped by the statistics, never flagged and kept by winsorizing"""
+        engine = PolarsEngine(self.frame)
+        self.assertEqual(engine.columns, ['a', 'b', 'k'])
+        stats = engine.statistics('b', 'zscore')
+        self.assertAlmostEqual(stats['mean'], self.df['b'].mean(), places=12)
+        self.assertAlmostEqual(stats['std'], self.df['b'].std(), places=12)
+        np.testing.assert_array_equal(engine.detect('b', 'modified_zscore').to_numpy(),
+                                      StatClean(self.df).detect_outliers_modified_zscore('b').to_numpy())
+        engine.winsorize('b', 'zscore', threshold=2.0)
+        self.assertEqual(int(engine.frame['b'].is_nan().sum()), self.df['b'].isna().sum())
+        with self.assertRaises(ValueError):
+            engine.remove('label', 'iqr')
+        with self.assertRaises(ValueError):
+            engine.apply_cleaning_strategy({'a': {'method': 'bogus'}})
+
+
+class TestCleaningPlan(unittest.TestCase):
+    """Tests for fitted cleaning plans (fit on reference data, transform new batches)"""
+
+    def setUp(self):
+        rng = np.random.default_rng(23)
+        n = 4000
+        self.df = pd.DataFrame({
+            'a': rng.normal(0, 1, n),
+            'b': rng.lognormal(0, 1, n),
+            'c': rng.standard_t(3, n),
+            'd': rng.normal(2, 1, n),
+        })
+        self.df.loc[rng.integers(0, n, 20), 'b'] = np.nan
+        self.steps = [
+            {'method': 'transform_log', 'column': 'b'},
+            {'method': 'remove_outliers_zscore', 'column': 'b', 'threshold': 2.5},
+            {'method': 'remove_outliers_iqr', 'column': 'a'},
+            {'method': 'winsorize_outliers_percentile', 'column': 'c', 'lower_percentile': 2, 'upper_percentile': 98},
+            {'method': 'transform_boxcox', 'column': 'd'},
+            {'method': 'remove_outliers_modified_zscore', 'column': 'd'},
+            {'method': 'remove_outliers_mahalanobis', 'columns': ['a', 'c', 'd']},
+        ]
+
+    def test_transform_reproduces_fit(self):
+        """Transforming the reference data gives the StatClean result"""
+        original = self.df.copy()
+        with self.assertWarns(UserWarning):
+            plan = StatClean(self.df).fit_plan(self.steps)
+        pd.testing.assert_frame_equal(self.df, original)
+        self.assertEqual(len(plan), len(self.steps))
+        self.assertEqual(plan.steps[-1]['precision'].shape, (3, 3))
+
+        cleaner = StatClean(self.df)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            cleaner.transform_log('b')
+            cleaner.remove_outliers_zscore('b', threshold=2.5).remove_outliers_iqr('a')
+            cleaner.winsorize_outliers_percentile('c', 2, 98)
+            cleaner.transform_boxcox('d')
+            cleaner.remove_outliers_modified_zscore('d').remove_outliers_mahalanobis(['a', 'c', 'd'])
+        result = plan.transform(self.df)
+        pd.testing.assert_index_equal(result.index, cleaner.clean_df.index)
+        pd.testing.assert_frame_equal(result, cleaner.clean_df, check_exact=False, rtol=0, atol=1e-12)
+        self.assertEqual(int(plan.outlier_mask(self.df).sum()), len(self.df) - len(result))
+
+    def test_save_and_load(self):
+        """Saved plans load with identical parameters and results"""
+        with self.assertWarns(UserWarning):
+            plan = CleaningPlan.fit(self.df, self.steps)
+        with tempfile.TemporaryDirectory() as tmp:
+            plan.save(tmp)
+            self.assertEqual(sorted(os.listdir(tmp)), ['arrays.npz', 'manifest.json'])
+            loaded = CleaningPlan.load(tmp)
+        self.assertEqual(len(loaded), len(plan))
+        for fitted, restored in zip(plan.steps, loaded.steps):
+            self.assertEqual(fitted.keys(), restored.keys())
+            for key, value in fitted.items():
+                if isinstance(value, np.ndarray):
+                    np.testing.assert_array_equal(value, restored[key])
+                elif isinstance(value, float) and np.isnan(value):
+                    self.assertTrue(np.isnan(restored[key]))
+                else:
+                    self.assertEqual(value, restored[key])
+        pd.testing.assert_frame_equal(plan.transform(self.df), loaded.transform(self.df))
+
+    def test_single_record_scoring(self):
+        """RecordScorer flags records exactly like the plan does on a frame"""
+        with self.assertWarns(UserWarning):
+            plan = CleaningPlan.fit(self.df, self.steps)
+        scorer = plan.scorer()
+        self.assertEqual(scorer.columns, ['b', 'a', 'c', 'd'])
+        records = self.df[scorer.columns].to_numpy()
+        flags = [scorer.is_outlier(record) for record in records]
+        np.testing.assert_array_equal(flags, plan.outlier_mask(self.df).to_numpy())
+
+        row = self.df.iloc[7]
+        result = scorer.score(row.to_dict())
+        self.assertEqual(result, scorer.score(list(row[scorer.columns])))
+        self.assertEqual(set(result['flags']), {'a', 'b', 'd'})
+        b = (np.log(row['b']) - plan.steps[1]['center']) / plan.steps[1]['scale']
+        self.assertAlmostEqual(result['scores']['b'], abs(b), places=12)
+        self.assertIsInstance(result['mahalanobis'], float)
+
+        extreme = scorer.score({'a': 50.0, 'b': 1.0, 'c': 0.0, 'd': 2.0})
+        self.assertTrue(extreme['outlier'] and extreme['flags']['a'] and extreme['mahalanobis_outlier'])
+        missing = scorer.score({'b': 1.0})
+        self.assertFalse(missing['outlier'])
+        self.assertTrue(np.isnan(missing['mahalanobis']))
+        with self.assertRaises(ValueError):
+            scorer.score([1.0, 2.0])
+
+    def test_new_batch_uses_fitted_parameters(self):
+        """New batches are judged against the reference thresholds"""
+        plan = CleaningPlan.fit(self.df, {'a': {'method': 'iqr'},
+                                          'c': {'method': 'winsorize_percentile'}})
+        upper = plan.steps[0]['upper_bound']
+        batch = pd.DataFrame({'a': [0.0, upper - 0.01, upper + 0.01, np.nan], 'c': [100.0, -100.0, 0.0, 0.0]},
+                             index=[10, 11, 12, 13])
+        result = plan.transform(batch)
+        self.assertEqual(result.index.tolist(), [10, 11, 13])
+        self.assertEqual(result.loc[10, 'c'], plan.steps[1]['upper_bound'])
+        self.assertEqual(result.loc[11, 'c'], plan.steps[1]['lower_bound'])
+        with self.assertRaises(ValueError):
+            plan.transform(batch.drop(columns='c'))
+        with self.assertRaises(ValueError):
+            CleaningPlan.fit(self.df, [{'method': 'detect_outliers_iqr', 'column': 'a'}])
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests for start/end events of the public methods"""
+
+    def setUp(self):
+        rng = np.random.default_rng(29)
+        self.df = pd.DataFrame(rng.standard_t(3, size=(3000, 4)), columns=['a', 'b', 'c', 'd'])
+
+    def test_events_for_chain(self):
+        """Removal events carry rows in/out, wall time, nesting depth and memory peaks"""
+        with EventRecorder(track_memory=True) as recorder:
+            cleaner = StatClean(self.df).remove_outliers_iqr('a').remove_outliers_zscore('b')
+            with self.assertWarns(UserWarning):
+                cleaner.transform_sqrt('c')
+        cleaner.remove_outliers_iqr('d')
+        events = recorder.to_frame()
+        top = events[events['depth'] == 0]
+        self.assertEqual(top['method'].tolist(), ['remove_outliers_iqr', 'remove_outliers_zscore', 'transform_sqrt'])
+        self.assertEqual(top['column'].tolist(), ['a', 'b', 'c'])
+        self.assertEqual(top['rows_in'].iloc[0], len(self.df))
+        self.assertEqual(top['rows_out'].iloc[0], top['rows_in'].iloc[1])
+        self.assertTrue((top['wall_time'] > 0).all() and (top['peak_memory'] > 0).all())
+        nested = events[events['depth'] == 1]
+        self.assertEqual(nested['method'].tolist(), ['detect_outliers_zscore'])
+        self.assertTrue(nested['peak_memory'].isna().all())
+        self.assertEqual(len(recorder.to_frame('start')), len(events))
+
+    def test_parallel_events_match_serial(self):
+        """n_jobs delivers the events of the serial run, in order"""
+        sequences = []
+        for n_jobs in (None, 3):
+            with EventRecorder() as recorder:
+                StatClean(self.df).clean_columns(method='zscore', show_progress=False, n_jobs=n_jobs)
+            sequences.append(recorder.to_frame(None)[['event', 'method', 'column', 'rows_in', 'depth']]
+                             .values.tolist())
+        self.assertEqual(sequences[0], sequences[1])
+
+    def test_errors_and_listeners(self):
+        """Failing calls emit an end event with the error; removed listeners get nothing"""
+        received = []
+        instrumentation.add_listener(received.append)
+        try:
+            with self.assertRaises(ValueError):
+                StatClean(self.df).remove_outliers_iqr('missing')
+        finally:
+            instrumentation.remove_listener(received.append)
+        self.assertEqual([event['event'] for event in received], ['start', 'end'])
+        self.assertIn('ValueError', received[-1]['error'])
+        StatClean(self.df).detect_outliers_iqr('a')
+        self.assertEqual(len(received), 2)
+
+
+class TestStatisticsCache(unittest.TestCase):
+    """Test the versioned per-column statistics cache"""
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.df = pd.DataFrame({
+            'a': np.r_[rng.normal(size=400), [30.0, -25.0]],
+            'b': np.r_[rng.lognormal(size=400), [80.0, 90.0]],
+            'c': rng.normal(size=402),
+        })
+
+    def test_statistics_follow_mutations(self):
+        """Cached statistics are never returned after removals, winsorizing or transforms"""
+        for engine in ('pandas', 'numpy'):
+            for deferred in (False, True):
+                cleaner = StatClean(self.df, engine=engine, deferred=deferred)
+                cleaner.add_zscore_columns(['a', 'b'])
+                cleaner.remove_outliers_iqr('a')
+                mean, std, _ = cleaner._calculate_zscore_stats('a')
+                self.assertAlmostEqual(mean, cleaner.clean_df['a'].mean())
+                self.assertAlmostEqual(std, cleaner.clean_df['a'].std())
+                cleaner.winsorize_outliers_iqr('b')
+                q1 = cleaner._calculate_iqr_bounds('b')[2]['Q1']
+                self.assertAlmostEqual(q1, cleaner.clean_df['b'].quantile(0.25))
+                with self.assertWarns(UserWarning):
+                    cleaner.transform_sqrt('c')
+                median, mad, _ = cleaner._calculate_modified_zscore_stats('c')
+                self.assertAlmostEqual(median, cleaner.clean_df['c'].median())
+
+    def test_direct_clean_df_writes(self):
+        """Replacing a clean_df column is detected; in-place writes are followed by invalidate()"""
+        for init in ({}, {'deferred': True}, {'engine': 'numpy'}):
+            cleaner = StatClean(pd.DataFrame({'a': np.arange(1000.0)}), **init)
+            cleaner.detect_outliers_zscore('a')
+            cleaner.detect_outliers_iqr('a')
+            cleaner.detect_outliers_modified_zscore('a')
+            # Removes nothing: cached statistics stay valid for the rebuilt frame
+            cleaner.remove_outliers_iqr('a')
+
+            values = np.random.default_rng(0).normal(size=1000)
+            values[10] = 8.0
+            cleaner.clean_df['a'] = values
+            fresh = StatClean(pd.DataFrame({'a': values}))
+            for method in ('detect_outliers_zscore', 'detect_outliers_iqr', 'detect_outliers_modified_zscore'):
+                pd.testing.assert_series_equal(getattr(cleaner, method)('a'), getattr(fresh, method)('a'))
+            self.assertTrue(cleaner.detect_outliers_zscore('a')[10])
+
+            cleaner.clean_df.loc[:5, 'a'] = 50.0
+            values[:6] = 50.0
+            expected = StatClean(pd.DataFrame({'a': values})).detect_outliers_zscore('a')
+            pd.testing.assert_series_equal(cleaner.invalidate('a').detect_outliers_zscore('a'), expected)
+
+            cleaner.clean_df.loc[:5, 'a'] = 0.0
+            cleaner.invalidate()
+            values[:6] = 0.0
+            expected = StatClean(pd.DataFrame({'a': values})).detect_outliers_zscore('a')
+            pd.testing.assert_series_equal(cleaner.detect_outliers_zscore('a'), expected)
+
+    def test_repeated_calls_reuse_statistics(self):
+        """Repeated detect, report and compare calls hit the cache and give the same results"""
+        cleaner = StatClean(self.df)
+        first = cleaner.detect_outliers_modified_zscore('a')
+        hits = cleaner.cache_info()['hits']
+        pd.testing.assert_series_equal(cleaner.detect_outliers_modified_zscore('a'), first)
+        self.assertEqual(cleaner.cache_info()['hits'], hits + 1)
+
+        stats_df = cleaner.get_outlier_stats()
+        hits = cleaner.cache_info()['hits']
+        cleaner.compare_methods()
+        self.assertGreaterEqual(cleaner.cache_info()['hits'], hits + 3)
+
+        cleaner.remove_outliers_iqr('a')
+        pd.testing.assert_frame_equal(cleaner.get_outlier_stats(),
+                                      StatClean(cleaner.clean_df.copy()).get_outlier_stats())
+        self.assertNotEqual(cleaner.get_outlier_stats()['Potential Outliers'].tolist(),
+                            stats_df['Potential Outliers'].tolist())
+
+    def test_size_bound(self):
+        """The LRU keeps at most stats_cache_size entries; 0 disables it"""
+        cleaner = StatClean(self.df, stats_cache_size=2)
+        for column in ['a', 'b', 'c']:
+            cleaner.detect_outliers_zscore(column)
+        self.assertEqual(cleaner.cache_info()['size'], 2)
+        cleaner.reset()
+        self.assertEqual(cleaner.cache_info()['size'], 0)
+        cleaner = StatClean(self.df, stats_cache_size=0)
+        cleaner.detect_outliers_zscore('a')
+        self.assertEqual(cleaner.cache_info()['size'], 0)
+
+
+class TestIncrementalStatistics(unittest.TestCase):
+    """Test statistics maintained incrementally under row removal"""
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.df = pd.DataFrame(rng.standard_t(3, size=(3000, 4)).round(2), columns=['a', 'b', 'c', 'd'])
+        self.df.loc[::37, 'c'] = np.nan
+
+    def test_statistics_track_removals(self):
+        """Quantiles, medians and MADs stay exact, moments match to rounding"""
+        cleaner = StatClean(self.df, incremental=True)
+        for column in ['a', 'b', 'c', 'd']:
+            cleaner._calculate_iqr_bounds(column)
+        cleaner.remove_outliers_iqr('a').remove_outliers_zscore('b', threshold=2.0)
+        current = cleaner.clean_df
+        for column in ['a', 'b', 'c', 'd']:
+            stats = cleaner._calculate_iqr_bounds(column)[2]
+            self.assertEqual(stats['Q1'], current[column].quantile(0.25))
+            self.assertEqual(stats['Q3'], current[column].quantile(0.75))
+            median, mad, _ = cleaner._calculate_modified_zscore_stats(column)
+            self.assertEqual(median, current[column].median())
+            if column == 'c':
+                self.assertTrue(np.isnan(mad))
+            else:
+                self.assertEqual(mad, np.median(np.abs(current[column] - current[column].median())))
+            mean, std, _ = cleaner._calculate_zscore_stats(column)
+            self.assertAlmostEqual(mean, current[column].mean(), places=12)
+            self.assertAlmostEqual(std, current[column].std(), places=12)
+
+    def test_removal_chain_matches_full_recomputation(self):
+        """Repeated removal passes give the same rows as the default mode"""
+        for n_jobs in (None, 3):
+            results = []
+            for incremental in (False, True):
+                cleaner = StatClean(self.df, incremental=incremental)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for _ in range(2):
+                        cleaner.clean_columns(method='modified_zscore', show_progress=False, n_jobs=n_jobs)
+                        cleaner.clean_columns(method='iqr', show_progress=False, n_jobs=n_jobs)
+                results.append(cleaner.clean_df)
+            pd.testing.assert_frame_equal(results[0], results[1])
+        self.assertTrue(StatClean(self.df, incremental=True).deferred)
+
+    def test_tail_removal_matches_masks(self):
+        """Removals read from the sorted tails report the rows and labels of the mask path"""
+        df = self.df.set_axis(np.arange(len(self.df))[::-1] * 2)
+        chain = [('iqr', 'a'), ('zscore', 'c'), ('modified_zscore', 'b'), ('zscore', 'a'), ('iqr', 'c')]
+        for preserve_index in (True, False):
+            cleaners = [StatClean(df, preserve_index=preserve_index, incremental=incremental)
+                        for incremental in (False, True)]
+            for method, column in chain:
+                infos = []
+                for cleaner in cleaners:
+                    getattr(cleaner, f'remove_outliers_{method}')(column)
+                    infos.append(cleaner.outlier_info[column])
+                self.assertEqual(infos[1]['num_outliers'], infos[0]['num_outliers'])
+                np.testing.assert_array_equal(infos[1]['outlier_indices'], infos[0]['outlier_indices'])
+            self.assertLess(len(cleaners[0].clean_df), len(df))
+            pd.testing.assert_frame_equal(cleaners[1].clean_df, cleaners[0].clean_df)
+
+    def test_direct_clean_df_writes(self):
+        """Tracked statistics are rebuilt after a column is replaced or invalidated"""
+        cleaner = StatClean(pd.DataFrame({'a': np.arange(1000.0)}), incremental=True)
+        cleaner.detect_outliers_iqr('a')
+        cleaner.remove_outliers_zscore('a')
+        values = np.random.default_rng(0).normal(size=1000)
+        values[10] = 8.0
+        cleaner.clean_df['a'] = values
+        cleaner.clean_df.loc[:2, 'a'] = 40.0
+        cleaner.invalidate('a')
+        values[:3] = 40.0
+        fresh = StatClean(pd.DataFrame({'a': values}))
+        for method in ('detect_outliers_zscore', 'detect_outliers_iqr', 'detect_outliers_modified_zscore'):
+            pd.testing.assert_series_equal(getattr(cleaner, method)('a'), getattr(fresh, method)('a'))
+
+
+class TestIterativeRemoval(unittest.TestCase):
+    """Test iterate-until-convergence removal"""
+
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.df = pd.DataFrame({
+            'a': np.r_[rng.normal(size=2000), [60.0, 45.0, 30.0, 18.0, 9.0, 7.0]],
+            'b': np.r_[rng.standard_t(3, size=2000), np.full(6, np.nan)],
+            'g': np.arange(2006) % 3,
+        })
+
+    def manual_loop(self, method, column, **init):
+        cleaner = StatClean(self.df, **init)
+        rows = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            while rows != len(cleaner.clean_df):
+                rows = len(cleaner.clean_df)
+                getattr(cleaner, f'remove_outliers_{method}')(column)
+        return cleaner.clean_df
+
+    def test_matches_repeated_removal(self):
+        """Iterating gives the rows of a hand-written loop and a consistent trace"""
+        for init in ({}, {'deferred': True, 'preserve_index': False}, {'engine': 'numpy'}):
+            for method in ('iqr', 'zscore', 'modified_zscore'):
+                for column in ('a', 'b'):
+                    cleaner = StatClean(self.df, **init)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        getattr(cleaner, f'remove_outliers_{method}')(column, iterate=True)
+                    pd.testing.assert_frame_equal(cleaner.clean_df, self.manual_loop(method, column, **init))
+                    info = cleaner.outlier_info[column]
+                    trace = info['iterations']
+                    self.assertTrue(info['converged'])
+                    self.assertEqual(trace[-1]['num_outliers'], 0)
+                    self.assertEqual(info['num_outliers'], sum(step['num_outliers'] for step in trace))
+                    self.assertEqual([step['rows'] for step in trace[1:]],
+                                     [step['rows'] - step['num_outliers'] for step in trace[:-1]])
+
+        single = StatClean(self.df).remove_outliers_zscore('a').clean_df
+        limited = StatClean(self.df).remove_outliers_zscore('a', iterate=True, max_iterations=1)
+        pd.testing.assert_frame_equal(limited.clean_df, single)
+        self.assertFalse(limited.outlier_info['a']['converged'])
+
+    def test_clean_columns_and_incremental(self):
+        """clean_columns reports iterations; incremental and parallel runs agree"""
+        results = []
+        for init, n_jobs in (({}, None), ({'incremental': True}, None), ({'incremental': True}, 3)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                cleaned, summary = StatClean(self.df, **init).clean_columns(
+                    columns=['a', 'b'], method='modified_zscore', show_progress=False,
+                    iterate=True, n_jobs=n_jobs)
+            results.append(cleaned)
+            self.assertIn('Iterations', summary.columns)
+            self.assertTrue((summary['Iterations'] >= 2).all())
+        pd.testing.assert_frame_equal(results[0], results[1])
+        pd.testing.assert_frame_equal(results[0], results[2])
+
+    def test_zero_mad_warning(self):
+        """Only a degenerate MAD warns when nothing is removed"""
+        clean = pd.DataFrame({'x': np.random.default_rng(3).normal(size=200)})
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                StatClean(clean).remove_outliers_modified_zscore('x', iterate=True)
+        self.assertEqual(output.getvalue(), '')
+        with self.assertWarns(UserWarning):
+            StatClean(pd.DataFrame({'x': np.ones(50)})).remove_outliers_modified_zscore('x', iterate=True)
+
+    def test_invalid_options(self):
+        """Grouped, approximate and non-positive iteration limits are rejected"""
+        cleaner = StatClean(self.df)
+        with self.assertRaises(ValueError):
+            cleaner.remove_outliers_zscore('a', by='g', iterate=True)
+        with self.assertRaises(ValueError):
+            cleaner.remove_outliers_iqr('a', approximate=True, iterate=True)
+        with self.assertRaises(ValueError):
+            cleaner.remove_outliers_iqr('a', iterate=True, max_iterations=0)
+
+
+class TestRobustMahalanobis(unittest.TestCase):
+    """Test the FastMCD robust covariance option of the Mahalanobis methods"""
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        covariance = [[1.0, 0.8, 0.3], [0.8, 1.0, 0.2], [0.3, 0.2, 1.0]]
+        values = rng.multivariate_normal(np.zeros(3), covariance, size=4000)
+        # A tight cluster of 15% of the rows that masks itself under the sample covariance
+        values[:600] = rng.normal(loc=[3.0, -3.0, 2.0], scale=0.3, size=(600, 3))
+        self.df = pd.DataFrame(values, columns=['a', 'b', 'c'])
+        self.df.loc[700, 'b'] = np.nan
+
+    def test_detects_masked_cluster(self):
+        """The robust estimate flags the cluster the sample covariance absorbs"""
+        classic = StatClean(self.df).detect_outliers_mahalanobis()
+        robust = StatClean(self.df).detect_outliers_mahalanobis(robust=True)
+        self.assertLess(classic[:600].mean(), 0.1)
+        self.assertTrue(robust[:600].all())
+        self.assertFalse(robust[700])
+        # Consistent at the normal distribution: about 2.5% of clean rows beyond the 97.5% quantile
+        self.assertAlmostEqual(robust[600:].mean(), 0.025, delta=0.01)
+
+        large = pd.DataFrame(np.random.default_rng(2).normal(size=(200_000, 4)), columns=list('wxyz'))
+        self.assertAlmostEqual(StatClean(large).detect_outliers_mahalanobis(robust=True).mean(), 0.025, delta=0.002)
+
+    def test_removal_and_plan(self):
+        """Removal is reproducible, recorded and reproduced by fitted plans"""
+        first = StatClean(self.df).remove_outliers_mahalanobis(robust=True)
+        second = StatClean(self.df).remove_outliers_mahalanobis(robust=True)
+        pd.testing.assert_frame_equal(first.clean_df, second.clean_df)
+        self.assertTrue(first.outlier_info['multivariate_a']['robust'])
+
+        plan = StatClean(self.df).fit_plan([{'method': 'remove_outliers_mahalanobis', 'robust': True}])
+        pd.testing.assert_frame_equal(plan.transform(self.df), first.clean_df)
+
+        with self.assertRaises(ValueError):
+            StatClean(self.df).detect_outliers_mahalanobis(robust=True, use_shrinkage=True)
+
+
+class TestImportTime(unittest.TestCase):
+    """Import-time regression tests: plotting and progress libraries stay off the import path"""
+
+    # Seconds for importing statclean itself once numpy, pandas and scipy are loaded
+    IMPORT_BUDGET_SECONDS = 1.0
+
+    def run_script(self, script):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                env=env, cwd=root, check=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_import_is_light(self):
+        """import statclean loads no matplotlib, seaborn or tqdm and stays within budget"""
+        result = self.run_script(
+            "import json, sys, time\n"
+            "import numpy, pandas, scipy.stats, scipy.linalg, scipy.special\n"
+            "start = time.perf_counter()\n"
+            "import statclean\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('matplotlib', 'seaborn', 'tqdm') if m in sys.modules]\n"
+            "print(json.dumps({'seconds': elapsed, 'heavy': heavy}))\n")
+        self.assertEqual(result['heavy'], [])
+        self.assertLess(result['seconds'], self.IMPORT_BUDGET_SECONDS)
+
+    def test_plan_load_without_plotting(self):
+        """Loading a saved plan and scoring a record do not import the plotting libraries"""
+        df = pd.DataFrame({'a': np.arange(100.0), 'b': np.arange(100.0) ** 0.5})
+        with tempfile.TemporaryDirectory() as tmp:
+            CleaningPlan.fit(df, [{'method': 'remove_outliers_iqr', 'column': 'a'},
+                                  {'method': 'winsorize_outliers_zscore', 'column': 'b'}]).save(tmp)
+            result = self.run_script(
+                "import json, sys\n"
+                "from statclean import CleaningPlan\n"
+                f"plan = CleaningPlan.load({tmp!r})\n"
+                "flagged = plan.scorer().is_outlier({'a': 1e6, 'b': 1.0})\n"
+                "heavy = [m for m in ('matplotlib', 'seaborn') if m in sys.modules]\n"
+                "print(json.dumps({'flagged': flagged, 'heavy': heavy}))\n")
+        self.assertEqual(result, {'flagged': True, 'heavy': []})
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file